@@ -0,0 +1,137 @@
+"""영화/리뷰 일괄 등록 처리량 벤치마크 (rows/sec)
+
+백엔드 디렉토리에서 실행:
+    python -m benchmarks.bulk_import --movies 2000 --reviews 10000 --chunk-size 500
+
+행마다 create()를 호출하는 기존 방식(행마다 중복 확인 + commit)과
+bulk_create()로 청크 단위 처리하는 방식의 처리량을 비교한다.
+감정 분석은 모델 로드 시간을 빼기 위해 결정적 stub 파이프라인을 사용한다. (--real-model로 실제 모델 사용)
+"""
+import argparse
+import asyncio
+import sys
+import time
+
+from benchmarks.common import install_stub_pipeline, temp_database
+from schemas.movie import MovieCreate
+from schemas.review import ReviewCreate
+from sentiment.batcher import sentiment_batcher
+from sentiment.cache import sentiment_cache
+from services.movie_service import MovieService
+from services.review_service import ReviewService
+from utils.bulk_import import BulkImportReport
+
+
+def movie_rows(count: int, prefix: str, empty_genres_every: int = 0) -> list[dict]:
+    """empty_genres_every > 0 이면 N행마다 장르를 빈 CSV 칸처럼 None으로 둔다"""
+    return [
+        {
+            "title": f"{prefix} 영화 {i}",
+            "director": f"감독 {i % 300}",
+            "release_date": f"{1990 + i % 30}-01-{1 + i % 28:02d}",
+            "genres": (
+                None if empty_genres_every and i % empty_genres_every == 0
+                else [{"genre": f"장르{i % 12}"}, {"genre": f"장르{(i + 5) % 12}"}]
+            ),
+        }
+        for i in range(count)
+    ]
+
+
+def review_rows(count: int, movie_ids: list[int], prefix: str) -> list[dict]:
+    return [
+        {
+            "movie_id": movie_ids[i % len(movie_ids)],
+            "reviewer_name": f"{prefix}-리뷰어{i}",
+            "content": f"리뷰 내용 {i} {'재밌어요' if i % 3 else '지루했어요'}",
+        }
+        for i in range(count)
+    ]
+
+
+async def per_row(session_factory, rows: list[dict], kind: str) -> float:
+    start = time.perf_counter()
+    async with session_factory() as db:
+        movie_service = MovieService(db)
+        review_service = ReviewService(db, movie_service)
+        for row in rows:
+            if kind == "movie":
+                await movie_service.create(MovieCreate(**row))
+            else:
+                await review_service.create(ReviewCreate(**row))
+    return time.perf_counter() - start
+
+
+async def bulk(session_factory, rows: list[dict], kind: str, chunk_size: int) -> tuple[float, BulkImportReport]:
+    report = BulkImportReport()
+    start = time.perf_counter()
+    async with session_factory() as db:
+        movie_service = MovieService(db)
+        review_service = ReviewService(db, movie_service)
+        numbered = list(enumerate(rows, start=1))
+        report.total = len(numbered)
+        for i in range(0, len(numbered), chunk_size):
+            chunk = numbered[i:i + chunk_size]
+            if kind == "movie":
+                await movie_service.bulk_create(chunk, report)
+            else:
+                await review_service.bulk_create(chunk, report)
+    return time.perf_counter() - start, report
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="일괄 등록 처리량 벤치마크")
+    parser.add_argument("--movies", type=int, default=2000)
+    parser.add_argument("--reviews", type=int, default=10000)
+    parser.add_argument("--per-row-limit", type=int, default=1000, help="행 단위 방식으로 등록할 최대 행 수 (느리므로 제한)")
+    parser.add_argument("--chunk-size", type=int, default=500)
+    parser.add_argument("--real-model", action="store_true", help="stub 대신 실제 감정 분석 모델 사용")
+    args = parser.parse_args()
+
+    if not args.real_model:
+        install_stub_pipeline()
+    sentiment_cache.max_size = 0  # 캐시 적중으로 결과가 왜곡되지 않도록
+    sentiment_batcher.start()
+
+    try:
+        async with temp_database(profile="performance") as session_factory:
+            results, reports = [], []
+
+            rows = movie_rows(min(args.movies, args.per_row_limit), "row")
+            elapsed = await per_row(session_factory, rows, "movie")
+            results.append(("movie", "per-row", len(rows), elapsed))
+
+            # 10행마다 장르 칸이 비어 있는 행 포함 (CSV의 빈 칸은 None으로 읽힘)
+            rows = movie_rows(args.movies, "bulk", empty_genres_every=10)
+            elapsed, report = await bulk(session_factory, rows, "movie", args.chunk_size)
+            results.append(("movie", "bulk", report.created, elapsed))
+            reports.append(("movie", report))
+
+            async with session_factory() as db:
+                movie_ids = (await MovieService(db).find_all())[0]
+                movie_ids = [m.id for m in movie_ids] or [1]
+
+            rows = review_rows(min(args.reviews, args.per_row_limit), movie_ids, "row")
+            elapsed = await per_row(session_factory, rows, "review")
+            results.append(("review", "per-row", len(rows), elapsed))
+
+            rows = review_rows(args.reviews, movie_ids, "bulk")
+            elapsed, report = await bulk(session_factory, rows, "review", args.chunk_size)
+            results.append(("review", "bulk", report.created, elapsed))
+            reports.append(("review", report))
+    finally:
+        await sentiment_batcher.stop()
+
+    for kind, mode, count, elapsed in results:
+        print(f"{kind:<7} {mode:<8} rows={count:>7} time={elapsed:8.2f}s rows/sec={count / elapsed:10.1f}")
+
+    # 입력은 모두 유효한 행이므로 실패한 행이 있으면 오류
+    failed = [(kind, report) for kind, report in reports if report.failed]
+    for kind, report in failed:
+        print(f"❌ {kind} 일괄 등록 실패 {report.failed}건: {report.errors[:5]}")
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,151 @@
+"""벤치마크 공통 도구: 임시 DB 생성, 합성 데이터 적재, 시간 측정"""
+import os
+import random
+import shutil
+import statistics
+import tempfile
+import time
+import zlib
+from contextlib import asynccontextmanager
+from datetime import date, datetime, timedelta, timezone
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import sessionmaker
+
+from model.database import Base, build_engine
+from model.models import Genre, Movie, Review, movie_genre_table
+from model.search import create_search_tables
+from utils.enums.sentiment_enum import SentimentEnum
+
+
+SENTIMENTS = [s.value for s in SentimentEnum]
+SEED_CHUNK = 10000
+
+
+@asynccontextmanager
+async def temp_database(path: str | None = None, profile: str = "default"):
+    """임시 DB에 스키마를 만들고 세션 팩토리 반환 (종료 시 삭제)
+
+    BENCH_DATABASE_URL이 지정되면 (예: 로컬 PostgreSQL) 그 DB에 테이블을 만들고 끝나면 삭제한다.
+    """
+    url = os.getenv("BENCH_DATABASE_URL")
+    tmpdir = None
+    if url is None:
+        if path is None:
+            tmpdir = tempfile.mkdtemp(prefix="movie-bench-")
+            path = os.path.join(tmpdir, "bench.db")
+        url = f"sqlite+aiosqlite:///{path}"
+
+    engine = build_engine(url, profile=profile, echo=False)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(create_search_tables)
+    session_factory = sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+    try:
+        yield session_factory
+    finally:
+        if tmpdir is None and path is None:
+            async with engine.begin() as conn:
+                await conn.run_sync(Base.metadata.drop_all)
+        await engine.dispose()
+        if tmpdir:
+            shutil.rmtree(tmpdir, ignore_errors=True)
+
+
+async def seed_movies(db: AsyncSession, count: int, genres: int = 10, deleted_ratio: float = 0.0, seed: int = 42) -> list[int]:
+    """합성 영화/장르 적재 후 영화 id 목록 반환"""
+    rng = random.Random(seed)
+    now = datetime.now(timezone.utc)
+    await db.execute(insert(Genre), [{"genre": f"장르{i}", "created_at": now, "updated_at": now} for i in range(genres)])
+
+    rows = []
+    for i in range(count):
+        rows.append({
+            "title": f"영화 {i}",
+            "director": f"감독 {i % 500}",
+            "release_date": date(1990, 1, 1) + timedelta(days=rng.randrange(12000)),
+            "poster": f"movies/{i}.jpg",
+            "created_at": now,
+            "updated_at": now,
+            "deleted_at": now if rng.random() < deleted_ratio else None,
+        })
+    for start in range(0, len(rows), SEED_CHUNK):
+        await db.execute(insert(Movie), rows[start:start + SEED_CHUNK])
+
+    movie_ids = list(range(1, count + 1))
+    links = [{"movie_id": m, "genre_id": g} for m in movie_ids for g in rng.sample(range(1, genres + 1), k=min(2, genres))]
+    for start in range(0, len(links), SEED_CHUNK):
+        await db.execute(insert(movie_genre_table), links[start:start + SEED_CHUNK])
+    await db.commit()
+    return movie_ids
+
+
+async def seed_reviews(db: AsyncSession, movie_ids: list[int], count: int, deleted_ratio: float = 0.0, seed: int = 42):
+    """합성 리뷰 적재 (sentiment/score 무작위, created_at은 최근 1년에 분포)"""
+    rng = random.Random(seed)
+    now = datetime.now(timezone.utc)
+    for start in range(0, count, SEED_CHUNK):
+        rows = []
+        for i in range(start, min(start + SEED_CHUNK, count)):
+            created_at = now - timedelta(seconds=rng.randrange(365 * 24 * 3600))
+            rows.append({
+                "movie_id": rng.choice(movie_ids),
+                "reviewer_name": f"리뷰어{i}",
+                "content": f"리뷰 내용 {i}",
+                "sentiment": rng.choice(SENTIMENTS),
+                "score": rng.random(),
+                "created_at": created_at,
+                "updated_at": created_at,
+                "deleted_at": now if rng.random() < deleted_ratio else None,
+            })
+        await db.execute(insert(Review), rows)
+    await db.commit()
+
+
+async def measure(fn, repeat: int = 5) -> dict:
+    """비동기 함수 fn을 repeat번 실행한 시간 통계 (ms)"""
+    samples = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = await fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return {
+        "median_ms": round(statistics.median(samples), 3),
+        "min_ms": round(min(samples), 3),
+        "max_ms": round(max(samples), 3),
+        "result": result,
+    }
+
+
+class StubSentimentPipeline:
+    """모델 없이 쓰는 결정적 감정 분석 파이프라인 (텍스트 해시로 라벨/점수 결정)"""
+    LABELS = ["Very Negative", "Negative", "Neutral", "Positive", "Very Positive"]
+
+    def __call__(self, texts, batch_size: int = 16, **kwargs):
+        if isinstance(texts, str):
+            texts = [texts]
+        results = []
+        for text in texts:
+            h = zlib.crc32(text.encode("utf-8"))
+            results.append({"label": self.LABELS[h % len(self.LABELS)], "score": 0.5 + (h % 500) / 1000})
+        return results
+
+
+def install_stub_pipeline():
+    """sentiment.analyzer가 실제 모델 대신 StubSentimentPipeline을 쓰도록 설정"""
+    import sentiment.analyzer as analyzer
+    analyzer._sentiment_pipeline = StubSentimentPipeline()
+
+
+def percentiles(samples: list[float]) -> dict:
+    """지연 시간 샘플(ms)의 p50/p95/p99"""
+    if not samples:
+        return {"p50_ms": None, "p95_ms": None, "p99_ms": None}
+    ordered = sorted(samples)
+
+    def pick(q):
+        return round(ordered[min(len(ordered) - 1, int(q * len(ordered)))], 3)
+
+    return {"p50_ms": pick(0.50), "p95_ms": pick(0.95), "p99_ms": pick(0.99)}
@@ -0,0 +1,77 @@
+"""soft delete 행 압축 전후 목록 조회 지연 시간 벤치마크
+
+백엔드 디렉토리에서 실행:
+    python -m benchmarks.compaction --movies 50000 --reviews 500000 --deleted-ratio 0.5
+
+영화/리뷰의 절반(--deleted-ratio)이 soft delete 된 상태에서 목록 쿼리 (전체 개수 포함) 를 측정하고,
+CompactionService로 삭제된 행을 보관 테이블로 옮긴 뒤 같은 쿼리를 다시 측정한다.
+"""
+import argparse
+import asyncio
+import os
+import time
+
+from sqlalchemy import text
+
+from benchmarks.common import measure, seed_movies, seed_reviews, temp_database
+from schemas.pagination import Pagination
+from services.compaction_service import CompactionService
+from services.movie_service import MovieService
+from services.review_service import ReviewService
+
+
+async def list_queries(session_factory, repeat: int) -> dict:
+    results = {}
+    async with session_factory() as db:
+        await db.execute(text("ANALYZE"))
+        movie_service = MovieService(db)
+        review_service = ReviewService(db, movie_service)
+        page = lambda number: Pagination(page=number, page_size=20)
+        live_movie = (await movie_service.find_all(page(1)))[0][0].id
+
+        results["movies p1"] = await measure(lambda: movie_service.find_all(page(1)), repeat)
+        results["movies p200"] = await measure(lambda: movie_service.find_all(page(200)), repeat)
+        results["reviews p1"] = await measure(lambda: review_service.find_all(page(1)), repeat)
+        results["reviews p200"] = await measure(lambda: review_service.find_all(page(200)), repeat)
+        results["reviews by movie"] = await measure(lambda: review_service.find_all(page(1), live_movie), repeat)
+    return results
+
+
+def db_size(path: str) -> float:
+    return sum(os.path.getsize(p) for p in (path, path + "-wal") if os.path.exists(p)) / 1024 / 1024
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="soft delete 행 압축 전후 목록 조회 벤치마크")
+    parser.add_argument("--movies", type=int, default=50_000)
+    parser.add_argument("--reviews", type=int, default=500_000)
+    parser.add_argument("--deleted-ratio", type=float, default=0.5)
+    parser.add_argument("--batch-size", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    async with temp_database(profile="performance") as session_factory:
+        async with session_factory() as db:
+            movie_ids = await seed_movies(db, args.movies, deleted_ratio=args.deleted_ratio)
+            await seed_reviews(db, movie_ids, args.reviews, deleted_ratio=args.deleted_ratio)
+        path = session_factory.kw["bind"].url.database
+
+        before = await list_queries(session_factory, args.repeat)
+        size_before = db_size(path)
+
+        start = time.perf_counter()
+        async with session_factory() as db:
+            moved = await CompactionService(db).compact(older_than_days=0, batch_size=args.batch_size)
+        elapsed = time.perf_counter() - start
+        print(f"압축: {moved} ({elapsed:.2f}s)")
+
+        after = await list_queries(session_factory, args.repeat)
+        print(f"DB 크기 (보관 테이블 포함) {size_before:.1f}MB → {db_size(path):.1f}MB\n")
+
+        for name in before:
+            b, a = before[name]["median_ms"], after[name]["median_ms"]
+            print(f"{name:<18} before={b:>9}ms after={a:>9}ms ({(a - b) / b * 100:+.1f}%)")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,107 @@
+"""SQLite 연결 프로파일별 동시 읽기/쓰기 벤치마크
+
+백엔드 디렉토리에서 실행:
+    python -m benchmarks.db_concurrency --readers 8 --writers 2 --seconds 10
+
+리뷰 쓰기(INSERT + 집계 갱신 + COMMIT)가 계속되는 동안 여러 읽기 작업이
+리뷰 목록을 조회할 때의 지연 시간과 'database is locked' 오류 수를
+default(롤백 저널) / performance(WAL) 프로파일로 비교한다.
+"""
+import argparse
+import asyncio
+import itertools
+import time
+
+from sqlalchemy.exc import OperationalError
+
+from benchmarks.common import percentiles, seed_movies, seed_reviews, temp_database
+from model.models import Review
+from schemas.pagination import Pagination
+from services.movie_service import MovieService
+from services.review_service import ReviewService
+from services.review_stats_service import ReviewStatsService
+
+
+async def reader(session_factory, movie_ids, stop: asyncio.Event, latencies: list, errors: list):
+    for movie_id in itertools.cycle(movie_ids[:50]):
+        if stop.is_set():
+            return
+        start = time.perf_counter()
+        try:
+            async with session_factory() as db:
+                await ReviewService(db, MovieService(db)).find_all(Pagination(page=1, page_size=20), movie_id)
+            latencies.append((time.perf_counter() - start) * 1000)
+        except OperationalError as e:
+            errors.append(str(e.orig))
+
+
+async def writer(session_factory, movie_ids, stop: asyncio.Event, worker_id: int, latencies: list, errors: list):
+    for i in itertools.count():
+        if stop.is_set():
+            return
+        start = time.perf_counter()
+        try:
+            async with session_factory() as db:
+                review = Review(
+                    movie_id=movie_ids[i % len(movie_ids)],
+                    reviewer_name=f"writer{worker_id}-{i}",
+                    content="벤치마크 리뷰",
+                    sentiment="POSITIVE",
+                    score=0.9,
+                )
+                db.add(review)
+                await ReviewStatsService(db).add([(review.movie_id, review.sentiment, review.score, None)])
+                await db.commit()
+            latencies.append((time.perf_counter() - start) * 1000)
+        except OperationalError as e:
+            errors.append(str(e.orig))
+
+
+async def run(profile: str, args) -> dict:
+    async with temp_database(profile=profile) as session_factory:
+        async with session_factory() as db:
+            movie_ids = await seed_movies(db, args.movies)
+            await seed_reviews(db, movie_ids, args.reviews)
+            await ReviewStatsService(db).rebuild()
+
+        stop = asyncio.Event()
+        read_latencies, write_latencies, read_errors, write_errors = [], [], [], []
+        tasks = [asyncio.create_task(reader(session_factory, movie_ids, stop, read_latencies, read_errors)) for _ in range(args.readers)]
+        tasks += [asyncio.create_task(writer(session_factory, movie_ids, stop, w, write_latencies, write_errors)) for w in range(args.writers)]
+
+        await asyncio.sleep(args.seconds)
+        stop.set()
+        await asyncio.gather(*tasks)
+
+        return {
+            "profile": profile,
+            "reads_per_sec": round(len(read_latencies) / args.seconds, 1),
+            "writes_per_sec": round(len(write_latencies) / args.seconds, 1),
+            "read": percentiles(read_latencies),
+            "write": percentiles(write_latencies),
+            "read_errors": len(read_errors),
+            "write_errors": len(write_errors),
+        }
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="SQLite 프로파일별 동시성 벤치마크")
+    parser.add_argument("--profiles", nargs="+", default=["default", "performance"])
+    parser.add_argument("--readers", type=int, default=8)
+    parser.add_argument("--writers", type=int, default=2)
+    parser.add_argument("--seconds", type=float, default=10)
+    parser.add_argument("--movies", type=int, default=500)
+    parser.add_argument("--reviews", type=int, default=50_000)
+    args = parser.parse_args()
+
+    for profile in args.profiles:
+        r = await run(profile, args)
+        print(
+            f"{r['profile']:<12} reads/s={r['reads_per_sec']:>8} writes/s={r['writes_per_sec']:>7} "
+            f"read p50/p95/p99={r['read']['p50_ms']}/{r['read']['p95_ms']}/{r['read']['p99_ms']}ms "
+            f"write p95={r['write']['p95_ms']}ms errors(read/write)={r['read_errors']}/{r['write_errors']}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
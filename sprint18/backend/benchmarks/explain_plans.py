@@ -0,0 +1,140 @@
+"""서비스 쿼리의 EXPLAIN QUERY PLAN 회귀 검사
+
+백엔드 디렉토리에서 실행:
+    python -m benchmarks.explain_plans
+
+합성 데이터를 넣은 임시 SQLite DB에서 MovieService / ReviewService / 감정 분석 워커의
+읽기 경로를 실제로 실행하며 SQL을 수집하고, 각 쿼리의 실행 계획에
+인덱스 없는 테이블 스캔(SCAN <table>)이나 정렬용 임시 B-TREE가 있으면 종료 코드 1로 실패한다.
+BENCH_DATABASE_URL로 PostgreSQL을 지정하면 EXPLAIN 결과의 Seq Scan / Sort 노드를 같은 기준으로 검사한다.
+(작은 테이블에서는 비용상 Seq Scan을 고르므로 enable_seqscan / enable_sort 를 끄고, 그래도 남으면 쓸 인덱스가 없는 것)
+"""
+import asyncio
+import re
+from contextlib import contextmanager
+
+from fastapi import HTTPException
+from sqlalchemy import event, text
+
+from benchmarks.common import seed_movies, seed_reviews, temp_database
+from model.database import _create_missing_indexes
+from schemas.movie import MovieCreate
+from schemas.pagination import Pagination
+from schemas.review import ReviewCreate
+from sentiment.worker import pending_reviews_query
+from services.movie_service import MovieService
+from services.review_service import ReviewService
+
+
+# 검사 대상 테이블 (집계 테이블 등은 PK 조회만 하므로 제외)
+CHECKED_TABLES = ("movie", "review")
+TABLE_SCAN = re.compile(r"^SCAN (\w+)(?! USING)")
+PG_TABLE_SCAN = re.compile(r"Seq Scan on (\w+)")
+PG_SORT = re.compile(r"^(->\s*)?(Incremental )?Sort\b")
+
+
+def explain_sql(dialect: str, statement: str) -> str:
+    if dialect == "postgresql":
+        return f"EXPLAIN {statement}"
+    return f"EXPLAIN QUERY PLAN {statement}"
+
+
+def plan_problems(dialect: str, details: list[str]) -> list[str]:
+    """실행 계획에서 검사 대상 테이블 스캔 / 임시 정렬 찾기"""
+    if dialect == "postgresql":
+        return [
+            d for d in details
+            if (m := PG_TABLE_SCAN.search(d)) and m.group(1) in CHECKED_TABLES
+            or PG_SORT.match(d.strip())
+        ]
+    return [
+        d for d in details
+        if (m := TABLE_SCAN.match(d)) and m.group(1) in CHECKED_TABLES
+        or d.startswith("USE TEMP B-TREE FOR ORDER BY")
+    ]
+
+
+@contextmanager
+def capture_sql(engine):
+    """실행된 SELECT 문과 파라미터 수집"""
+    statements = []
+
+    def before_execute(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT") and not executemany:
+            statements.append((statement, parameters))
+
+    event.listen(engine.sync_engine, "before_cursor_execute", before_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", before_execute)
+
+
+async def run_service_paths(db):
+    """검사할 서비스 경로 실행"""
+    movie_service = MovieService(db)
+    review_service = ReviewService(db, movie_service)
+
+    movies, pagination = await movie_service.find_all(Pagination(page=3, page_size=10))
+    await movie_service.find_all(Pagination(page_size=10, after=pagination.next_cursor))
+    await movie_service.find_one(movies[0].id)
+
+    reviews, _, pagination = await review_service.find_all(Pagination(page=3, page_size=10))
+    await review_service.find_all(Pagination(page_size=10, after=pagination.next_cursor))
+    _, _, pagination = await review_service.find_all(Pagination(page=2, page_size=10), movie_id=reviews[0].movie_id)
+    await review_service.find_all(Pagination(page_size=10, after=pagination.next_cursor), movie_id=reviews[0].movie_id)
+
+    # 중복 확인 경로 (이미 있는 영화/리뷰 → 400)
+    movie = movies[0]
+    for create in (
+        lambda: movie_service.create(MovieCreate(title=movie.title, director=movie.director, release_date=movie.release_date, genres=[])),
+        lambda: review_service.create(ReviewCreate(movie_id=reviews[0].movie_id, reviewer_name=reviews[0].reviewer_name, content="중복")),
+    ):
+        try:
+            await create()
+        except HTTPException:
+            pass
+
+    # 분석 대기 리뷰 조회 (deferred 모드 워커)
+    await db.execute(pending_reviews_query(64))
+
+
+async def main():
+    failures = 0
+    async with temp_database() as session_factory:
+        engine = session_factory.kw["bind"]
+        async with engine.begin() as conn:
+            await conn.run_sync(_create_missing_indexes)
+
+        async with session_factory() as db:
+            movie_ids = await seed_movies(db, 2000, deleted_ratio=0.2)
+            await seed_reviews(db, movie_ids, 20000, deleted_ratio=0.2)
+            await db.execute(text("ANALYZE"))
+            await db.commit()
+
+        dialect = engine.dialect.name
+        async with session_factory() as db:
+            with capture_sql(engine) as statements:
+                await run_service_paths(db)
+
+            raw = await db.connection()
+            if dialect == "postgresql":
+                await raw.exec_driver_sql("SET enable_seqscan = off")
+                await raw.exec_driver_sql("SET enable_sort = off")
+            for statement, parameters in statements:
+                rows = await raw.exec_driver_sql(explain_sql(dialect, statement), tuple(parameters))
+                details = [row[-1] for row in rows.all()]
+
+                problems = plan_problems(dialect, details)
+                status = "❌" if problems else "✅"
+                failures += bool(problems)
+                print(f"{status} {' '.join(statement.split())[:110]}")
+                for d in details:
+                    print(f"      {d}")
+
+    print(f"\n{failures}개 쿼리에서 테이블 스캔/임시 정렬 발견" if failures else "\n모든 쿼리가 인덱스를 사용합니다.")
+    raise SystemExit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
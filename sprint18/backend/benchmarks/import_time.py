@@ -0,0 +1,65 @@
+"""`import main` 시간 예산 검사
+
+백엔드 디렉토리에서 실행:
+    python -m benchmarks.import_time --budget 1.5
+
+새 인터프리터에서 `import main`을 여러 번 측정해 최소값이 예산을 넘거나
+torch / transformers 같은 무거운 모듈이 import 시점에 로드되면 종료 코드 1로 실패한다.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# import 시점에 로드되면 안 되는 모듈
+HEAVY_MODULES = ["torch", "transformers", "onnxruntime"]
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import main
+elapsed = time.perf_counter() - start
+print(json.dumps({
+    "seconds": elapsed,
+    "heavy_modules": [m for m in %r if m in sys.modules],
+}))
+""" % (HEAVY_MODULES,)
+
+
+def measure(runs: int) -> list[dict]:
+    """새 프로세스에서 import main 시간 측정"""
+    results = []
+    for _ in range(runs):
+        out = subprocess.run(
+            [sys.executable, "-c", PROBE],
+            cwd=BACKEND_DIR, capture_output=True, text=True, check=True,
+        )
+        results.append(json.loads(out.stdout.strip().splitlines()[-1]))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="import main 시간 예산 검사")
+    parser.add_argument("--budget", type=float, default=float(os.getenv("IMPORT_BUDGET_SECONDS", "1.5")), help="허용 시간(초)")
+    parser.add_argument("--runs", type=int, default=3, help="측정 횟수 (최소값 사용)")
+    args = parser.parse_args()
+
+    results = measure(args.runs)
+    best = min(r["seconds"] for r in results)
+    heavy = sorted({m for r in results for m in r["heavy_modules"]})
+
+    print(f"import main: {best:.3f}s (예산 {args.budget:.3f}s, {args.runs}회 중 최소)")
+    if heavy:
+        print(f"❌ import 시점에 무거운 모듈이 로드됨: {', '.join(heavy)}")
+    if best > args.budget:
+        print("❌ import 시간 예산 초과")
+
+    sys.exit(1 if heavy or best > args.budget else 0)
+
+
+if __name__ == "__main__":
+    main()
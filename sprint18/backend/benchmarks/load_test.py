@@ -0,0 +1,225 @@
+"""API 부하 테스트: 엔드포인트별 p50/p95/p99 지연 시간과 처리량
+
+백엔드 디렉토리에서 실행:
+    python -m benchmarks.load_test --movies 2000 --reviews 50000 --concurrency 16 --duration 10 \
+        --output benchmarks/results/load_test.json
+
+기본은 임시 SQLite DB에 합성 영화/장르/리뷰를 적재하고, 감정 분석 모델은 결정적 stub으로 바꾼 뒤
+앱을 프로세스 안에서 (httpx ASGITransport) 동시 asyncio 클라이언트로 호출한다.
+--base-url을 주면 이미 실행 중인 서버에 요청을 보낸다. (적재는 하지 않음)
+
+결과는 JSON으로 저장되며, --baseline 으로 이전 결과 파일을 주면 p95 / 처리량 변화를 함께 출력한다.
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import platform
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+
+import httpx
+
+# 주의: model.database는 import 시점에 DATABASE_URL로 엔진을 만들므로
+# 앱 / benchmarks.common 모듈은 임시 DB 경로를 지정한 뒤 함수 안에서 import 한다.
+
+
+def scenarios(movie_ids: list[int], rng: random.Random, run_id: str):
+    """엔드포인트별 요청 생성기: 이름 → (method, url, params, json) 을 만드는 함수"""
+    counter = itertools.count()
+    return {
+        "GET /movies": lambda: ("GET", "/movies", {"page": rng.randint(1, 20), "page_size": 20}, None),
+        "GET /movies/genres": lambda: ("GET", "/movies/genres", None, None),
+        "GET /movies/{id}": lambda: ("GET", f"/movies/{rng.choice(movie_ids)}", None, None),
+        "GET /reviews?movie_id=": lambda: ("GET", "/reviews", {"movie_id": rng.choice(movie_ids), "page_size": 20}, None),
+        "POST /reviews": lambda: ("POST", "/reviews", None, {
+            "movie_id": rng.choice(movie_ids),
+            "reviewer_name": f"load-{run_id}-{next(counter)}",
+            "content": rng.choice(["정말 재미있어요!", "지루했어요", "그냥 그랬어요", "배우 연기가 최고", "돈이 아까워요"]),
+        }),
+        "POST /movies": lambda: ("POST", "/movies", None, {
+            "title": f"부하 테스트 영화 {run_id}-{next(counter)}",
+            "director": f"감독 {rng.randint(1, 300)}",
+            "release_date": f"{rng.randint(1990, 2024)}-01-01",
+            "genres": [{"genre": f"장르{rng.randint(0, 9)}"}],
+        }),
+    }
+
+
+async def run_scenario(client: httpx.AsyncClient, make_request, concurrency: int, duration: float, max_requests: int | None):
+    from benchmarks.common import percentiles
+
+    latencies, statuses = [], {}
+    stop_at = time.perf_counter() + duration
+    sent = itertools.count()
+
+    async def worker():
+        while time.perf_counter() < stop_at:
+            if max_requests is not None and next(sent) >= max_requests:
+                return
+            method, url, params, body = make_request()
+            start = time.perf_counter()
+            try:
+                response = await client.request(method, url, params=params, json=body)
+                status = response.status_code
+            except httpx.HTTPError as e:
+                status = e.__class__.__name__
+            latencies.append((time.perf_counter() - start) * 1000)
+            statuses[status] = statuses.get(status, 0) + 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    errors = sum(count for status, count in statuses.items() if not (isinstance(status, int) and status < 400))
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "statuses": {str(k): v for k, v in statuses.items()},
+        "throughput_rps": round(len(latencies) / elapsed, 1) if elapsed else None,
+        **percentiles(latencies),
+        "mean_ms": round(sum(latencies) / len(latencies), 3) if latencies else None,
+    }
+
+
+async def seed(db_path: str, args):
+    """임시 DB에 합성 데이터 적재 (앱 import 전에 DATABASE_URL을 이 파일로 지정해야 함)"""
+    from benchmarks.common import seed_movies, seed_reviews, temp_database
+
+    async with temp_database(path=db_path, profile="performance") as session_factory:
+        async with session_factory() as db:
+            movie_ids = await seed_movies(db, args.movies, genres=args.genres, seed=args.seed)
+            await seed_reviews(db, movie_ids, args.reviews, seed=args.seed)
+    return movie_ids
+
+
+async def fetch_movie_ids(client: httpx.AsyncClient) -> list[int]:
+    response = await client.get("/movies", params={"page_size": 100, "count": "none"})
+    response.raise_for_status()
+    return [movie["id"] for movie in response.json()["data"]] or [1]
+
+
+def git_commit() -> str | None:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], text=True, stderr=subprocess.DEVNULL).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def run(args) -> dict:
+    rng = random.Random(args.seed)
+    run_id = f"{int(time.time())}"
+    results = {}
+
+    async def drive(client):
+        movie_ids = await fetch_movie_ids(client)
+        makers = scenarios(movie_ids, rng, run_id)
+        selected = args.endpoints or list(makers)
+        for name in selected:
+            # 워밍업 (연결 / 캐시 / 지연 로딩)
+            await run_scenario(client, makers[name], min(args.concurrency, 4), duration=1, max_requests=args.warmup)
+            results[name] = await run_scenario(client, makers[name], args.concurrency, args.duration, args.requests)
+            r = results[name]
+            print(
+                f"{name:<24} req={r['requests']:>7} err={r['errors']:>5} rps={r['throughput_rps']:>9} "
+                f"p50={r['p50_ms']}ms p95={r['p95_ms']}ms p99={r['p99_ms']}ms"
+            )
+
+    if args.base_url:
+        async with httpx.AsyncClient(base_url=args.base_url, timeout=args.timeout) as client:
+            await drive(client)
+        return results
+
+    db_path = os.environ["DATABASE_URL"].removeprefix("sqlite+aiosqlite:///")
+    await seed(db_path, args)
+
+    from benchmarks.common import install_stub_pipeline
+    install_stub_pipeline()
+    import main
+    from model.database import DATABASE_URL, engine
+    if DATABASE_URL != os.environ["DATABASE_URL"]:
+        raise RuntimeError(f"앱이 부하 테스트용 DB가 아닌 {DATABASE_URL} 에 연결되어 있습니다.")
+
+    try:
+        async with main.lifespan(main.app):
+            transport = httpx.ASGITransport(app=main.app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://load-test", timeout=args.timeout) as client:
+                await drive(client)
+    finally:
+        # aiosqlite 연결 스레드가 남아 있으면 프로세스가 종료되지 않음
+        await engine.dispose()
+    return results
+
+
+def compare(results: dict, baseline_path: str):
+    """이전 결과 대비 p95 / 처리량 변화 출력"""
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = json.load(f)["results"]
+    print(f"\n기준 결과 대비 ({baseline_path})")
+    for name, r in results.items():
+        old = baseline.get(name)
+        if not old or not old.get("p95_ms") or not old.get("throughput_rps"):
+            continue
+        p95 = (r["p95_ms"] - old["p95_ms"]) / old["p95_ms"] * 100
+        rps = (r["throughput_rps"] - old["throughput_rps"]) / old["throughput_rps"] * 100
+        print(f"{name:<24} p95 {old['p95_ms']} → {r['p95_ms']}ms ({p95:+.1f}%)  rps {old['throughput_rps']} → {r['throughput_rps']} ({rps:+.1f}%)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="API 부하 테스트 (엔드포인트별 지연 시간 / 처리량)")
+    parser.add_argument("--base-url", help="실행 중인 서버 주소 (지정하지 않으면 임시 DB로 프로세스 안에서 실행)")
+    parser.add_argument("--movies", type=int, default=2000)
+    parser.add_argument("--genres", type=int, default=10)
+    parser.add_argument("--reviews", type=int, default=50_000)
+    parser.add_argument("--concurrency", type=int, default=16, help="동시 클라이언트 수")
+    parser.add_argument("--duration", type=float, default=10, help="엔드포인트별 측정 시간 (초)")
+    parser.add_argument("--requests", type=int, default=None, help="엔드포인트별 최대 요청 수")
+    parser.add_argument("--warmup", type=int, default=20, help="엔드포인트별 워밍업 요청 수")
+    parser.add_argument("--endpoints", nargs="+", help="측정할 엔드포인트 이름 (기본: 전체)")
+    parser.add_argument("--no-response-cache", action="store_true", help="응답 캐시를 끄고 측정")
+    parser.add_argument("--timeout", type=float, default=30)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    parser.add_argument("--baseline", help="비교할 이전 결과 JSON")
+    args = parser.parse_args()
+
+    tmpdir = None
+    if not args.base_url:
+        # 앱 모듈은 DB 경로 / 캐시 설정을 import 시점에 읽으므로 먼저 환경 변수로 지정
+        tmpdir = tempfile.mkdtemp(prefix="movie-load-")
+        os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{os.path.join(tmpdir, 'load.db')}"
+        if args.no_response_cache:
+            os.environ["RESPONSE_CACHE_BACKEND"] = "off"
+    try:
+        results = asyncio.run(run(args))
+    finally:
+        if tmpdir:
+            shutil.rmtree(tmpdir, ignore_errors=True)
+
+    report = {
+        "meta": {
+            "commit": git_commit(),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "args": vars(args),
+        },
+        "results": results,
+    }
+    if args.output:
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"\n✅ 결과 저장: {args.output}")
+    if args.baseline:
+        compare(results, args.baseline)
+
+
+if __name__ == "__main__":
+    main()
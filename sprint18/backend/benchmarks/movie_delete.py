@@ -0,0 +1,97 @@
+"""리뷰가 많은 영화 삭제 (연쇄 soft delete) 지연 시간 / 메모리 벤치마크
+
+백엔드 디렉토리에서 실행:
+    python -m benchmarks.movie_delete --reviews 100000
+
+리뷰 N건이 달린 영화를 이전 방식 (selectinload로 리뷰 객체를 모두 불러와 하나씩 soft_delete) 과
+현재 MovieService.delete (UPDATE 문 1번) 로 삭제하면서 지연 시간과 tracemalloc 최대 메모리를 비교하고,
+삭제 후 리뷰 / 평점 집계 / 검색 색인 상태가 같은지 확인한다.
+"""
+import argparse
+import asyncio
+import sys
+import time
+import tracemalloc
+
+from sqlalchemy import func, select, text
+from sqlalchemy.orm import selectinload
+
+from benchmarks.common import seed_movies, seed_reviews, temp_database
+from model.models import Movie, MovieRatingStat, Review
+from services.movie_service import MovieService
+from services.review_stats_service import GLOBAL_STATS_ID, ReviewStatsService
+
+
+async def legacy_delete(db, movie_id: int):
+    """이전 삭제 경로 (비교용)"""
+    movie = (await db.execute(
+        select(Movie).options(selectinload(Movie.reviews)).where(Movie.id == movie_id)
+    )).scalars().first()
+    if movie.deleted_at is None:
+        await ReviewStatsService(db).remove_movie(movie.id)
+    movie.soft_delete()
+    for review in movie.reviews:
+        review.soft_delete()
+    await db.commit()
+
+
+async def current_delete(db, movie_id: int):
+    await MovieService(db).delete(movie_id)
+
+
+async def state(db, movie_id: int) -> dict:
+    """삭제 결과 비교용 상태 (리뷰 수, 전체 평점 집계, 검색 색인 행 수)"""
+    live = await db.scalar(select(func.count()).select_from(Review).where(Review.movie_id == movie_id, Review.deleted_at.is_(None)))
+    deleted = await db.scalar(select(func.count()).select_from(Review).where(Review.movie_id == movie_id, Review.deleted_at.is_not(None)))
+    total = await db.scalar(select(MovieRatingStat.rating_count).where(MovieRatingStat.movie_id == GLOBAL_STATS_ID))
+    indexed = None
+    if db.get_bind().dialect.name == "sqlite":  # 검색 색인(FTS5)은 SQLite에만 있음
+        indexed = await db.scalar(text(
+            "SELECT count(*) FROM review_fts WHERE rowid IN (SELECT id FROM review WHERE movie_id = :movie_id)"
+        ), {"movie_id": movie_id})
+    return {"live_reviews": live, "deleted_reviews": deleted, "global_rating_count": total, "fts_rows": indexed}
+
+
+async def run(delete, reviews: int) -> tuple[float, float, dict]:
+    async with temp_database(profile="performance") as session_factory:
+        async with session_factory() as db:
+            movie_ids = await seed_movies(db, 2)
+            # 1번 영화에 리뷰 N건 (10%는 이미 삭제된 상태)
+            await seed_reviews(db, [movie_ids[0]], reviews, deleted_ratio=0.1)
+            await ReviewStatsService(db).rebuild()
+            await db.commit()
+
+        async with session_factory() as db:
+            tracemalloc.start()
+            start = time.perf_counter()
+            await delete(db, movie_ids[0])
+            elapsed = (time.perf_counter() - start) * 1000
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+        async with session_factory() as db:
+            return elapsed, peak / 1024 / 1024, await state(db, movie_ids[0])
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="리뷰가 많은 영화 삭제 벤치마크")
+    parser.add_argument("--reviews", type=int, nargs="+", default=[10_000, 100_000])
+    args = parser.parse_args()
+
+    mismatches = 0
+    for count in args.reviews:
+        results = {}
+        for name, delete in (("legacy", legacy_delete), ("current", current_delete)):
+            elapsed, peak_mb, result = await run(delete, count)
+            results[name] = result
+            print(f"reviews={count:>7} {name:<8} time={elapsed:>10.1f}ms peak_mem={peak_mb:>8.1f}MB {result}")
+        # 이미 삭제된 리뷰의 삭제 시각 외에는 결과가 같아야 함
+        if results["legacy"] != results["current"]:
+            print(f"❌ 삭제 결과가 다릅니다 (reviews={count})")
+            mismatches += 1
+    if mismatches:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,225 @@
+"""멀티 워커 배포 모드 통합 확인: uvicorn --workers N + 감정 분석 추론 서버 1개
+
+백엔드 디렉토리에서 실행:
+    python -m benchmarks.multiworker --workers 4 --requests 400
+    python -m benchmarks.multiworker --workers 4 --real-model   # 실제 모델로 프로세스별 메모리 비교
+
+임시 SQLite DB에 영화를 적재한 뒤 추론 서버(sentiment.server)와 uvicorn 워커 N개를 띄우고
+(SENTIMENT_BACKEND=remote), 동시 POST /reviews 가 모두 성공하고 감정 분석 결과가
+추론 서버 모델의 결과와 같은지 확인한다. 마지막에 프로세스별 RSS를 출력한다.
+기본은 결정적 stub 모델을 쓰므로 모델 메모리 차이는 --real-model 에서만 드러난다.
+SQLite는 쓰기가 파일 단위로 직렬화되므로 쓰기 처리량은 워커 수에 비례해 늘지 않는다. (운영은 PostgreSQL 권장)
+"""
+import argparse
+import asyncio
+import os
+import shutil
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+
+import httpx
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def rss_mb(pid: int) -> float | None:
+    try:
+        with open(f"/proc/{pid}/status", encoding="utf-8") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        return None
+    return None
+
+
+def child_pids(pid: int) -> list[int]:
+    try:
+        with open(f"/proc/{pid}/task/{pid}/children", encoding="utf-8") as f:
+            return [int(p) for p in f.read().split()]
+    except OSError:
+        return []
+
+
+async def seed(db_path: str, movies: int) -> list[int]:
+    from benchmarks.common import seed_movies, temp_database
+    from services.review_stats_service import ReviewStatsService
+
+    async with temp_database(path=db_path, profile="performance") as session_factory:
+        async with session_factory() as db:
+            movie_ids = await seed_movies(db, movies)
+            await ReviewStatsService(db).rebuild()
+            await db.commit()
+    return movie_ids
+
+
+async def wait_until_ready(base_url: str, processes: list[subprocess.Popen], timeout: float):
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient(base_url=base_url, timeout=5) as client:
+        while time.monotonic() < deadline:
+            for process in processes:
+                if process.poll() is not None:
+                    raise RuntimeError(f"프로세스가 종료되었습니다: {process.args}")
+            try:
+                if (await client.get("/movies/genres")).status_code == 200:
+                    return
+            except httpx.HTTPError:
+                pass
+            await asyncio.sleep(0.5)
+    raise TimeoutError("API 서버가 시작되지 않았습니다.")
+
+
+async def drive(base_url: str, movie_ids: list[int], requests: int, concurrency: int, real_model: bool) -> dict:
+    contents = ["정말 재미있어요!", "지루했어요", "그냥 그랬어요", "배우 연기가 최고", "돈이 아까워요", "또 보고 싶어요"]
+    semaphore = asyncio.Semaphore(concurrency)
+    statuses, mismatches, latencies = {}, [], []
+    expected = None if real_model else stub_sentiments(contents)
+
+    async def one(client, i):
+        content = contents[i % len(contents)]
+        async with semaphore:
+            start = time.perf_counter()
+            response = await client.post("/reviews", json={
+                "movie_id": movie_ids[i % len(movie_ids)], "reviewer_name": f"worker-test-{i}", "content": content,
+            })
+            latencies.append((time.perf_counter() - start) * 1000)
+        statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+        if response.status_code == 201 and expected is not None:
+            sentiment = response.json()["data"]["sentiment"]
+            if sentiment != expected[content]:
+                mismatches.append((content, sentiment, expected[content]))
+
+    started = time.perf_counter()
+    async with httpx.AsyncClient(base_url=base_url, timeout=60) as client:
+        await asyncio.gather(*(one(client, i) for i in range(requests)))
+    elapsed = time.perf_counter() - started
+
+    from benchmarks.common import percentiles
+    return {"statuses": statuses, "mismatches": mismatches, "rps": round(requests / elapsed, 1), **percentiles(latencies)}
+
+
+async def read_phase(base_url: str, movie_ids: list[int], requests: int, concurrency: int) -> dict:
+    """읽기 요청 (GET /movies/{id}) 처리량: 워커 수에 따라 늘어나는지 확인용"""
+    semaphore = asyncio.Semaphore(concurrency)
+    statuses, latencies = {}, []
+
+    async def one(client, i):
+        async with semaphore:
+            start = time.perf_counter()
+            response = await client.get(f"/movies/{movie_ids[i % len(movie_ids)]}")
+            latencies.append((time.perf_counter() - start) * 1000)
+        statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+
+    started = time.perf_counter()
+    async with httpx.AsyncClient(base_url=base_url, timeout=60) as client:
+        await asyncio.gather(*(one(client, i) for i in range(requests)))
+    elapsed = time.perf_counter() - started
+
+    from benchmarks.common import percentiles
+    return {"statuses": statuses, "rps": round(requests / elapsed, 1), **percentiles(latencies)}
+
+
+def stub_sentiments(contents: list[str]) -> dict:
+    """stub 모델 기준 기대 감정"""
+    from benchmarks.common import StubSentimentPipeline
+    from sentiment.analyzer import _to_sentiment
+    return {text: _to_sentiment(result)[0].value for text, result in zip(contents, StubSentimentPipeline()(contents))}
+
+
+def stop(process: subprocess.Popen):
+    if process.poll() is None:
+        process.send_signal(signal.SIGTERM)
+        try:
+            process.wait(timeout=15)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+
+def serve_stub(socket_path: str):
+    """stub 모델로 추론 서버 실행 (이 스크립트가 자식 프로세스로 호출)"""
+    from benchmarks.common import StubSentimentPipeline
+    from sentiment.server import serve
+    asyncio.run(serve(socket_path, StubSentimentPipeline()))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="멀티 워커 + 공유 추론 서버 통합 확인")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--movies", type=int, default=200)
+    parser.add_argument("--requests", type=int, default=400)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--real-model", action="store_true", help="stub 대신 실제 감정 분석 모델로 추론 서버 실행")
+    parser.add_argument("--startup-timeout", type=float, default=120)
+    parser.add_argument("--serve-stub", metavar="SOCKET", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.serve_stub:
+        serve_stub(args.serve_stub)
+        return
+
+    tmpdir = tempfile.mkdtemp(prefix="movie-workers-")
+    db_path = os.path.join(tmpdir, "workers.db")
+    socket_path = os.path.join(tmpdir, "sentiment.sock")
+    port = free_port()
+    base_url = f"http://127.0.0.1:{port}"
+    env = {
+        **os.environ,
+        "DATABASE_URL": f"sqlite+aiosqlite:///{db_path}",
+        "SENTIMENT_BACKEND": "remote",
+        "SENTIMENT_SOCKET": socket_path,
+        # 여러 프로세스가 같은 SQLite 파일에 쓰면 쓰기 잠금 대기가 길어짐
+        "SQLITE_BUSY_TIMEOUT_MS": os.getenv("SQLITE_BUSY_TIMEOUT_MS", "30000"),
+        # memory 응답 캐시는 워커끼리 무효화가 공유되지 않으므로 Redis가 없으면 끔
+        "RESPONSE_CACHE_BACKEND": os.getenv("RESPONSE_CACHE_BACKEND", "off"),
+    }
+    processes = []
+    try:
+        movie_ids = asyncio.run(seed(db_path, args.movies))
+
+        server_cmd = (
+            [sys.executable, "-m", "sentiment.server", "--socket", socket_path] if args.real_model
+            else [sys.executable, "-m", "benchmarks.multiworker", "--serve-stub", socket_path]
+        )
+        server = subprocess.Popen(server_cmd, env=env)
+        processes.append(server)
+        api = subprocess.Popen(
+            [sys.executable, "-m", "uvicorn", "main:app", "--host", "127.0.0.1", "--port", str(port),
+             "--workers", str(args.workers), "--log-level", "warning"],
+            env=env,
+        )
+        processes.append(api)
+
+        asyncio.run(wait_until_ready(base_url, processes, args.startup_timeout))
+        result = asyncio.run(drive(base_url, movie_ids, args.requests, args.concurrency, args.real_model))
+        reads = asyncio.run(read_phase(base_url, movie_ids, args.requests * 5, args.concurrency))
+
+        print(f"\nPOST /reviews {args.requests}건 (워커 {args.workers}개): 응답={result['statuses']} rps={result['rps']} "
+              f"p50={result['p50_ms']}ms p95={result['p95_ms']}ms")
+        print(f"GET /movies/{{id}} {args.requests * 5}건: 응답={reads['statuses']} rps={reads['rps']} "
+              f"p50={reads['p50_ms']}ms p95={reads['p95_ms']}ms")
+        print(f"추론 서버 RSS: {rss_mb(server.pid):.1f}MB")
+        for pid in child_pids(api.pid):
+            print(f"API 자식 프로세스 pid={pid} RSS: {rss_mb(pid):.1f}MB")
+
+        ok = result["statuses"] == {201: args.requests} and reads["statuses"] == {200: args.requests * 5} and not result["mismatches"]
+        if result["mismatches"]:
+            print(f"⚠️ 감정 분석 결과 불일치: {result['mismatches'][:5]}")
+        print("✅ 통합 확인 성공" if ok else "❌ 통합 확인 실패")
+        if not ok:
+            sys.exit(1)
+    finally:
+        for process in reversed(processes):
+            stop(process)
+        shutil.rmtree(tmpdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""평균 평점 계산 방식 비교: Python 루프 vs SQL AVG(CASE) vs 집계 테이블
+
+백엔드 디렉토리에서 실행:
+    python -m benchmarks.rating_aggregate --sizes 10000 100000 1000000
+"""
+import argparse
+import asyncio
+
+from sqlalchemy import select
+
+from benchmarks.common import measure, seed_movies, seed_reviews, temp_database
+from model.models import Review
+from services.review_stats_service import ReviewStatsService, sentiment_to_rating
+
+
+async def average_python(db, movie_id=None):
+    """기존 방식: (sentiment, score)를 모두 가져와 Python에서 평균"""
+    query = select(Review.sentiment, Review.score).where(Review.deleted_at.is_(None))
+    if movie_id is not None:
+        query = query.where(Review.movie_id == movie_id)
+    ratings = [
+        sentiment_to_rating(sentiment, score)
+        for sentiment, score in (await db.execute(query)).all()
+        if sentiment and score is not None
+    ]
+    return round(sum(ratings) / len(ratings), 3) if ratings else None
+
+
+async def run(size: int, movies: int, repeat: int):
+    async with temp_database() as session_factory:
+        async with session_factory() as db:
+            movie_ids = await seed_movies(db, movies)
+            await seed_reviews(db, movie_ids, size, deleted_ratio=0.1)
+            stats = ReviewStatsService(db)
+            await stats.rebuild()
+
+            report = {}
+            for scope, movie_id in (("global", None), ("movie", movie_ids[0])):
+                python = await measure(lambda: average_python(db, movie_id), repeat)
+                sql = await measure(lambda: stats.average_sql(movie_id), repeat)
+                materialized = await measure(lambda: stats.average_materialized(movie_id), repeat)
+                report[scope] = {
+                    "python_ms": python["median_ms"],
+                    "sql_ms": sql["median_ms"],
+                    "materialized_ms": materialized["median_ms"],
+                    "same_result": python["result"] == sql["result"] == materialized["result"],
+                    "average_score": python["result"],
+                }
+            return report
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="평균 평점 집계 벤치마크")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000], help="리뷰 수")
+    parser.add_argument("--movies", type=int, default=1000, help="영화 수")
+    parser.add_argument("--repeat", type=int, default=5, help="반복 측정 횟수 (중앙값 사용)")
+    args = parser.parse_args()
+
+    mismatched = False
+    for size in args.sizes:
+        report = await run(size, args.movies, args.repeat)
+        for scope, r in report.items():
+            mismatched |= not r["same_result"]
+            print(
+                f"reviews={size:>9,} {scope:<6} python={r['python_ms']:>10.2f}ms "
+                f"sql={r['sql_ms']:>9.2f}ms materialized={r['materialized_ms']:>7.2f}ms "
+                f"avg={r['average_score']} same={r['same_result']}"
+            )
+    raise SystemExit(1 if mismatched else 0)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,143 @@
+"""리뷰 1건 등록 경로의 쿼리 수 / 지연 시간 벤치마크
+
+백엔드 디렉토리에서 실행:
+    python -m benchmarks.review_create --movies 2000 --reviews 200000 --count 500
+
+이전 방식 (find_one → selectinload 중복 확인 → INSERT → 집계 → commit → refresh) 과
+현재 ReviewService.create (영화 / 중복 확인 쿼리 1번 → INSERT … RETURNING → 집계 → commit) 의
+리뷰 1건당 SQL 실행 수와 지연 시간을 비교한다. 감정 분석은 결정적 stub을 쓴다.
+마지막으로 같은 리뷰를 동시에 등록해 유니크 인덱스가 중복을 막는지 확인한다.
+"""
+import argparse
+import asyncio
+import random
+import statistics
+import time
+
+from fastapi import HTTPException
+from sqlalchemy import event, func, select
+from sqlalchemy.orm import selectinload
+
+from benchmarks.common import install_stub_pipeline, seed_movies, seed_reviews, temp_database
+from model.models import Review
+from schemas.review import ReviewCreate
+from sentiment.batcher import sentiment_batcher
+from sentiment.cache import sentiment_cache
+from services.movie_service import MovieService
+from services.review_service import ReviewService
+from services.review_stats_service import ReviewStatsService
+
+
+class QueryCounter:
+    """엔진에서 실행된 SQL 문 수"""
+    def __init__(self, engine):
+        self.count = 0
+        event.listen(engine.sync_engine, "before_cursor_execute", self._on_execute)
+
+    def _on_execute(self, *args):
+        self.count += 1
+
+
+async def legacy_create(db, review: ReviewCreate):
+    """이전 등록 경로 (비교용)"""
+    await MovieService(db).find_one(review.movie_id)
+    existing = (await db.execute(
+        select(Review)
+        .options(selectinload(Review.movie))
+        .where(Review.movie_id == review.movie_id, Review.reviewer_name == review.reviewer_name)
+    )).scalars().first()
+    if existing:
+        raise HTTPException(400)
+    db_review = Review(**review.model_dump())
+    db_review.sentiment, db_review.score = await sentiment_batcher.submit(review.content)
+    db.add(db_review)
+    await ReviewStatsService(db).add([(db_review.movie_id, db_review.sentiment, db_review.score, db_review.created_at)])
+    await db.commit()
+    await db.refresh(db_review)
+    return db_review
+
+
+async def current_create(db, review: ReviewCreate):
+    return await ReviewService(db, MovieService(db)).create(review)
+
+
+async def run_path(session_factory, counter: QueryCounter, create, movie_ids, count: int, prefix: str, duplicate_every: int):
+    rng = random.Random(7)
+    latencies, queries, duplicates = [], [], 0
+    created = []
+    for i in range(count):
+        if created and i % duplicate_every == 0:
+            review = created[rng.randrange(len(created))]  # 중복 요청 경로도 함께 측정
+        else:
+            review = ReviewCreate(movie_id=rng.choice(movie_ids), reviewer_name=f"{prefix}-{i}", content=f"벤치마크 리뷰 {i}")
+        async with session_factory() as db:
+            before = counter.count
+            start = time.perf_counter()
+            try:
+                await create(db, review)
+                created.append(review)
+            except HTTPException:
+                duplicates += 1
+            latencies.append((time.perf_counter() - start) * 1000)
+            queries.append(counter.count - before)
+    return {
+        "queries_per_review": round(statistics.mean(queries), 2),
+        "median_ms": round(statistics.median(latencies), 3),
+        "duplicates": duplicates,
+    }
+
+
+async def duplicate_race(session_factory, movie_id: int, concurrency: int):
+    """같은 리뷰를 동시에 등록 → 1건만 성공해야 함"""
+    review = ReviewCreate(movie_id=movie_id, reviewer_name="동시-등록", content="동시에 등록한 리뷰")
+
+    async def attempt():
+        async with session_factory() as db:
+            try:
+                await current_create(db, review)
+                return 201
+            except HTTPException as e:
+                return e.status_code
+
+    statuses = await asyncio.gather(*(attempt() for _ in range(concurrency)))
+    async with session_factory() as db:
+        stored = await db.scalar(
+            select(func.count()).select_from(Review).where(Review.movie_id == movie_id, Review.reviewer_name == review.reviewer_name)
+        )
+    return statuses, stored
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="리뷰 등록 경로 쿼리 수 / 지연 시간 벤치마크")
+    parser.add_argument("--movies", type=int, default=2000)
+    parser.add_argument("--reviews", type=int, default=200_000)
+    parser.add_argument("--count", type=int, default=500, help="경로별 등록 요청 수")
+    parser.add_argument("--duplicate-every", type=int, default=10, help="N번째 요청마다 중복 리뷰 요청")
+    parser.add_argument("--concurrency", type=int, default=8, help="동시 중복 등록 요청 수")
+    args = parser.parse_args()
+
+    install_stub_pipeline()
+    sentiment_cache.max_size = 0
+    sentiment_batcher.start()
+    try:
+        async with temp_database(profile="performance") as session_factory:
+            async with session_factory() as db:
+                movie_ids = await seed_movies(db, args.movies)
+                await seed_reviews(db, movie_ids, args.reviews)
+            counter = QueryCounter(session_factory.kw["bind"])
+
+            for name, create in (("legacy", legacy_create), ("current", current_create)):
+                r = await run_path(session_factory, counter, create, movie_ids, args.count, name, args.duplicate_every)
+                print(
+                    f"{name:<8} queries/review={r['queries_per_review']:>5} "
+                    f"median={r['median_ms']:>8}ms duplicates={r['duplicates']}"
+                )
+
+            statuses, stored = await duplicate_race(session_factory, movie_ids[0], args.concurrency)
+            print(f"동시 중복 등록 {args.concurrency}건: 응답={sorted(statuses)} 저장된 리뷰={stored}")
+    finally:
+        await sentiment_batcher.stop()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
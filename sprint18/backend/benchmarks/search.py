@@ -0,0 +1,109 @@
+"""전문 검색 지연 시간 벤치마크 (FTS5 trigram vs LIKE '%...%')
+
+백엔드 디렉토리에서 실행:
+    python -m benchmarks.search --movies 100000 --reviews 300000
+
+합성 한국어 리뷰/영화 제목을 적재한 뒤 같은 검색어를
+MovieService.search / ReviewService.search (FTS5) 와 LIKE 전체 스캔으로 조회해 비교한다.
+흔한 단어는 일치하는 행이 많아 bm25 순위 계산 비용이 커지므로 sort=recent도 함께 측정한다.
+"""
+import argparse
+import asyncio
+import random
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import func, insert, select
+
+from benchmarks.common import measure, seed_movies, temp_database
+from model.models import Movie, Review
+from schemas.pagination import Pagination
+from services.movie_service import MovieService
+from services.review_service import ReviewService
+from utils.enums.count_mode_enum import CountModeEnum
+from utils.enums.search_sort_enum import SearchSortEnum
+
+
+WORDS = [
+    "배우", "연기", "스토리", "감동", "지루", "최고", "최악", "반전", "결말", "음악", "영상미", "액션",
+    "로맨스", "코미디", "눈물", "웃음", "긴장감", "캐릭터", "연출", "각본", "몰입감", "시간", "추천",
+    "타노스", "우주", "좀비", "형사", "복수", "가족", "친구", "사랑", "전쟁", "괴물", "기억", "여행",
+]
+QUERIES = ["몰입감", "타노스", "영상미 반전", "긴장감 최고", "스토리", "없는단어입니다"]
+
+
+async def seed_search_data(session_factory, movies: int, reviews: int, seed: int = 42):
+    rng = random.Random(seed)
+    async with session_factory() as db:
+        movie_ids = await seed_movies(db, movies)
+        # 제목을 검색할 만한 문장으로 교체
+        await db.execute(
+            Movie.__table__.update().values(title=Movie.director + "의 " + Movie.title)
+        )
+        now = datetime.now(timezone.utc)
+        for start in range(0, reviews, 10000):
+            rows = []
+            for i in range(start, min(start + 10000, reviews)):
+                created_at = now - timedelta(seconds=rng.randrange(365 * 24 * 3600))
+                rows.append({
+                    "movie_id": rng.choice(movie_ids),
+                    "reviewer_name": f"리뷰어{i}",
+                    "content": " ".join(rng.choices(WORDS, k=rng.randint(5, 15))) + "이었어요",
+                    "sentiment": "NEUTRAL",
+                    "score": 0.5,
+                    "created_at": created_at,
+                    "updated_at": created_at,
+                })
+            await db.execute(insert(Review), rows)
+        await db.commit()
+
+
+async def like_search(db, model, columns, keyword: str, page_size: int):
+    conditions = [
+        func.coalesce(columns[0], "").contains(term, autoescape=True) | columns[1].contains(term, autoescape=True)
+        for term in keyword.split()
+    ]
+    query = (
+        select(model).where(model.deleted_at.is_(None), *conditions)
+        .order_by(model.id.desc()).limit(page_size)
+    )
+    return len((await db.execute(query)).scalars().all())
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="전문 검색 지연 시간 벤치마크")
+    parser.add_argument("--movies", type=int, default=100_000)
+    parser.add_argument("--reviews", type=int, default=300_000)
+    parser.add_argument("--page-size", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    async with temp_database(profile="performance") as session_factory:
+        await seed_search_data(session_factory, args.movies, args.reviews)
+
+        async with session_factory() as db:
+            movie_service = MovieService(db)
+            review_service = ReviewService(db, movie_service)
+            for keyword in QUERIES:
+                pagination = lambda: Pagination(page=1, page_size=args.page_size, count_mode=CountModeEnum.NONE)
+                fts_reviews = await measure(lambda: review_service.search(keyword, pagination()), args.repeat)
+                recent_reviews = await measure(
+                    lambda: review_service.search(keyword, pagination(), sort=SearchSortEnum.RECENT), args.repeat
+                )
+                like_reviews = await measure(
+                    lambda: like_search(db, Review, [Review.content, Review.reviewer_name], keyword, args.page_size),
+                    args.repeat,
+                )
+                fts_movies = await measure(lambda: movie_service.search(keyword, pagination()), args.repeat)
+                like_movies = await measure(
+                    lambda: like_search(db, Movie, [Movie.title, Movie.director], keyword, args.page_size),
+                    args.repeat,
+                )
+                print(
+                    f"{keyword:<12} reviews fts(rank)={fts_reviews['median_ms']:>8}ms "
+                    f"fts(recent)={recent_reviews['median_ms']:>8}ms like={like_reviews['median_ms']:>8}ms | "
+                    f"movies fts={fts_movies['median_ms']:>8}ms like={like_movies['median_ms']:>8}ms"
+                )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,92 @@
+"""응답 직렬화 시간 벤치마크 (100건 페이지 1회 기준)
+
+백엔드 디렉토리에서 실행:
+    python -m benchmarks.serialization --page-size 100 --repeat 200
+
+before: jsonable_encoder(ORM 객체) → data: Any 스키마 검증/직렬화 → json 렌더링 (기존 라우터)
+after : 타입 지정 응답 스키마(Movie / ReviewList)로 ORM 객체 직접 검증/직렬화 → orjson 렌더링
+FastAPI가 response_model로 하는 작업(검증 → JSON 호환 dict → 렌더링)을 TypeAdapter로 그대로 재현한다.
+"""
+import argparse
+import asyncio
+import statistics
+import time
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, ORJSONResponse
+from pydantic import TypeAdapter
+
+from benchmarks.common import seed_movies, seed_reviews, temp_database
+from schemas.movie import Movie
+from schemas.pagination import Pagination
+from schemas.response import PaginationResponseSchema
+from schemas.review import ReviewList
+from services.movie_service import MovieService
+from services.review_service import ReviewService
+from utils.response import ResponseMessage
+
+
+def render(adapter: TypeAdapter, content: dict, response_class) -> bytes:
+    validated = adapter.validate_python(content)
+    return response_class(adapter.dump_python(validated, mode="json", exclude_unset=True)).body
+
+
+def time_it(fn, repeat: int) -> dict:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        body = fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return {"median_ms": round(statistics.median(samples), 3), "min_ms": round(min(samples), 3), "bytes": len(body)}
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="응답 직렬화 시간 벤치마크")
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    async with temp_database() as session_factory:
+        async with session_factory() as db:
+            movie_ids = await seed_movies(db, max(args.page_size, 200))
+            await seed_reviews(db, movie_ids, args.page_size * 10)
+
+        async with session_factory() as db:
+            movie_service = MovieService(db)
+            review_service = ReviewService(db, movie_service)
+            movies, movie_page = await movie_service.find_all(Pagination(page=1, page_size=args.page_size))
+            reviews, average_score, review_page = await review_service.find_all(Pagination(page=1, page_size=args.page_size))
+
+    untyped = TypeAdapter(PaginationResponseSchema)
+    cases = {
+        "movies": (
+            TypeAdapter(PaginationResponseSchema[list[Movie]]),
+            lambda: ResponseMessage.PAGINATION(data=jsonable_encoder(movies), pagination=movie_page.to_schema()),
+            lambda: ResponseMessage.PAGINATION(data=movies, pagination=movie_page.to_schema()),
+        ),
+        "reviews": (
+            TypeAdapter(PaginationResponseSchema[ReviewList]),
+            lambda: ResponseMessage.PAGINATION(
+                data=jsonable_encoder({"average_score": average_score, "reviews": reviews}),
+                pagination=review_page.to_schema(),
+            ),
+            lambda: ResponseMessage.PAGINATION(
+                data={"average_score": average_score, "reviews": reviews},
+                pagination=review_page.to_schema(),
+            ),
+        ),
+    }
+
+    for name, (typed, before_content, after_content) in cases.items():
+        before = time_it(lambda: render(untyped, before_content(), JSONResponse), args.repeat)
+        after = time_it(lambda: render(typed, after_content(), ORJSONResponse), args.repeat)
+        print(
+            f"{name:<8} items={args.page_size} "
+            f"before={before['median_ms']}ms ({before['bytes']}B) "
+            f"after={after['median_ms']}ms ({after['bytes']}B) "
+            f"speedup={before['median_ms'] / after['median_ms']:.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
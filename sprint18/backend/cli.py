@@ -0,0 +1,126 @@
+"""백엔드 관리 명령
+
+백엔드 디렉토리에서 실행:
+    python cli.py rebuild-rating-stats
+    python cli.py rebuild-search-index
+    python cli.py backfill-sentiment-daily
+    python cli.py compact --days 30 [--target parquet --output-dir archive] [--vacuum]
+    python cli.py background
+"""
+import argparse
+import asyncio
+import signal
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from model.database import AsyncSessionLocal, engine, init_db
+from model.search import rebuild_search_index
+from sentiment.config import SENTIMENT_MODE
+from sentiment.worker import sentiment_worker
+from services.compaction_service import CompactionService, compaction_scheduler
+from services.review_stats_service import ReviewStatsService
+from utils.response_cache import response_cache
+
+
+async def rebuild_rating_stats(args):
+    """영화별 평점 집계 재계산"""
+    async with AsyncSessionLocal() as db:
+        count = await ReviewStatsService(db).rebuild()
+    print(f"✅ 평점 집계 재계산 완료: 영화 {count}건")
+
+
+async def backfill_sentiment_daily(args):
+    """일별 감정 집계를 기존 리뷰로 다시 채움"""
+    async with AsyncSessionLocal() as db:
+        count = await ReviewStatsService(db).rebuild_daily()
+    print(f"✅ 일별 감정 집계 재계산 완료: {count}건")
+
+
+async def rebuild_search(args):
+    """전문 검색 FTS5 테이블 재구성 (SQLite)"""
+    if engine.dialect.name != "sqlite":
+        print("⚠️ 전문 검색 색인은 SQLite에서만 사용합니다.")
+        return
+    async with engine.begin() as conn:
+        await conn.run_sync(rebuild_search_index)
+    print("✅ 전문 검색 색인 재구성 완료")
+
+
+async def compact(args):
+    """보관 기간이 지난 soft delete 행을 보관 테이블 / Parquet 파일로 이동"""
+    async with AsyncSessionLocal() as db:
+        moved = await CompactionService(db, args.target, args.output_dir).compact(args.days, args.batch_size)
+    print(f"✅ 삭제 데이터 압축 완료: {moved}")
+    if args.vacuum and engine.dialect.name == "sqlite":
+        # 삭제로 비워진 페이지를 파일에서 반환 (트랜잭션 밖에서 실행해야 함)
+        async with engine.connect() as conn:
+            await conn.execution_options(isolation_level="AUTOCOMMIT")
+            await conn.exec_driver_sql("VACUUM")
+        print("✅ VACUUM 완료")
+
+
+async def background(args):
+    """감정 분석 워커 / 삭제 데이터 압축 실행 (멀티 워커 배포에서 API 워커 대신 이 프로세스 1개만, SIGINT / SIGTERM 으로 종료)"""
+    if SENTIMENT_MODE != "deferred" and not compaction_scheduler.enabled:
+        print("⚠️ 실행할 작업이 없습니다. (SENTIMENT_MODE=deferred 또는 COMPACTION_INTERVAL_HOURS > 0)")
+        return
+    if SENTIMENT_MODE == "deferred":
+        # API 워커의 새 리뷰 알림은 받지 못하므로 SENTIMENT_WORKER_POLL_SECONDS 간격으로 확인
+        sentiment_worker.start()
+    compaction_scheduler.start()
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+
+    print("🚀 백그라운드 작업 시작")
+    try:
+        await stop.wait()
+    finally:
+        print("🛑 백그라운드 작업 종료 중")
+        await compaction_scheduler.stop()
+        await sentiment_worker.stop()
+        await response_cache.close()
+
+
+COMMANDS = {
+    "rebuild-rating-stats": rebuild_rating_stats,
+    "rebuild-search-index": rebuild_search,
+    "backfill-sentiment-daily": backfill_sentiment_daily,
+    "compact": compact,
+    "background": background,
+}
+
+
+async def run(args):
+    await init_db()
+    try:
+        await COMMANDS[args.command](args)
+    finally:
+        # 풀에 남은 연결(aiosqlite 스레드)을 닫아야 프로세스가 종료됨
+        await engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Movie Sentiment API 관리 명령")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    subparsers.add_parser("rebuild-rating-stats", help="리뷰 테이블 기준으로 평점 집계 재계산")
+    subparsers.add_parser("rebuild-search-index", help="영화/리뷰 전문 검색 색인 재구성")
+    subparsers.add_parser("backfill-sentiment-daily", help="리뷰 테이블 기준으로 일별 감정 집계 재계산")
+    compact_parser = subparsers.add_parser("compact", help="오래된 soft delete 행을 보관 테이블 / Parquet 파일로 이동")
+    compact_parser.add_argument("--days", type=int, default=compaction_scheduler.retention_days, help="삭제 후 보관 기간 (일)")
+    compact_parser.add_argument("--batch-size", type=int, default=compaction_scheduler.batch_size)
+    compact_parser.add_argument("--target", choices=["table", "parquet"], default=compaction_scheduler.target)
+    compact_parser.add_argument("--output-dir", default=compaction_scheduler.output_dir, help="Parquet 저장 경로")
+    compact_parser.add_argument("--vacuum", action="store_true", help="압축 후 SQLite VACUUM 실행")
+    subparsers.add_parser("background", help="감정 분석 워커 / 삭제 데이터 주기적 압축 실행 (멀티 워커 배포용)")
+
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,30 +1,94 @@
+import asyncio
+import os
 from contextlib import asynccontextmanager
 from dotenv import load_dotenv
 from fastapi import FastAPI, HTTPException
 from fastapi.exceptions import RequestValidationError
 
+load_dotenv()
+
 from utils.exception_handler import http_exception_handler, validation_exception_handler
-from routers import movie, review
-from model.database import init_db
+from routers import metrics, movie, review, sentiment
+from model.database import AsyncSessionLocal, engine, init_db
+from sentiment.analyzer import warm_up
+from sentiment.batcher import sentiment_batcher
+from sentiment.config import SENTIMENT_BACKEND, SENTIMENT_MODE, SENTIMENT_WARMUP
+from sentiment.worker import sentiment_worker
+from services.compaction_service import compaction_scheduler
+from services.movie_service import MovieService
+from services.review_stats_service import ReviewStatsService
+from utils.profiling import TimedORJSONResponse, instrument_engine, profiling_middleware
+from utils.response_cache import MemoryCacheBackend, response_cache
+
+# 감정 분석 워커 / 삭제 데이터 압축을 이 프로세스에서 실행할지 (멀티 워커 배포에서는 false 후 python cli.py background)
+BACKGROUND_TASKS = os.getenv("BACKGROUND_TASKS", "true").lower() in ("1", "true", "yes")
 
-load_dotenv()
+
+def check_multiworker_config():
+    """멀티 워커 모드(SENTIMENT_BACKEND=remote) 설정 검사, 잘못된 설정이면 시작하지 않는다
+
+    캐시 무효화는 쓰기를 처리한 워커 프로세스 안에서만 일어난다.
+    응답 캐시는 memory 백엔드면 다른 워커가 TTL 동안 이전 응답을 돌려주므로 redis (또는 off) 만 허용하고,
+    목록 개수 캐시(utils/count_cache)와 장르 캐시(utils/genre_cache)는 워커별로 두되
+    다른 워커의 변경은 COUNT_CACHE_TTL_SECONDS / GENRE_CACHE_TTL_SECONDS 가 지나야 반영된다.
+    """
+    if SENTIMENT_BACKEND != "remote":
+        return
+    if isinstance(response_cache.backend, MemoryCacheBackend):
+        raise RuntimeError("멀티 워커 모드에서는 RESPONSE_CACHE_BACKEND=redis (또는 off) 가 필요합니다.")
+    if BACKGROUND_TASKS and (SENTIMENT_MODE == "deferred" or compaction_scheduler.enabled):
+        raise RuntimeError(
+            "멀티 워커 모드에서는 BACKGROUND_TASKS=false 로 두고 "
+            "감정 분석 워커 / 삭제 데이터 압축은 python cli.py background 로 한 프로세스에서만 실행하세요."
+        )
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     print("🚀 앱 시작 중: DB 초기화 실행")
+    check_multiworker_config()
     await init_db()
+    async with AsyncSessionLocal() as db:
+        # 평점 집계 테이블이 비어 있으면 기존 리뷰로 채움
+        await ReviewStatsService(db).rebuild_if_missing()
+        # 장르 캐시 미리 채우기
+        await MovieService(db).find_all_genres()
+    if SENTIMENT_WARMUP:
+        # 모델은 import 시점이 아니라 여기서 (워커 스레드에서) 로드
+        print("🧠 감정 분석 모델 로드 중")
+        await asyncio.to_thread(warm_up)
+    sentiment_batcher.start()
+    if BACKGROUND_TASKS:
+        if SENTIMENT_MODE == "deferred":
+            # 분석 대기 리뷰를 모아서 처리하는 백그라운드 워커
+            sentiment_worker.start()
+        # 오래된 soft delete 행 주기적 압축 (COMPACTION_INTERVAL_HOURS > 0 일 때만)
+        compaction_scheduler.start()
     yield
     print("🛑 앱 종료 중: 정리 작업 가능")
+    await compaction_scheduler.stop()
+    await sentiment_worker.stop()
+    await sentiment_batcher.stop()
+    await response_cache.close()
 
 
-app = FastAPI(title="Movie Sentiment API", lifespan=lifespan)
+# 응답 스키마로 직렬화한 결과를 orjson으로 렌더링 (렌더링 시간은 Server-Timing의 serialize 구간)
+app = FastAPI(title="Movie Sentiment API", lifespan=lifespan, default_response_class=TimedORJSONResponse)
 
 # 커스텀 예외 핸들러
 app.add_exception_handler(HTTPException, http_exception_handler)
 app.add_exception_handler(RequestValidationError, validation_exception_handler)
 
+# GET 응답 캐시 (ETag / 304)
+app.middleware("http")(response_cache.middleware)
+
+# 요청 / 구간별 시간 측정 (Server-Timing 헤더, /metrics), 캐시 HIT도 측정되도록 가장 바깥에 등록
+instrument_engine(engine)
+app.middleware("http")(profiling_middleware)
+
 
 app.include_router(movie.router)
 app.include_router(review.router)
+app.include_router(sentiment.router)
+app.include_router(metrics.router)
 
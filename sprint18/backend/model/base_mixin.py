@@ -6,7 +6,7 @@ from sqlalchemy import Column, DateTime
 class TimestampMixin:
     created_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
     updated_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc))
-    deleted_at = Column(DateTime(timezone=True), nullable=True)
+    deleted_at = Column(DateTime(timezone=True), nullable=True, index=True)  # soft delete 필터 / 전체 개수 조회용
     
     def soft_delete(self):
         """soft delete: deleted_at 필드에 현재 시간 기록"""
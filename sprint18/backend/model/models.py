@@ -1,10 +1,14 @@
 
-from sqlalchemy import Column, DateTime, Float, ForeignKey, Integer, String, Date, Table, func, null
+from sqlalchemy import Column, DateTime, Float, ForeignKey, Index, Integer, String, Date, Table, func, null, text
 from sqlalchemy.orm import relationship
 from model.base_mixin import TimestampMixin
 from model.database import Base
 
 
+# soft delete 되지 않은 행만 담는 부분 인덱스 조건
+LIVE_ROWS = text("deleted_at IS NULL")
+
+
 # movie genre 매핑 테이블
 movie_genre_table = Table(
     "movie_genres",
@@ -15,6 +19,12 @@ movie_genre_table = Table(
 
 class Movie(Base, TimestampMixin):
     __tablename__ = "movie"
+    __table_args__ = (
+        # 목록: deleted_at IS NULL ORDER BY release_date DESC, id DESC
+        Index("ix_movie_live_release", "release_date", "id", sqlite_where=LIVE_ROWS, postgresql_where=LIVE_ROWS),
+        # 중복 확인: title = ? AND director = ? AND deleted_at IS NULL
+        Index("ix_movie_live_title_director", "title", "director", sqlite_where=LIVE_ROWS, postgresql_where=LIVE_ROWS),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String, index=True)
@@ -44,6 +54,21 @@ class Genre(Base, TimestampMixin):
     
 class Review(Base, TimestampMixin):
     __tablename__ = "review"
+    __table_args__ = (
+        # 전체 목록: deleted_at IS NULL ORDER BY created_at DESC, id DESC
+        Index("ix_review_live_created", "created_at", "id", sqlite_where=LIVE_ROWS, postgresql_where=LIVE_ROWS),
+        # 영화별 목록: movie_id = ? AND deleted_at IS NULL ORDER BY created_at DESC, id DESC
+        Index("ix_review_live_movie_created", "movie_id", "created_at", "id", sqlite_where=LIVE_ROWS, postgresql_where=LIVE_ROWS),
+        # 영화별 작성자당 리뷰 1개 (삭제된 리뷰 포함) / 중복 확인 / 영화 삭제 시 리뷰 조회
+        Index("ux_review_movie_reviewer", "movie_id", "reviewer_name", unique=True),
+        # 분석 대기 리뷰 (deferred 모드 워커): sentiment IS NULL ... ORDER BY sentiment, id
+        # SQLite는 WHERE 조건 컬럼이 인덱스에 없으면 부분 인덱스를 고르지 않으므로 sentiment를 앞에 둔다
+        Index(
+            "ix_review_pending_sentiment", "sentiment", "id",
+            sqlite_where=text("sentiment IS NULL AND deleted_at IS NULL"),
+            postgresql_where=text("sentiment IS NULL AND deleted_at IS NULL"),
+        ),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     movie_id = Column(Integer, ForeignKey("movie.id"))
@@ -52,4 +77,41 @@ class Review(Base, TimestampMixin):
     sentiment = Column(String, nullable=True)
     score = Column(Float, nullable=True)
     
-    movie = relationship("Movie", back_populates="reviews")
\ No newline at end of file
+    movie = relationship("Movie", back_populates="reviews")
+
+
+class MovieRatingStat(Base):
+    """영화별 평점 집계 (리뷰 생성/삭제 시 증분 갱신, movie_id=0 은 전체 집계)"""
+    __tablename__ = "movie_rating_stats"
+
+    movie_id = Column(Integer, primary_key=True, autoincrement=False)
+    rating_sum = Column(Float, nullable=False, default=0.0)
+    rating_count = Column(Integer, nullable=False, default=0)
+
+
+class MovieSentimentDaily(Base):
+    """영화 × 일 × 감정별 리뷰 집계 (분포 / 추이 조회용, 리뷰 생성/삭제 시 증분 갱신)"""
+    __tablename__ = "movie_sentiment_daily"
+
+    movie_id = Column(Integer, primary_key=True, autoincrement=False)
+    day = Column(Date, primary_key=True)    # 리뷰 작성일 (UTC)
+    sentiment = Column(String, primary_key=True)
+    review_count = Column(Integer, nullable=False, default=0)
+    rating_sum = Column(Float, nullable=False, default=0.0)
+
+
+def _archive_table(source: Table) -> Table:
+    """보관 테이블: soft delete 후 보관 기간이 지나 원본에서 옮긴 행 (원본 컬럼 + archived_at, 인덱스/FK 없음)"""
+    return Table(
+        f"{source.name}_archive",
+        Base.metadata,
+        *(Column(c.name, c.type, primary_key=c.primary_key, autoincrement=False) for c in source.columns),
+        Column("archived_at", DateTime(timezone=True), nullable=False),
+    )
+
+
+movie_archive = _archive_table(Movie.__table__)
+review_archive = _archive_table(Review.__table__)
+# 압축된 리뷰도 중복 확인 대상 (영화별 작성자당 리뷰 1개는 보관 후에도 유지)
+Index("ix_review_archive_movie_reviewer", review_archive.c.movie_id, review_archive.c.reviewer_name)
+movie_genre_archive = _archive_table(movie_genre_table)
@@ -0,0 +1,58 @@
+
+from sqlalchemy import column, table, text
+
+
+# 전문 검색용 FTS5 가상 테이블 (SQLite 전용, trigram 토크나이저로 한국어 부분 문자열 검색)
+# rowid = 원본 테이블 id, soft delete 되지 않은 행만 들어 있다.
+movie_fts = table("movie_fts", column("rowid"), column("title"), column("director"))
+review_fts = table("review_fts", column("rowid"), column("content"), column("reviewer_name"))
+
+# (FTS 테이블, 원본 테이블, 검색 컬럼)
+SEARCH_TABLES = [
+    ("movie_fts", "movie", ("title", "director")),
+    ("review_fts", "review", ("content", "reviewer_name")),
+]
+
+
+def _ddl(fts: str, source: str, columns: tuple) -> list[str]:
+    """FTS 테이블 + 동기화 트리거 (생성 / 검색 컬럼 수정 / soft delete / 삭제)"""
+    cols = ", ".join(columns)
+    new_values = ", ".join(f"NEW.{c}" for c in columns)
+    return [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5({cols}, tokenize='trigram')",
+        f"""CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {source}
+            WHEN NEW.deleted_at IS NULL BEGIN
+                INSERT INTO {fts}(rowid, {cols}) VALUES (NEW.id, {new_values});
+            END""",
+        f"""CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE OF {cols}, deleted_at ON {source} BEGIN
+                DELETE FROM {fts} WHERE rowid = OLD.id;
+                INSERT INTO {fts}(rowid, {cols}) SELECT NEW.id, {new_values} WHERE NEW.deleted_at IS NULL;
+            END""",
+        f"""CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {source} BEGIN
+                DELETE FROM {fts} WHERE rowid = OLD.id;
+            END""",
+    ]
+
+
+def rebuild_search_index(sync_conn, fts: str | None = None):
+    """FTS 테이블을 원본 테이블의 삭제되지 않은 행으로 다시 채움"""
+    for name, source, columns in SEARCH_TABLES:
+        if fts and name != fts:
+            continue
+        cols = ", ".join(columns)
+        sync_conn.execute(text(f"DELETE FROM {name}"))
+        sync_conn.execute(text(
+            f"INSERT INTO {name}(rowid, {cols}) SELECT id, {cols} FROM {source} WHERE deleted_at IS NULL"
+        ))
+
+
+def create_search_tables(sync_conn):
+    """FTS 테이블/트리거 생성 (SQLite에서만), 새로 만든 FTS 테이블은 기존 데이터로 채움"""
+    if sync_conn.dialect.name != "sqlite":
+        return
+    existing = set(sync_conn.execute(text("SELECT name FROM sqlite_master WHERE type = 'table'")).scalars())
+    for fts, source, columns in SEARCH_TABLES:
+        for statement in _ddl(fts, source, columns):
+            sync_conn.execute(text(statement))
+        if fts not in existing:
+            rebuild_search_index(sync_conn, fts)
@@ -0,0 +1,12 @@
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from utils.profiling import metrics
+
+
+router = APIRouter(tags=["Metrics"])
+
+@router.get("/metrics", response_class=PlainTextResponse, include_in_schema=False, summary="Prometheus 지표")
+async def prometheus_metrics():
+    # Prometheus 텍스트 형식 (요청 수 / 지연 시간 / 구간별 시간 / DB 쿼리 수)
+    return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4")
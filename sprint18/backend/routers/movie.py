@@ -1,12 +1,18 @@
-from fastapi import APIRouter, Depends, File, UploadFile
-from fastapi.encoders import jsonable_encoder
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, File, Query, Request, Response, UploadFile
 from requests import Session
-from schemas.pagination import Pagination, PaginationRequest
+from schemas.pagination import PageRequest, Pagination, PaginationRequest, SearchKeyword
 from schemas.response import BaseResponseSchema, DataResponseSchema, PaginationResponseSchema
 from services.movie_service import MovieService
+from utils.bulk_import import BulkImportReport, read_records
+from utils.enums.search_sort_enum import SearchSortEnum
+from utils.enums.stats_bucket_enum import StatsBucketEnum
+from utils.etag import etag_matches
 from utils.response import ResponseMessage
 from model.database import get_db
-from schemas.movie import MovieCreate
+from schemas.movie import Genre, Movie, MovieCreate
+from schemas.stats import MovieSentimentStats
 
 
 router = APIRouter(prefix="/movies", tags=["Movies"])    
@@ -15,42 +21,93 @@ router = APIRouter(prefix="/movies", tags=["Movies"])
 def get_movie_service(db: Session = Depends(get_db)) -> MovieService:
     return MovieService(db)
 
-@router.get("/genres", response_model=DataResponseSchema, summary="장르 리스트 조회")
-async def get(service:MovieService = Depends(get_movie_service)):
-    genres = await service.find_all_genres()
+@router.get("/genres", response_model=DataResponseSchema[list[Genre]], summary="장르 리스트 조회")
+async def get(request: Request, response: Response, service:MovieService = Depends(get_movie_service)):
+    genres, etag = await service.find_all_genres()
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    # 클라이언트가 가진 목록과 같으면 본문 없이 304
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
     return ResponseMessage.OK(
         message="장르 리스트가 성공적으로 조회되었습니다.",
-        data = jsonable_encoder(genres)
+        data = genres
     )
     
-@router.post("", response_model=DataResponseSchema, status_code=201, summary="영화 추가")
+@router.post("", response_model=DataResponseSchema[Movie], response_model_exclude_unset=True, status_code=201, summary="영화 추가")
 async def create(movie: MovieCreate, service:MovieService = Depends(get_movie_service)):
     result = await service.create(movie)
     return ResponseMessage.CREATED(
         message="영화가 성공적으로 추가되었습니다.",
-        data=jsonable_encoder(result)
+        data=result
     )
 
 
-@router.get("", response_model=PaginationResponseSchema, summary="영화 목록 조회")
+@router.post("/bulk", response_model=DataResponseSchema, summary="영화 일괄 등록 (NDJSON / CSV)")
+async def bulk_create(
+    request: Request,
+    chunk_size: int = Query(500, ge=1, le=5000, description="한 번에 commit할 행 수"),
+    service:MovieService = Depends(get_movie_service)):
+    """NDJSON(MovieCreate 형식) 또는 CSV(title,director,release_date,poster,genres) 스트림 일괄 등록
+
+    CSV의 genres는 '액션|드라마'처럼 장르 이름을 |로 구분한다.
+    """
+    report = BulkImportReport()
+    async for chunk in read_records(request, chunk_size, report):
+        await service.bulk_create(chunk, report)
+    return ResponseMessage.OK(
+        message=f"영화 {report.created}건이 등록되었습니다. (실패 {report.failed}건)",
+        data=report.to_dict()
+    )
+
+@router.get("", response_model=PaginationResponseSchema[list[Movie]], response_model_exclude_unset=True, summary="영화 목록 조회")
 async def find_all(
     params: PaginationRequest = Depends(),
     service:MovieService = Depends(get_movie_service)):
     
-    pagination = Pagination(page=params.page, page_size=params.page_size)
+    pagination = Pagination(page=params.page, page_size=params.page_size, after=params.after,
+                            count_mode=params.count)
     results, pagination = await service.find_all(pagination)
     
     return ResponseMessage.PAGINATION(
         message="영화 목록이 성공적으로 조회되었습니다.",
-        data=jsonable_encoder(results),
+        data=results,
         pagination=pagination.to_schema()
     )
-@router.get("/{movie_id}", response_model=DataResponseSchema, summary="단일 영화 조회")
+@router.get("/search", response_model=PaginationResponseSchema[list[Movie]], response_model_exclude_unset=True, summary="영화 검색")
+async def search(
+    q: Annotated[SearchKeyword, Query(description="검색어 (제목 / 감독, 공백으로 구분한 단어 모두 포함)")],
+    sort: SearchSortEnum = Query(SearchSortEnum.RANK, description="정렬 (rank: 관련도 / recent: 최근 등록순)"),
+    params: PageRequest = Depends(),
+    service:MovieService = Depends(get_movie_service)):
+    
+    pagination = Pagination(page=params.page, page_size=params.page_size, count_mode=params.count)
+    results, pagination = await service.search(q, pagination, sort)
+    
+    return ResponseMessage.PAGINATION(
+        message="영화 검색 결과가 성공적으로 조회되었습니다.",
+        data=results,
+        pagination=pagination.to_schema()
+    )
+
+@router.get("/{movie_id}", response_model=DataResponseSchema[Movie], response_model_exclude_unset=True, summary="단일 영화 조회")
 async def find_one(movie_id: int, service:MovieService = Depends(get_movie_service)):
     movie =  await service.find_one(movie_id)
     return ResponseMessage.OK(
         message=f"영화{movie.title}이/가 성공적으로 조회되었습니다.",
-        data = jsonable_encoder(movie)
+        data = movie
+    )
+
+@router.get("/{movie_id}/stats", response_model=DataResponseSchema[MovieSentimentStats], summary="영화 감정 분포 / 평점 추이")
+async def stats(
+    movie_id: int,
+    bucket: StatsBucketEnum = Query(StatsBucketEnum.DAY, description="추이 집계 단위 (day / week)"),
+    days: int = Query(30, ge=1, le=366, description="추이 조회 기간 (최근 N일)"),
+    service:MovieService = Depends(get_movie_service)):
+    result = await service.stats(movie_id, bucket, days)
+    return ResponseMessage.OK(
+        message="영화 통계가 성공적으로 조회되었습니다.",
+        data=result
     )
 
 @router.delete("/{movie_id}", response_model=BaseResponseSchema, summary="영화 삭제")
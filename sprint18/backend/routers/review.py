@@ -1,12 +1,13 @@
 # Standard Library
-from fastapi import APIRouter, Depends, Path, Query
-from fastapi.encoders import jsonable_encoder
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Path, Query, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 from requests import Session
 
 # Schemas
-from schemas.review import ReviewCreate
-from schemas.pagination import Pagination, PaginationRequest
+from schemas.review import Review, ReviewCreate, ReviewList
+from schemas.pagination import PageRequest, Pagination, PaginationRequest, SearchKeyword
 from schemas.response import DataResponseSchema, PaginationResponseSchema
 
 # Models, Database
@@ -17,6 +18,8 @@ from services.review_service import ReviewService
 from services.movie_service import MovieService
 
 # Utils
+from utils.bulk_import import BulkImportReport, read_records
+from utils.enums.search_sort_enum import SearchSortEnum
 from utils.response import ResponseMessage
 
 
@@ -27,39 +30,71 @@ def get_review_service(db: Session = Depends(get_db)) -> ReviewService:
     movie_service = MovieService(db)
     return ReviewService(db, movie_service)
 
-@router.post("", response_model=DataResponseSchema, status_code=201, summary="리뷰 추가")
+@router.post("", response_model=DataResponseSchema[Review], response_model_exclude_unset=True, status_code=201, summary="리뷰 추가")
 async def create(review: ReviewCreate, service:ReviewService = Depends(get_review_service)):
     result = await service.create(review)
     return ResponseMessage.CREATED(
         message="리뷰가 성공적으로 추가되었습니다.",
-        data=jsonable_encoder(result)
+        data=result
+    )
+
+@router.post("/bulk", response_model=DataResponseSchema, summary="리뷰 일괄 등록 (NDJSON / CSV)")
+async def bulk_create(
+    request: Request,
+    chunk_size: int = Query(500, ge=1, le=5000, description="한 번에 분석/commit할 행 수"),
+    service:ReviewService = Depends(get_review_service)):
+    """NDJSON(ReviewCreate 형식) 또는 CSV(movie_id,reviewer_name,content) 스트림 일괄 등록"""
+    report = BulkImportReport()
+    async for chunk in read_records(request, chunk_size, report):
+        await service.bulk_create(chunk, report)
+    return ResponseMessage.OK(
+        message=f"리뷰 {report.created}건이 등록되었습니다. (실패 {report.failed}건)",
+        data=report.to_dict()
     )
 
-@router.get("", response_model=PaginationResponseSchema, summary="전체 영화 리뷰 목록 조회")
+@router.get("", response_model=PaginationResponseSchema[ReviewList], response_model_exclude_unset=True, summary="전체 영화 리뷰 목록 조회")
 async def find_all(
     movie_id: int = Query(None, description="리뷰를 조회할 영화의 ID", example=1) ,
     params: PaginationRequest = Depends(),
     service:ReviewService = Depends(get_review_service)):
     
-    pagination = Pagination(page=params.page, page_size=params.page_size)
+    pagination = Pagination(page=params.page, page_size=params.page_size, after=params.after,
+                            count_mode=params.count)
     results, average_score, pagination = await service.find_all(pagination, movie_id)
     
     return ResponseMessage.PAGINATION(
         message="영화 리뷰 목록이 성공적으로 조회되었습니다.",
-        data=jsonable_encoder({
+        data={
             "average_score": average_score,
             "reviews": results
-        }),
+        },
         pagination=pagination.to_schema()
     )
     
 
-@router.get("/{review_id}", response_model=DataResponseSchema, summary="단일 영화 조회")
+@router.get("/search", response_model=PaginationResponseSchema[list[Review]], response_model_exclude_unset=True, summary="리뷰 검색")
+async def search(
+    q: Annotated[SearchKeyword, Query(description="검색어 (내용 / 작성자, 공백으로 구분한 단어 모두 포함)")],
+    movie_id: int = Query(None, description="검색할 영화의 ID"),
+    sort: SearchSortEnum = Query(SearchSortEnum.RANK, description="정렬 (rank: 관련도 / recent: 최근 등록순)"),
+    params: PageRequest = Depends(),
+    service:ReviewService = Depends(get_review_service)):
+    
+    pagination = Pagination(page=params.page, page_size=params.page_size, count_mode=params.count)
+    results, pagination = await service.search(q, pagination, movie_id, sort)
+    
+    return ResponseMessage.PAGINATION(
+        message="리뷰 검색 결과가 성공적으로 조회되었습니다.",
+        data=results,
+        pagination=pagination.to_schema()
+    )
+
+@router.get("/{review_id}", response_model=DataResponseSchema[Review], response_model_exclude_unset=True, summary="단일 영화 조회")
 async def find_one(review_id: int, service:ReviewService = Depends(get_review_service)):
     review =  await service.find_one(review_id)
     return ResponseMessage.OK(
         message=f"리뷰가 성공적으로 조회되었습니다.",
-        data = jsonable_encoder(review)
+        data = review
     )
 
 # @router.delete("/{movie_id}", response_model=BaseResponseSchema, summary="영화 삭제")
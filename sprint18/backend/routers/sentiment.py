@@ -0,0 +1,15 @@
+from fastapi import APIRouter
+
+from schemas.response import DataResponseSchema
+from sentiment.cache import sentiment_cache
+from utils.response import ResponseMessage
+
+
+router = APIRouter(prefix="/sentiment", tags=["Sentiment"])
+
+@router.get("/cache", response_model=DataResponseSchema, summary="감정 분석 캐시 통계 조회")
+async def cache_stats():
+    return ResponseMessage.OK(
+        message="감정 분석 캐시 통계가 성공적으로 조회되었습니다.",
+        data=sentiment_cache.stats()
+    )
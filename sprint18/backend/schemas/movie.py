@@ -1,7 +1,9 @@
-from datetime import date
+from datetime import date, datetime
 from typing import List, Optional
 from pydantic import BaseModel, Field
 
+from schemas.orm import OrmSchema
+
 
 class MovieGenreInput(BaseModel):
     id: Optional[int] = Field(None, description="기존 장르 ID")
@@ -25,8 +27,12 @@ class MovieCreate(MovieBase):
         example=[{"id": 1}, {"genre": "스릴러"}]
     )
 
-class Movie(MovieBase):
-    id: int = Field(..., description="영화 ID")
+class Genre(OrmSchema):
+    id: int = Field(..., description="장르 ID")
+    genre: str = Field(..., description="장르 이름")
 
-    class Config:
-        from_attributes = True
\ No newline at end of file
+class Movie(MovieBase, OrmSchema):
+    id: int = Field(..., description="영화 ID")
+    genres: Optional[List[Genre]] = Field(None, description="장르 목록 (함께 조회한 경우)")
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
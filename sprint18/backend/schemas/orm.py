@@ -0,0 +1,18 @@
+from pydantic import BaseModel, model_validator
+
+
+class OrmSchema(BaseModel):
+    """SQLAlchemy 객체를 바로 받는 응답 스키마
+
+    ORM 객체는 이미 로드된 속성만 dict로 바꿔 검증하므로 로드되지 않은 관계(lazy)는 조회하지 않는다.
+    (라우터에서 response_model_exclude_unset=True로 로드되지 않은 필드는 응답에서 뺀다)
+    """
+    @model_validator(mode="before")
+    @classmethod
+    def _loaded_attributes(cls, data):
+        if hasattr(data, "_sa_instance_state"):
+            return {k: v for k, v in vars(data).items() if not k.startswith("_sa_")}
+        return data
+
+    class Config:
+        from_attributes = True
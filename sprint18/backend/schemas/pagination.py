@@ -1,37 +1,88 @@
-from pydantic import BaseModel, Field
-from typing import Optional
+import base64
+import json
+from pydantic import BaseModel, Field, StringConstraints
+from typing import Annotated, Optional
 from math import ceil
 
+from utils.enums.count_mode_enum import CountModeEnum
 
-class PaginationRequest(BaseModel):
-    """요청용 페이지네이션 (쿼리 파라미터 검증)"""
+
+# 검색어 쿼리 파라미터: 앞뒤 공백 제거 후 1~100자 (공백만 있으면 422)
+SearchKeyword = Annotated[str, StringConstraints(strip_whitespace=True, min_length=1, max_length=100)]
+
+
+class PageRequest(BaseModel):
+    """요청용 페이지 번호 페이지네이션 (커서를 지원하지 않는 검색 등)"""
     page: int = Field(1, ge=1, description="페이지 번호 (1 이상)")
     page_size: int = Field(10, ge=1, le=100, description="페이지 크기 (1~100 사이)")
+    count: CountModeEnum = Field(CountModeEnum.EXACT, description="전체 개수 계산 방식 (exact / none / window / cached)")
+
+
+class PaginationRequest(PageRequest):
+    """요청용 페이지네이션 (쿼리 파라미터 검증)"""
+    after: Optional[str] = Field(None, description="커서 (이전 응답의 next_cursor, 지정 시 page 대신 커서 기준 조회)")
 
 
 class PaginationResponse(BaseModel):
     """응답용 페이지네이션 정보"""
     page: int
     page_size: int
-    total_pages: int
-    total_count: int
+    total_pages: Optional[int] = None
+    total_count: Optional[int] = None
+    next_cursor: Optional[str] = None
 
 
 class Pagination:
     """내부 계산용 클래스 (DB 조회용)"""
-    def __init__(self, page: int = 1, page_size: int = 10):
+    def __init__(self, page: int = 1, page_size: int = 10, after: Optional[str] = None,
+                 count_mode: CountModeEnum = CountModeEnum.EXACT):
         self.page = page
         self.page_size = page_size
+        self.after = after
+        self.count_mode = count_mode
         self.total_pages = 0
         self.total_count = 0
+        self.next_cursor = None
 
     def offset(self) -> int:
         """SQL OFFSET 계산"""
         return (self.page - 1) * self.page_size
 
-    def set_total(self, total_count: int):
-        """전체 개수 기반으로 total_pages 계산"""
+    @staticmethod
+    def encode_cursor(sort_key, row_id: int) -> str:
+        """(정렬 키, id)를 불투명한 커서 문자열로 인코딩"""
+        key = sort_key.isoformat() if hasattr(sort_key, "isoformat") else sort_key
+        raw = json.dumps([key, row_id], separators=(",", ":")).encode("utf-8")
+        return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+    def decode_cursor(self) -> Optional[tuple]:
+        """after 커서를 (정렬 키 문자열, id)로 디코딩 (커서 모드가 아니면 None)"""
+        if not self.after:
+            return None
+        try:
+            padded = self.after + "=" * (-len(self.after) % 4)
+            key, row_id = json.loads(base64.urlsafe_b64decode(padded))
+            return key, int(row_id)
+        except (ValueError, TypeError):
+            raise ValueError("잘못된 커서입니다.")
+
+    def set_next(self, rows: list, sort_key) -> list:
+        """page_size+1개 조회 결과에서 다음 커서를 계산하고 현재 페이지 행만 반환 (sort_key가 None이면 커서 없음)"""
+        if len(rows) > self.page_size and sort_key is not None:
+            rows = rows[:self.page_size]
+            last = rows[-1]
+            self.next_cursor = self.encode_cursor(sort_key(last), last.id)
+        else:
+            rows = rows[:self.page_size]
+            self.next_cursor = None
+        return rows
+
+    def set_total(self, total_count: Optional[int]):
+        """전체 개수 기반으로 total_pages 계산 (None이면 전체 개수 생략)"""
         self.total_count = total_count
+        if total_count is None:
+            self.total_pages = None
+            return self
         self.total_pages = ceil(total_count / self.page_size) if self.page_size > 0 else 1
         return self
 
@@ -41,5 +92,6 @@ class Pagination:
             page=self.page,
             page_size=self.page_size,
             total_pages=self.total_pages,
-            total_count=self.total_count
+            total_count=self.total_count,
+            next_cursor=self.next_cursor
         )
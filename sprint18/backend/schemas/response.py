@@ -1,4 +1,4 @@
-from typing import Any, Optional
+from typing import Generic, Optional, TypeVar
 from pydantic import BaseModel
 
 from schemas.pagination import PaginationResponse
@@ -14,8 +14,11 @@ class BaseResponseSchema(BaseModel):
     status_code: int
     message: str
 
-class DataResponseSchema(BaseResponseSchema):
-    data: Optional[Any] = None
+T = TypeVar("T")
 
-class PaginationResponseSchema(DataResponseSchema):
+class DataResponseSchema(BaseResponseSchema, Generic[T]):
+    """data 타입 지정 시 (예: DataResponseSchema[Movie]) 응답을 스키마로 직렬화"""
+    data: Optional[T] = None
+
+class PaginationResponseSchema(DataResponseSchema[T], Generic[T]):
     pagination: Optional[PaginationResponse] = None
\ No newline at end of file
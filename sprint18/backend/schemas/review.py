@@ -1,7 +1,10 @@
 from datetime import date, datetime
-from typing import Optional
+from typing import List, Optional
 from pydantic import BaseModel, Field
 
+from schemas.movie import Movie
+from schemas.orm import OrmSchema
+
 
 class ReviewBase(BaseModel):
     movie_id: int = Field(..., description="영화 ID", example=1)
@@ -12,11 +15,15 @@ class ReviewBase(BaseModel):
 class ReviewCreate(ReviewBase):
     pass
 
-class Review(ReviewBase):
+class Review(ReviewBase, OrmSchema):
     id: int = Field(..., description="리뷰 ID")
     sentiment: Optional[str] = Field(None, description="감정 분석 결과 (positive/negative/neutral)")
     score: Optional[float] = Field(None, description="감정 점수 (0.0 ~ 1.0)")
+    sentiment_label: Optional[str] = Field(None, description="감정 라벨 (화면 표시용)")
     created_at: Optional[datetime] = None
-    
-    class Config:
-        from_attributes = True
\ No newline at end of file
+    updated_at: Optional[datetime] = None
+    movie: Optional[Movie] = Field(None, description="영화 정보 (전체 리뷰 목록 조회 시)")
+
+class ReviewList(BaseModel):
+    average_score: Optional[float] = Field(None, description="평균 평점")
+    reviews: List[Review]
\ No newline at end of file
@@ -0,0 +1,21 @@
+from datetime import date
+from typing import Dict, List, Optional
+from pydantic import BaseModel, Field
+
+from utils.enums.stats_bucket_enum import StatsBucketEnum
+
+
+class SentimentTrendPoint(BaseModel):
+    period: date = Field(..., description="집계 구간 시작일 (주 단위면 월요일)")
+    review_count: int = Field(..., description="구간 리뷰 수")
+    average_score: Optional[float] = Field(None, description="구간 평균 평점")
+    sentiments: Dict[str, int] = Field(..., description="감정별 리뷰 수")
+
+
+class MovieSentimentStats(BaseModel):
+    movie_id: int = Field(..., description="영화 ID")
+    total_reviews: int = Field(..., description="분석된 리뷰 수")
+    average_score: Optional[float] = Field(None, description="평균 평점")
+    histogram: Dict[str, int] = Field(..., description="감정별 리뷰 수 (전체 기간)")
+    bucket: StatsBucketEnum = Field(..., description="추이 집계 단위")
+    trend: List[SentimentTrendPoint] = Field(..., description="최근 기간 추이 (리뷰가 있는 구간만)")
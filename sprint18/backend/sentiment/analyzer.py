@@ -1,26 +1,101 @@
 
-from transformers import pipeline
+import threading
 
+from sentiment.cache import sentiment_cache
+from sentiment.config import (
+    MODEL_NAME, SENTIMENT_BACKEND, SENTIMENT_ONNX_QUANTIZE, SENTIMENT_REMOTE_TIMEOUT, SENTIMENT_SOCKET,
+)
 from utils.enums.sentiment_enum import SentimentEnum
 
 
-sentiment_pipeline = pipeline("text-classification",
-                              model="tabularisai/multilingual-sentiment-analysis")
+_sentiment_pipeline = None
+_pipeline_backend = SENTIMENT_BACKEND    # _sentiment_pipeline을 만든 백엔드 (추론 서버는 SENTIMENT_SERVER_BACKEND)
+_pipeline_lock = threading.Lock()
 
-def analyze_sentiment(text: str):
-    """리뷰 내용 감정 분석 후 sentiment와 score 반환"""
-    result = sentiment_pipeline(text)
+def pipeline_id(backend: str = SENTIMENT_BACKEND) -> str:
+    """결과 캐시 키에 넣는 모델 식별자 (모델 | 백엔드 | 양자화 여부)"""
+    return f"{MODEL_NAME}|{backend}|{int(SENTIMENT_ONNX_QUANTIZE)}"
+
+def _build_pipeline(backend: str = SENTIMENT_BACKEND):
+    """설정된 백엔드(pytorch / onnx / remote)로 감정 분석 파이프라인 생성"""
+    if backend == "remote":
+        # 모델은 추론 서버 프로세스만 로드하고, 이 프로세스는 소켓으로 요청
+        from sentiment.remote_backend import RemoteSentimentPipeline
+        return RemoteSentimentPipeline(SENTIMENT_SOCKET, timeout=SENTIMENT_REMOTE_TIMEOUT)
+
+    if backend == "onnx":
+        from sentiment.onnx_backend import OnnxSentimentPipeline
+        return OnnxSentimentPipeline.from_pretrained(MODEL_NAME, quantize=SENTIMENT_ONNX_QUANTIZE)
+
+    from transformers import pipeline
+    return pipeline("text-classification", model=MODEL_NAME)
+
+def get_pipeline():
+    """감정 분석 파이프라인 (첫 호출 시 1회만 로드, 프로세스 내 공유)"""
+    global _sentiment_pipeline
+    if _sentiment_pipeline is None:
+        with _pipeline_lock:
+            if _sentiment_pipeline is None:
+                _sentiment_pipeline = _build_pipeline()
+    return _sentiment_pipeline
+
+def set_pipeline(pipeline, backend: str):
+    """미리 만든 파이프라인 사용 (추론 서버가 SENTIMENT_SERVER_BACKEND로 로드한 모델 등)"""
+    global _sentiment_pipeline, _pipeline_backend
+    _sentiment_pipeline, _pipeline_backend = pipeline, backend
+
+def _cache_namespace(pipeline) -> str:
+    # remote는 이 프로세스 설정이 아니라 추론 서버가 실제로 로드한 모델 기준
+    server_model_id = getattr(pipeline, "server_model_id", None)
+    return server_model_id() if server_model_id else pipeline_id(_pipeline_backend)
+
+def warm_up():
+    """모델을 미리 로드하고 더미 추론 1회 실행 (첫 요청 지연 방지)"""
+    get_pipeline()("warm up")
+
+def _to_sentiment(result: dict):
+    """파이프라인 결과 1건을 (sentiment, score)로 변환"""
     # Very Negative, Negative, Neutral, Positive, Very Positive
-    label = result[0]['label'].upper().replace(" ", "_")  # 감정 라벨 
-    score = result[0]['score']     # 확신도 점수 (0.0 ~ 1.0)
-    print(f"analyze_sentiment: label={label}, score={score}")
-    
+    label = result['label'].upper().replace(" ", "_")  # 감정 라벨
+    score = result['score']     # 확신도 점수 (0.0 ~ 1.0)
+
     try:
         sentiment = SentimentEnum[label]
     except KeyError:
-        sentiment = SentimentEnum.NEUTRAL   # 예외 발생 시, 중립 처리        
-        
+        sentiment = SentimentEnum.NEUTRAL   # 예외 발생 시, 중립 처리
+
+    return sentiment, score
+
+def analyze_sentiment(text: str):
+    """리뷰 내용 감정 분석 후 sentiment와 score 반환"""
+    sentiment, score = analyze_sentiment_batch([text])[0]
+    print(f"analyze_sentiment: label={sentiment.value}, score={score}")
     return sentiment, score
-    
-    
-    
\ No newline at end of file
+
+def analyze_sentiment_batch(texts: list[str], batch_size: int = 16):
+    """여러 리뷰를 한 번의 파이프라인 호출로 분석 (입력 순서 유지)
+
+    캐시에 있는 텍스트와 배치 내 중복 텍스트는 추론하지 않는다.
+    """
+    if not texts:
+        return []
+    pipeline = get_pipeline()
+    if not sentiment_cache.enabled:
+        results = pipeline(list(texts), batch_size=batch_size)
+        return [_to_sentiment(result) for result in results]
+
+    namespace = _cache_namespace(pipeline)
+    keys = [sentiment_cache.key(text, namespace) for text in texts]
+    found = sentiment_cache.get_many(keys)
+
+    # 캐시 미스만 (중복 제거 후) 추론
+    missing = {key: text for key, text in zip(keys, texts) if key not in found}
+    if missing:
+        results = pipeline(list(missing.values()), batch_size=batch_size)
+        computed = {key: _to_sentiment(result) for key, result in zip(missing, results)}
+        # 추론 중 추론 서버가 다른 모델로 다시 시작됐으면 이전 모델의 키로 저장하지 않음
+        if _cache_namespace(pipeline) == namespace:
+            sentiment_cache.set_many(computed)
+        found.update(computed)
+
+    return [found[key] for key in keys]
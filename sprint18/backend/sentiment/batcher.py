@@ -0,0 +1,113 @@
+
+import asyncio
+import os
+
+from sentiment.analyzer import analyze_sentiment_batch
+
+
+class SentimentBatcher:
+    """동시에 들어온 리뷰를 잠깐 모아 한 번의 배치 추론으로 처리하는 큐
+
+    - 첫 요청이 들어온 뒤 max_wait_ms 동안 또는 max_batch_size개가 찰 때까지 모은다.
+    - 추론은 워커 스레드에서 실행하므로 이벤트 루프를 막지 않는다.
+    - 각 호출자는 자신의 future로 (sentiment, score)를 돌려받는다.
+    """
+    def __init__(self, max_batch_size: int = 16, max_wait_ms: float = 10):
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait = max(0.0, max_wait_ms) / 1000
+        self._queue: asyncio.Queue | None = None
+        self._worker: asyncio.Task | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def start(self):
+        """현재 이벤트 루프에서 배치 워커 시작 (이미 실행 중이면 무시)"""
+        loop = asyncio.get_running_loop()
+        if self._worker and not self._worker.done() and self._loop is loop:
+            return
+        self._loop = loop
+        self._queue = asyncio.Queue()
+        self._worker = loop.create_task(self._run())
+
+    async def stop(self):
+        """워커 종료, 처리 중이던 배치와 대기 중인 요청은 예외로 끝낸다 (호출자가 계속 기다리지 않도록)"""
+        if self._worker is None:
+            return
+        self._worker.cancel()
+        try:
+            await self._worker
+        except asyncio.CancelledError:
+            pass
+        pending = []
+        while self._queue is not None and not self._queue.empty():
+            pending.append(self._queue.get_nowait())
+        _fail(pending)
+        self._worker = None
+        self._queue = None
+
+    async def submit(self, text: str):
+        """리뷰 1건 분석 요청 → 배치 처리 후 (sentiment, score) 반환"""
+        self.start()
+        future = self._loop.create_future()
+        self._queue.put_nowait((text, future))
+        return await future
+
+    async def _run(self):
+        batch = []
+        try:
+            while True:
+                batch = [await self._queue.get()]
+                deadline = self._loop.time() + self.max_wait
+
+                # 대기 시간 안에 들어온 요청을 최대 배치 크기까지 모은다
+                while len(batch) < self.max_batch_size:
+                    if not self._queue.empty():
+                        batch.append(self._queue.get_nowait())
+                        continue
+                    timeout = deadline - self._loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                    except asyncio.TimeoutError:
+                        break
+
+                await self._process(batch)
+                batch = []
+        except asyncio.CancelledError:
+            # 모으는 중이거나 추론 중이던 배치 (큐에서 이미 꺼낸 요청)
+            _fail(batch)
+            raise
+
+    async def _process(self, batch: list):
+        # 이미 취소된 요청(클라이언트 연결 종료 등)은 추론에서 제외
+        batch = [(text, future) for text, future in batch if not future.done()]
+        if not batch:
+            return
+
+        texts = [text for text, _ in batch]
+        try:
+            results = await asyncio.to_thread(
+                analyze_sentiment_batch, texts, self.max_batch_size
+            )
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+
+def _fail(batch: list):
+    """종료로 처리하지 못한 요청의 future를 예외로 완료"""
+    for _, future in batch:
+        if not future.done():
+            future.set_exception(RuntimeError("감정 분석 배치 처리가 중단되었습니다."))
+
+
+sentiment_batcher = SentimentBatcher(
+    max_batch_size=int(os.getenv("SENTIMENT_MAX_BATCH_SIZE", "16")),
+    max_wait_ms=float(os.getenv("SENTIMENT_MAX_WAIT_MS", "10")),
+)
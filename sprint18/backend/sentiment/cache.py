@@ -0,0 +1,143 @@
+
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+import unicodedata
+from collections import OrderedDict
+from datetime import datetime, timezone
+
+from utils.enums.sentiment_enum import SentimentEnum
+
+
+_WHITESPACE = re.compile(r"\s+")
+
+def normalize_text(text: str) -> str:
+    """캐시 키용 정규화: 유니코드 NFKC + 공백 정리"""
+    return _WHITESPACE.sub(" ", unicodedata.normalize("NFKC", text or "")).strip()
+
+
+class SentimentCache:
+    """리뷰 텍스트 → (sentiment, score) 결과 캐시
+
+    - 1단계: 프로세스 내 LRU (max_size개)
+    - 2단계(선택): SQLite 테이블 (db_path 지정 시, 여러 워커가 공유)
+    키는 모델 식별자(namespace, remote 백엔드는 추론 서버가 로드한 모델 기준) + 정규화된 텍스트의 SHA-256 해시.
+    """
+    def __init__(self, max_size: int = 10000, db_path: str | None = None):
+        self.max_size = max_size
+        self.db_path = db_path
+        self._lru: OrderedDict[str, tuple] = OrderedDict()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self.memory_hits = 0
+        self.db_hits = 0
+        self.misses = 0
+
+        if self.db_path:
+            with self._connect() as conn:
+                conn.execute(
+                    """CREATE TABLE IF NOT EXISTS sentiment_cache (
+                        key TEXT PRIMARY KEY,
+                        sentiment TEXT NOT NULL,
+                        score REAL NOT NULL,
+                        created_at TEXT NOT NULL
+                    )"""
+                )
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_size > 0 or bool(self.db_path)
+
+    def key(self, text: str, namespace: str) -> str:
+        raw = f"{namespace}|{normalize_text(text)}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _connect(self) -> sqlite3.Connection:
+        """스레드별 SQLite 연결 (추론은 워커 스레드에서 실행되므로)"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=5)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def get_many(self, keys: list[str]) -> dict[str, tuple]:
+        """캐시 조회 (LRU → SQLite 순), 찾은 키만 반환"""
+        found = {}
+        with self._lock:
+            for key in keys:
+                if key in found:
+                    continue
+                value = self._lru.get(key)
+                if value is not None:
+                    self._lru.move_to_end(key)
+                    found[key] = value
+                    self.memory_hits += 1
+
+        remaining = [k for k in dict.fromkeys(keys) if k not in found]
+        if remaining and self.db_path:
+            placeholders = ",".join("?" * len(remaining))
+            rows = self._connect().execute(
+                f"SELECT key, sentiment, score FROM sentiment_cache WHERE key IN ({placeholders})",
+                remaining,
+            ).fetchall()
+            db_found = {key: (SentimentEnum[sentiment], score) for key, sentiment, score in rows}
+            found.update(db_found)
+            with self._lock:
+                self.db_hits += len(db_found)
+                for key, value in db_found.items():
+                    self._put(key, value)
+            remaining = [k for k in remaining if k not in db_found]
+
+        with self._lock:
+            self.misses += len(remaining)
+        return found
+
+    def set_many(self, items: dict[str, tuple]):
+        """분석 결과 저장 (LRU + SQLite)"""
+        if not items:
+            return
+        with self._lock:
+            for key, value in items.items():
+                self._put(key, value)
+
+        if self.db_path:
+            now = datetime.now(timezone.utc).isoformat()
+            conn = self._connect()
+            with conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO sentiment_cache (key, sentiment, score, created_at) VALUES (?, ?, ?, ?)",
+                    [(key, sentiment.value, score, now) for key, (sentiment, score) in items.items()],
+                )
+
+    def _put(self, key: str, value: tuple):
+        if self.max_size <= 0:
+            return
+        self._lru[key] = value
+        self._lru.move_to_end(key)
+        while len(self._lru) > self.max_size:
+            self._lru.popitem(last=False)
+
+    def stats(self) -> dict:
+        """캐시 적중/미스 카운터"""
+        with self._lock:
+            hits = self.memory_hits + self.db_hits
+            lookups = hits + self.misses
+            return {
+                "memory_hits": self.memory_hits,
+                "db_hits": self.db_hits,
+                "misses": self.misses,
+                "hit_rate": round(hits / lookups, 4) if lookups else None,
+                "memory_size": len(self._lru),
+                "memory_max_size": self.max_size,
+                "persistent": bool(self.db_path),
+            }
+
+
+sentiment_cache = SentimentCache(
+    max_size=int(os.getenv("SENTIMENT_CACHE_SIZE", "10000")),
+    db_path=os.getenv("SENTIMENT_CACHE_DB") or None,
+)
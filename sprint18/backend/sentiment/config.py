@@ -0,0 +1,25 @@
+
+import os
+
+
+# 감정 분석 모델 (HF Hub 이름)
+MODEL_NAME = os.getenv("SENTIMENT_MODEL", "tabularisai/multilingual-sentiment-analysis")
+
+# 추론 백엔드: pytorch(transformers.pipeline) / onnx(onnxruntime) / remote(추론 서버 프로세스에 요청)
+SENTIMENT_BACKEND = os.getenv("SENTIMENT_BACKEND", "pytorch").lower()
+
+# remote 백엔드: 추론 서버(python -m sentiment.server) Unix 소켓 경로 / 요청 제한 시간(초)
+SENTIMENT_SOCKET = os.getenv("SENTIMENT_SOCKET", "/tmp/movie-sentiment.sock")
+SENTIMENT_REMOTE_TIMEOUT = float(os.getenv("SENTIMENT_REMOTE_TIMEOUT", "30"))
+
+# 추론 서버가 모델을 실행할 백엔드: pytorch / onnx
+SENTIMENT_SERVER_BACKEND = os.getenv("SENTIMENT_SERVER_BACKEND", "pytorch").lower()
+
+# onnx 백엔드에서 int8 동적 양자화 모델 사용 여부
+SENTIMENT_ONNX_QUANTIZE = os.getenv("SENTIMENT_ONNX_QUANTIZE", "false").lower() in ("1", "true", "yes")
+
+# sync: 요청 안에서 바로 분석 / deferred: 저장 후 백그라운드 워커가 분석
+SENTIMENT_MODE = os.getenv("SENTIMENT_MODE", "sync").lower()
+
+# 앱 시작(lifespan) 시 모델 미리 로드 여부
+SENTIMENT_WARMUP = os.getenv("SENTIMENT_WARMUP", "true").lower() in ("1", "true", "yes")
@@ -0,0 +1,180 @@
+
+import argparse
+import inspect
+import os
+
+import numpy as np
+import onnxruntime as ort
+from transformers import AutoConfig, AutoTokenizer
+
+from sentiment.config import MODEL_NAME
+
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+ONNX_DIR = os.getenv("SENTIMENT_ONNX_DIR", os.path.join(BASE_DIR, "onnx"))
+
+# 파리티 체크용 기본 문장
+PARITY_TEXTS = [
+    "이 영화 정말 재미있어요!",
+    "최고!",
+    "재밌어요",
+    "그냥 그랬어요. 시간 때우기용.",
+    "돈이 아까운 최악의 영화였습니다.",
+    "배우들 연기는 좋았지만 스토리가 너무 지루했어요.",
+    "An absolute masterpiece, I cried twice.",
+    "Boring and way too long.",
+]
+
+
+def onnx_model_path(quantize: bool = False) -> str:
+    """ONNX 모델 파일 경로 (quantize=True면 int8 동적 양자화 모델)"""
+    return os.path.join(ONNX_DIR, "model.int8.onnx" if quantize else "model.onnx")
+
+
+def export_onnx(model_name: str, output_path: str | None = None) -> str:
+    """HF 모델을 ONNX로 내보내기 (배치/시퀀스 길이 동적 축)"""
+    import torch
+    from transformers import AutoModelForSequenceClassification
+
+    output_path = output_path or onnx_model_path()
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+
+    tokenizer = AutoTokenizer.from_pretrained(model_name)
+    model = AutoModelForSequenceClassification.from_pretrained(model_name)
+    model.eval()
+
+    dummy = tokenizer(PARITY_TEXTS[:2], padding=True, truncation=True, return_tensors="pt")
+    # 입력 이름은 토크나이저 출력 순서가 아니라 forward 인자 순서로 (token_type_ids 등 위치가 모델마다 다름)
+    input_names = [name for name in inspect.signature(model.forward).parameters if name in dummy]
+    inputs = {name: dummy[name] for name in input_names}
+    dynamic_axes = {name: {0: "batch", 1: "sequence"} for name in input_names}
+    dynamic_axes["logits"] = {0: "batch"}
+
+    with torch.no_grad():
+        torch.onnx.export(
+            model,
+            (inputs,),  # 마지막 dict는 키워드 인자로 전달됨
+            output_path,
+            input_names=input_names,
+            output_names=["logits"],
+            dynamic_axes=dynamic_axes,
+            opset_version=17,
+        )
+    print(f"✅ ONNX 모델 저장: {output_path}")
+    return output_path
+
+
+def quantize_onnx(model_path: str, output_path: str | None = None) -> str:
+    """ONNX 모델 가중치를 int8 동적 양자화"""
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+
+    output_path = output_path or onnx_model_path(quantize=True)
+    quantize_dynamic(model_path, output_path, weight_type=QuantType.QInt8)
+    print(f"✅ 양자화 모델 저장: {output_path}")
+    return output_path
+
+
+class OnnxSentimentPipeline:
+    """onnxruntime 기반 text-classification 파이프라인
+
+    transformers.pipeline과 같은 형식([{"label", "score"}, ...])을 반환하므로
+    analyzer에서 PyTorch 파이프라인과 바꿔 끼워 사용할 수 있다.
+    """
+    def __init__(self, session: ort.InferenceSession, tokenizer, id2label: dict, max_length: int = 512):
+        self.session = session
+        self.tokenizer = tokenizer
+        self.id2label = id2label
+        self.max_length = max_length
+        self.input_names = [i.name for i in session.get_inputs()]
+
+    @classmethod
+    def from_pretrained(cls, model_name: str, quantize: bool = False):
+        """모델 로드 (ONNX 파일이 없으면 내보내기/양자화 후 로드)"""
+        model_path = onnx_model_path(quantize)
+        if not os.path.exists(model_path):
+            fp32_path = onnx_model_path()
+            if not os.path.exists(fp32_path):
+                export_onnx(model_name, fp32_path)
+            if quantize:
+                quantize_onnx(fp32_path, model_path)
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        intra_threads = int(os.getenv("SENTIMENT_ONNX_THREADS", "0"))
+        if intra_threads > 0:
+            options.intra_op_num_threads = intra_threads
+
+        session = ort.InferenceSession(
+            model_path, sess_options=options, providers=ort.get_available_providers()
+        )
+        tokenizer = AutoTokenizer.from_pretrained(model_name)
+        id2label = AutoConfig.from_pretrained(model_name).id2label
+        return cls(session, tokenizer, id2label)
+
+    def __call__(self, texts, batch_size: int = 16, **kwargs):
+        if isinstance(texts, str):
+            texts = [texts]
+
+        results = []
+        for start in range(0, len(texts), batch_size):
+            chunk = texts[start:start + batch_size]
+            encoded = self.tokenizer(
+                chunk, padding=True, truncation=True,
+                max_length=self.max_length, return_tensors="np",
+            )
+            inputs = {name: encoded[name].astype(np.int64) for name in self.input_names}
+            logits = self.session.run(None, inputs)[0]
+
+            # softmax (수치 안정화를 위해 최대값 차감)
+            exp = np.exp(logits - logits.max(axis=-1, keepdims=True))
+            probs = exp / exp.sum(axis=-1, keepdims=True)
+            for row in probs:
+                idx = int(row.argmax())
+                results.append({"label": self.id2label[idx], "score": float(row[idx])})
+        return results
+
+
+def check_parity(model_name: str, quantize: bool = False, texts: list[str] | None = None, tolerance: float = 0.05):
+    """PyTorch 파이프라인과 ONNX 파이프라인의 라벨/점수 비교"""
+    from transformers import pipeline
+
+    texts = texts or PARITY_TEXTS
+    torch_results = pipeline("text-classification", model=model_name)(texts)
+    onnx_results = OnnxSentimentPipeline.from_pretrained(model_name, quantize=quantize)(texts)
+
+    mismatches = []
+    max_diff = 0.0
+    for text, expected, actual in zip(texts, torch_results, onnx_results):
+        diff = abs(expected["score"] - actual["score"])
+        max_diff = max(max_diff, diff)
+        if expected["label"] != actual["label"] or diff > tolerance:
+            mismatches.append({"text": text, "pytorch": expected, "onnx": actual})
+
+    return {
+        "total": len(texts),
+        "label_agreement": 1 - sum(m["pytorch"]["label"] != m["onnx"]["label"] for m in mismatches) / len(texts),
+        "max_score_diff": max_diff,
+        "mismatches": mismatches,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="감정 분석 모델 ONNX 내보내기 / 양자화 / 파리티 체크")
+    parser.add_argument("--model", default=MODEL_NAME, help="HF 모델 이름")
+    parser.add_argument("--export", action="store_true", help="ONNX 모델 내보내기")
+    parser.add_argument("--quantize", action="store_true", help="int8 동적 양자화 모델 사용")
+    parser.add_argument("--check", action="store_true", help="PyTorch 결과와 비교")
+    parser.add_argument("--tolerance", type=float, default=0.05, help="허용 점수 차이")
+    args = parser.parse_args()
+
+    if args.export:
+        path = export_onnx(args.model)
+        if args.quantize:
+            quantize_onnx(path)
+
+    if args.check:
+        report = check_parity(args.model, quantize=args.quantize, tolerance=args.tolerance)
+        print(f"라벨 일치율: {report['label_agreement']:.3f}, 최대 점수 차이: {report['max_score_diff']:.4f}")
+        for m in report["mismatches"]:
+            print(f"  ❌ {m['text']} | pytorch={m['pytorch']} | onnx={m['onnx']}")
+        raise SystemExit(1 if report["mismatches"] else 0)
@@ -0,0 +1,100 @@
+
+import socket
+import struct
+import threading
+import time
+
+import orjson
+
+
+# 메시지 형식: 4바이트 길이(big endian) + JSON 본문
+_HEADER = struct.Struct(">I")
+
+
+def encode_message(payload: dict) -> bytes:
+    body = orjson.dumps(payload)
+    return _HEADER.pack(len(body)) + body
+
+
+def _recv_exact(sock: socket.socket, size: int) -> bytes:
+    chunks = []
+    while size:
+        chunk = sock.recv(size)
+        if not chunk:
+            raise ConnectionError("추론 서버 연결이 끊어졌습니다.")
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b"".join(chunks)
+
+
+def recv_message(sock: socket.socket) -> dict:
+    (size,) = _HEADER.unpack(_recv_exact(sock, _HEADER.size))
+    return orjson.loads(_recv_exact(sock, size))
+
+
+class RemoteSentimentPipeline:
+    """추론 서버(python -m sentiment.server)에 Unix 소켓으로 요청하는 파이프라인
+
+    transformers pipeline과 같은 형식으로 호출/반환하므로 analyzer의 캐시 / 배치 처리를 그대로 쓴다.
+    연결은 스레드마다 1개를 재사용하고, 끊어진 연결은 1번 다시 연결해 재시도한다.
+    결과 캐시 키에는 이 프로세스 설정 대신 추론 서버가 알려 주는 모델 식별자를 쓴다. (server_model_id)
+    """
+    def __init__(self, socket_path: str, timeout: float = 30.0, connect_timeout: float = 30.0):
+        self.socket_path = socket_path
+        self.timeout = timeout
+        self.connect_timeout = connect_timeout
+        self._local = threading.local()
+
+    def _connect(self) -> socket.socket:
+        # 추론 서버가 아직 모델을 로드 중일 수 있으므로 connect_timeout 동안 재시도
+        deadline = time.monotonic() + self.connect_timeout
+        while True:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.settimeout(self.timeout)
+            try:
+                sock.connect(self.socket_path)
+                return sock
+            except (FileNotFoundError, ConnectionRefusedError):
+                sock.close()
+                if time.monotonic() >= deadline:
+                    raise
+                time.sleep(0.2)
+
+    def _socket(self) -> socket.socket:
+        sock = getattr(self._local, "sock", None)
+        if sock is None:
+            sock = self._local.sock = self._connect()
+        return sock
+
+    def _close(self):
+        sock = getattr(self._local, "sock", None)
+        if sock is not None:
+            sock.close()
+            self._local.sock = None
+
+    def _request(self, payload: dict) -> dict:
+        for attempt in range(2):
+            try:
+                sock = self._socket()
+                sock.sendall(encode_message(payload))
+                return recv_message(sock)
+            except OSError as e:  # ConnectionError / 타임아웃 포함
+                self._close()
+                if attempt:
+                    raise RuntimeError(f"감정 분석 추론 서버 요청 실패: {e}") from e
+
+    def server_model_id(self) -> str:
+        """추론 서버가 로드한 모델 식별자 (모델 | 백엔드 | 양자화 여부)
+
+        추론 서버가 다른 설정으로 다시 시작됐을 수 있으므로 캐시에 남겨 두지 않고 매번 묻는다.
+        """
+        return self._request({"info": True})["model_id"]
+
+    def __call__(self, texts, batch_size: int = 16, **kwargs):
+        if isinstance(texts, str):
+            texts = [texts]
+
+        response = self._request({"texts": list(texts)})
+        if "error" in response:
+            raise RuntimeError(f"감정 분석 추론 서버 오류: {response['error']}")
+        return [{"label": label, "score": score} for label, score in response["results"]]
@@ -0,0 +1,103 @@
+"""감정 분석 추론 서버: 모델을 한 프로세스에서만 로드하고 여러 API 워커가 Unix 소켓으로 공유
+
+백엔드 디렉토리에서 실행:
+    python -m sentiment.server --socket /tmp/movie-sentiment.sock
+    SENTIMENT_BACKEND=remote SENTIMENT_SOCKET=/tmp/movie-sentiment.sock \
+    RESPONSE_CACHE_BACKEND=redis RESPONSE_CACHE_REDIS_URL=redis://localhost:6379/0 uvicorn main:app --workers 4
+
+uvicorn --workers N 으로 실행하면 워커마다 모델을 로드해 메모리가 N배가 되므로,
+모델은 이 서버(SENTIMENT_SERVER_BACKEND: pytorch / onnx)만 로드하고 API 워커는 remote 백엔드로 요청한다.
+여러 워커에서 동시에 들어온 요청은 SentimentBatcher로 다시 묶어 배치 추론한다.
+캐시 / 백그라운드 작업 설정 조건은 main.check_multiworker_config 참고.
+"""
+import argparse
+import asyncio
+import os
+import signal
+
+import orjson
+
+import sentiment.analyzer as analyzer
+from sentiment.batcher import sentiment_batcher
+from sentiment.config import SENTIMENT_SERVER_BACKEND, SENTIMENT_SOCKET
+from sentiment.remote_backend import encode_message
+
+
+# 열려 있는 API 워커 연결 (종료 시 닫음)
+_connections: set[asyncio.StreamWriter] = set()
+
+
+async def handle_connection(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+    """연결 1개 처리 (연결 재사용)
+
+    요청 {"texts": [...]} → 응답 {"results": [[라벨, 점수], ...]}
+    요청 {"info": true} → 응답 {"model_id": 모델 식별자} (API 워커의 결과 캐시 키 구분용)
+    """
+    _connections.add(writer)
+    try:
+        while True:
+            try:
+                header = await reader.readexactly(4)
+                body = await reader.readexactly(int.from_bytes(header, "big"))
+            except asyncio.IncompleteReadError:
+                return
+            try:
+                payload = orjson.loads(body)
+                if payload.get("info"):
+                    response = {"model_id": analyzer.pipeline_id(SENTIMENT_SERVER_BACKEND)}
+                else:
+                    results = await asyncio.gather(*(sentiment_batcher.submit(text or "") for text in payload["texts"]))
+                    response = {"results": [[sentiment.value, score] for sentiment, score in results]}
+            except Exception as e:
+                response = {"error": f"{e.__class__.__name__}: {e}"}
+            writer.write(encode_message(response))
+            await writer.drain()
+    except ConnectionError:
+        pass
+    finally:
+        _connections.discard(writer)
+        writer.close()
+
+
+async def serve(socket_path: str = SENTIMENT_SOCKET, pipeline=None):
+    """모델 로드 후 socket_path에서 요청 대기 (SIGINT / SIGTERM 으로 종료)"""
+    if pipeline is None:
+        print(f"🧠 감정 분석 모델 로드 중 ({SENTIMENT_SERVER_BACKEND})")
+        pipeline = await asyncio.to_thread(analyzer._build_pipeline, SENTIMENT_SERVER_BACKEND)
+    analyzer.set_pipeline(pipeline, SENTIMENT_SERVER_BACKEND)
+    await asyncio.to_thread(analyzer.warm_up)
+    sentiment_batcher.start()
+
+    # 이전 실행에서 남은 소켓 파일 제거
+    if os.path.exists(socket_path):
+        os.remove(socket_path)
+    server = await asyncio.start_unix_server(handle_connection, path=socket_path)
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+
+    print(f"🚀 감정 분석 추론 서버 시작: {socket_path}")
+    try:
+        await stop.wait()
+    finally:
+        print("🛑 감정 분석 추론 서버 종료 중")
+        server.close()
+        for writer in list(_connections):
+            writer.close()
+        await server.wait_closed()
+        await sentiment_batcher.stop()
+        if os.path.exists(socket_path):
+            os.remove(socket_path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="감정 분석 추론 서버 (Unix 소켓)")
+    parser.add_argument("--socket", default=SENTIMENT_SOCKET, help="Unix 소켓 경로")
+    args = parser.parse_args()
+    asyncio.run(serve(args.socket))
+
+
+if __name__ == "__main__":
+    main()
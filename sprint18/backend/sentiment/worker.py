@@ -0,0 +1,173 @@
+
+import asyncio
+import os
+
+from sqlalchemy import case, select, update
+
+from model.database import AsyncSessionLocal
+from model.models import Review
+from sentiment.analyzer import analyze_sentiment_batch
+from services.review_stats_service import ReviewStatsService
+from utils.response_cache import response_cache
+
+
+def pending_reviews_query(limit: int, exclude=()):
+    """분석 대기 리뷰 조회 (id 순)
+
+    대기 리뷰의 sentiment는 모두 NULL이므로 ORDER BY sentiment, id 는 id 순과 같고,
+    부분 인덱스 ix_review_pending_sentiment (sentiment, id) 순서를 그대로 써서 정렬 없이 읽는다.
+    """
+    query = (
+        select(Review.id, Review.content)
+        .where(Review.sentiment.is_(None), Review.deleted_at.is_(None))
+        .order_by(Review.sentiment, Review.id)
+        .limit(limit)
+    )
+    if exclude:
+        query = query.where(Review.id.not_in(exclude))
+    return query
+
+
+class SentimentWorker:
+    """sentiment가 비어 있는(분석 대기) 리뷰를 모아 배치 분석 후 일괄 UPDATE
+
+    배치 분석이 실패하면 리뷰를 1건씩 다시 분석해 실패한 리뷰만 골라내고,
+    max_retries번 실패한 리뷰는 (프로세스가 재시작될 때까지) 대기 목록에서 제외해 뒤의 리뷰를 막지 않는다.
+    연속으로 실패하면 poll_interval부터 max_backoff까지 대기 시간을 2배씩 늘린다.
+    """
+    def __init__(self, batch_size: int = 64, poll_interval: float = 5.0, max_retries: int = 5, max_backoff: float = 300.0):
+        self.batch_size = max(1, batch_size)
+        self.poll_interval = poll_interval
+        self.max_retries = max(1, max_retries)
+        self.max_backoff = max(poll_interval, max_backoff)
+        self._failures: dict[int, int] = {}   # 리뷰 id → 연속 분석 실패 횟수
+        self._skipped: set[int] = set()       # 실패 횟수를 넘겨 제외한 리뷰 id
+        self._failed_runs = 0
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+    def start(self):
+        if self._task is None or self._task.done():
+            self._wakeup = asyncio.Event()
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    def notify(self):
+        """새 리뷰가 저장되었음을 알려 대기 중인 워커를 깨운다"""
+        self._wakeup.set()
+
+    async def _run(self):
+        while True:
+            try:
+                processed = await self.run_once()
+                self._failed_runs = 0
+            except Exception as e:
+                # 모델 / 추론 서버 장애 등: 알림으로 깨우지 않고 대기 시간을 늘려 재시도
+                self._failed_runs += 1
+                delay = min(self.poll_interval * 2 ** (self._failed_runs - 1), self.max_backoff)
+                print(f"⚠️ 감정 분석 워커 오류 ({self._failed_runs}회 연속, {delay:g}초 후 재시도): {e}")
+                await asyncio.sleep(delay)
+                continue
+
+            # 남은 대기 리뷰가 있으면 바로 다음 배치, 없으면 알림/폴링 대기
+            if processed >= self.batch_size:
+                continue
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+
+    async def run_once(self) -> int:
+        """대기 리뷰 1배치 처리 후 처리 건수 반환
+
+        추론하는 동안 DB 연결(SQLite는 읽기 스냅샷)을 잡고 있지 않도록 조회 / 반영 세션을 나눈다.
+        그 사이 삭제되거나 다른 프로세스가 분석한 리뷰는 UPDATE 조건에서 빠진다.
+        """
+        async with AsyncSessionLocal() as db:
+            rows = (await db.execute(pending_reviews_query(self.batch_size, self._skipped))).all()
+        if not rows:
+            return 0
+
+        analyzed = await self._analyze(rows)
+        sentiments = {review_id: sentiment.value for review_id, (sentiment, _) in analyzed.items()}
+        scores = {review_id: score for review_id, (_, score) in analyzed.items()}
+
+        async with AsyncSessionLocal() as db:
+            # 배치 전체를 한 번의 UPDATE 문으로 반영
+            updated = (await db.execute(
+                update(Review)
+                .where(
+                    Review.id.in_(sentiments.keys()),
+                    Review.sentiment.is_(None),
+                    Review.deleted_at.is_(None),
+                )
+                .values(
+                    sentiment=case(sentiments, value=Review.id),
+                    score=case(scores, value=Review.id),
+                )
+                .returning(Review.movie_id, Review.sentiment, Review.score, Review.created_at)
+                .execution_options(synchronize_session=False)
+            )).all()
+
+            # 실제 반영된 리뷰만 평점 집계에 추가
+            await ReviewStatsService(db).add(updated)
+            await db.commit()
+        if updated:
+            await response_cache.invalidate("review")
+        return len(rows)
+
+    async def _analyze(self, rows) -> dict:
+        """리뷰 id → (감정, 점수), 분석에 실패한 리뷰는 빠진다
+
+        배치 전체가 실패하면 1건씩 다시 분석한다. 첫 리뷰부터 실패하면 모델 장애로 보고 예외를 다시 던진다.
+        """
+        try:
+            results = await asyncio.to_thread(analyze_sentiment_batch, [content or "" for _, content in rows])
+        except Exception as e:
+            if len(rows) == 1:
+                self._record_failure(rows[0].id, e)
+                raise
+            results = None
+
+        if results is not None:
+            analyzed = {review_id: result for (review_id, _), result in zip(rows, results)}
+        else:
+            analyzed = {}
+            for review_id, content in rows:
+                try:
+                    analyzed[review_id] = (await asyncio.to_thread(analyze_sentiment_batch, [content or ""]))[0]
+                except Exception as e:
+                    self._record_failure(review_id, e)
+                    if not analyzed:
+                        raise
+
+        for review_id in analyzed:
+            self._failures.pop(review_id, None)
+        return analyzed
+
+    def _record_failure(self, review_id: int, error: Exception):
+        count = self._failures.get(review_id, 0) + 1
+        if count < self.max_retries:
+            self._failures[review_id] = count
+            return
+        self._failures.pop(review_id, None)
+        self._skipped.add(review_id)
+        print(f"⚠️ 감정 분석 {count}회 실패로 리뷰를 건너뜁니다: review_id={review_id} ({error})")
+
+
+sentiment_worker = SentimentWorker(
+    batch_size=int(os.getenv("SENTIMENT_WORKER_BATCH_SIZE", "64")),
+    poll_interval=float(os.getenv("SENTIMENT_WORKER_POLL_SECONDS", "5")),
+    max_retries=int(os.getenv("SENTIMENT_WORKER_MAX_RETRIES", "5")),
+    max_backoff=float(os.getenv("SENTIMENT_WORKER_MAX_BACKOFF_SECONDS", "300")),
+)
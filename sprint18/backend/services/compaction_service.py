@@ -0,0 +1,137 @@
+
+import asyncio
+import os
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import DateTime, delete, insert, literal, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from model.database import AsyncSessionLocal
+from model.models import Movie, Review, movie_archive, movie_genre_archive, movie_genre_table, review_archive
+
+
+class CompactionService:
+    """soft delete 후 보관 기간이 지난 행을 보관 테이블(또는 Parquet 파일)로 옮기고 원본에서 삭제
+
+    target: table(같은 DB의 *_archive 테이블) / parquet(output_dir/<테이블>/*.parquet, pyarrow 필요)
+    배치마다 commit 하므로 중간에 멈춰도 다시 실행하면 남은 행부터 이어서 처리한다.
+    table 대상으로 옮긴 리뷰는 review_archive에서 계속 중복 확인되지만, parquet 대상은 DB에서 빠지므로
+    같은 작성자가 같은 영화에 다시 리뷰를 쓸 수 있다.
+    """
+    def __init__(self, db: AsyncSession, target: str = "table", output_dir: str = "archive"):
+        self.db = db
+        self.target = target
+        self.output_dir = output_dir
+
+    async def compact(self, older_than_days: int, batch_size: int = 1000) -> dict:
+        """deleted_at이 older_than_days일보다 오래된 리뷰 / 영화(+장르 매핑) 이동, 테이블별 이동 건수 반환"""
+        cutoff = datetime.now(timezone.utc) - timedelta(days=older_than_days)
+        moved = {"review": 0, "movie": 0, "movie_genres": 0}
+
+        # 리뷰 먼저: 영화는 원본에 남은 리뷰가 하나도 없을 때만 옮긴다. (review.movie_id 참조)
+        while True:
+            ids = (await self.db.execute(
+                select(Review.id).where(Review.deleted_at < cutoff).order_by(Review.id).limit(batch_size)
+            )).scalars().all()
+            if not ids:
+                break
+            moved["review"] += await self._move(Review.__table__, review_archive, Review.__table__.c.id.in_(ids))
+            await self.db.commit()
+
+        has_reviews = select(Review.id).where(Review.movie_id == Movie.id).exists()
+        while True:
+            ids = (await self.db.execute(
+                select(Movie.id).where(Movie.deleted_at < cutoff, ~has_reviews).order_by(Movie.id).limit(batch_size)
+            )).scalars().all()
+            if not ids:
+                break
+            moved["movie_genres"] += await self._move(
+                movie_genre_table, movie_genre_archive, movie_genre_table.c.movie_id.in_(ids)
+            )
+            moved["movie"] += await self._move(Movie.__table__, movie_archive, Movie.__table__.c.id.in_(ids))
+            await self.db.commit()
+
+        return moved
+
+    async def _move(self, source, archive, condition) -> int:
+        """condition에 맞는 원본 행을 보관 대상에 쓰고 원본에서 삭제 (commit은 호출한 쪽에서)"""
+        archived_at = datetime.now(timezone.utc)
+        if self.target == "parquet":
+            rows = (await self.db.execute(select(source).where(condition))).mappings().all()
+            if rows:
+                records = [{**row, "archived_at": archived_at} for row in rows]
+                await asyncio.to_thread(self._write_parquet, source.name, records, archived_at)
+        else:
+            columns = [c.name for c in source.columns]
+            await self.db.execute(
+                insert(archive).from_select(
+                    columns + ["archived_at"],
+                    select(*source.columns, literal(archived_at, DateTime(timezone=True))).where(condition),
+                )
+            )
+        result = await self.db.execute(delete(source).where(condition))
+        return result.rowcount
+
+    def _write_parquet(self, table: str, records: list[dict], archived_at: datetime):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        directory = os.path.join(self.output_dir, table)
+        os.makedirs(directory, exist_ok=True)
+        first = records[0].get("id", records[0].get("movie_id"))
+        path = os.path.join(directory, f"{archived_at:%Y%m%d-%H%M%S}-{first}.parquet")
+        pq.write_table(pa.Table.from_pylist(records), path)
+
+
+class CompactionScheduler:
+    """FastAPI lifespan 안에서 interval_hours마다 압축 실행 (interval_hours <= 0 이면 꺼짐)"""
+    def __init__(self, interval_hours: float = 0, retention_days: int = 30, batch_size: int = 1000,
+                 target: str = "table", output_dir: str = "archive"):
+        self.interval_hours = interval_hours
+        self.retention_days = retention_days
+        self.batch_size = max(1, batch_size)
+        self.target = target
+        self.output_dir = output_dir
+        self._task: asyncio.Task | None = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.interval_hours > 0
+
+    def start(self):
+        if self.enabled and (self._task is None or self._task.done()):
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.interval_hours * 3600)
+            try:
+                await self.run_once()
+            except Exception as e:
+                print(f"⚠️ 삭제 데이터 압축 오류: {e}")
+
+    async def run_once(self) -> dict:
+        async with AsyncSessionLocal() as db:
+            moved = await CompactionService(db, self.target, self.output_dir).compact(self.retention_days, self.batch_size)
+        if any(moved.values()):
+            print(f"🧹 삭제 데이터 압축: {moved}")
+        return moved
+
+
+compaction_scheduler = CompactionScheduler(
+    interval_hours=float(os.getenv("COMPACTION_INTERVAL_HOURS", "0")),
+    retention_days=int(os.getenv("COMPACTION_RETENTION_DAYS", "30")),
+    batch_size=int(os.getenv("COMPACTION_BATCH_SIZE", "1000")),
+    target=os.getenv("COMPACTION_TARGET", "table").lower(),
+    output_dir=os.getenv("COMPACTION_DIR", "archive"),
+)
@@ -1,29 +1,44 @@
-from datetime import datetime, timezone
+from datetime import date, datetime, timezone
 import re
-from sqlalchemy import func
+from sqlalchemy import func, tuple_, update
 from sqlalchemy.future import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import selectinload
-from torch import ge
+from pydantic import ValidationError
 from schemas.pagination import Pagination
+from utils.bulk_import import BulkImportReport, validation_message
+from utils.count_cache import count_cache
+from utils.genre_cache import genre_cache
+from utils.pagination import paginate
+from utils.profiling import span
+from utils.response_cache import response_cache
+from utils.enums.search_sort_enum import SearchSortEnum
+from utils.enums.stats_bucket_enum import StatsBucketEnum
+from utils.search import apply_search
 from utils.response import ResponseMessage
-from model.models import Genre, Movie
-from schemas.movie import MovieCreate
+from model.database import dialect_insert
+from model.models import Genre, Movie, Review
+from model.search import movie_fts
+from schemas.movie import MovieCreate, MovieGenreInput
+from services.review_stats_service import ReviewStatsService
 import os
 
 class MovieService:
     def __init__(self, db: AsyncSession):
         self.db = db
+        self.genres_created = False  # 이번 트랜잭션에서 새 장르를 생성했는지 (commit 후 장르 캐시 무효화)
     
     async def create(self, movie: MovieCreate):
         # 중복 확인
-        existing = await self.db.execute(
-            select(Movie).where(
-                Movie.title == movie.title,
-                Movie.director == movie.director,
-                Movie.deleted_at.is_(None)
+        with span("duplicate_check"):
+            existing = await self.db.execute(
+                select(Movie).where(
+                    Movie.title == movie.title,
+                    Movie.director == movie.director,
+                    Movie.deleted_at.is_(None)
+                )
             )
-        )
         
         existing = existing.scalars().first()
         
@@ -31,32 +46,11 @@ class MovieService:
             raise ResponseMessage.BAD_REQUEST(f"이미 등록된 영화입니다: {movie.title} ({movie.director})")
         
         # 포스터 경로
-        if movie.poster and "http" in movie.poster:
-            match = re.search(r"(movies/.*)", movie.poster)
-            if match:
-                movie.poster = match.group(1)
-        
-        # 장르
-        genre_list = []
-        for g in movie.genres:
-            if g.id:
-                genre = await self.db.get(Genre, g.id)
-                if not genre:
-                    raise ResponseMessage.NOT_FOUND(f"장르(id={g.id})를 찾을 수 없습니다.")
-            elif g.genre:
-                result = await self.db.execute(
-                    select(Genre).where(Genre.genre == g.genre, Genre.deleted_at.is_(None))
-                )
-                genre = result.scalars().first()
-                if not genre:
-                    genre = Genre(genre=g.genre)
-                    self.db.add(genre)
-                    await self.db.flush()
-            if genre and all(existing_genre.id != genre.id for existing_genre in genre_list):
-                genre_list.append(genre)
-        
+        movie.poster = self._normalize_poster(movie.poster)
         
-                
+        # 장르 (장르 개수와 관계없이 일정한 쿼리 수로 일괄 조회/생성)
+        with span("genres"):
+            genre_list = await self._resolve_genres(movie.genres)
 
         db_movie = Movie(
             title=movie.title,
@@ -66,33 +60,199 @@ class MovieService:
             genres=genre_list
         )
         self.db.add(db_movie)
-        await self.db.commit()
-        await self.db.refresh(db_movie)
+        with span("commit"):
+            await self.db.commit()
+        with span("refresh"):
+            await self.db.refresh(db_movie)
+        count_cache.invalidate("movie")
+        await response_cache.invalidate("movie")
+        self._invalidate_genres()
         return db_movie
     
+    async def _resolve_genres(self, genres: list[MovieGenreInput]) -> list[Genre]:
+        """장르 입력(id / 새 이름)을 Genre 목록으로 변환 (입력 순서 유지, 중복 제거)"""
+        by_id, by_name = await self._load_genres(genres)
+        missing = [g.id for g in genres if g.id and g.id not in by_id]
+        if missing:
+            raise ResponseMessage.NOT_FOUND(f"장르(id={missing[0]})를 찾을 수 없습니다.")
+        return self._pick_genres(genres, by_id, by_name)
+
+    async def _load_genres(self, genres: list[MovieGenreInput]):
+        """장르 일괄 조회/생성 후 (id별, 이름별) Genre 딕셔너리 반환
+
+        id는 IN 쿼리 1번, 이름은 IN 쿼리 1번으로 조회하고
+        없는 이름은 한 번의 다중 행 INSERT (genre 유니크 충돌 시 무시)로 생성한다.
+        """
+        ids = list(dict.fromkeys(g.id for g in genres if g.id))
+        names = list(dict.fromkeys(g.genre for g in genres if not g.id and g.genre))
+
+        by_id = {}
+        if ids:
+            result = await self.db.execute(select(Genre).where(Genre.id.in_(ids)))
+            by_id = {genre.id: genre for genre in result.scalars().all()}
+
+        by_name = {}
+        if names:
+            result = await self.db.execute(
+                select(Genre).where(Genre.genre.in_(names), Genre.deleted_at.is_(None))
+            )
+            by_name = {genre.genre: genre for genre in result.scalars().all()}
+
+            new_names = [name for name in names if name not in by_name]
+            if new_names:
+                await self.db.execute(
+                    dialect_insert(self.db, Genre)
+                    .values([{"genre": name} for name in new_names])
+                    .on_conflict_do_nothing(index_elements=[Genre.genre])
+                )
+                self.genres_created = True
+                result = await self.db.execute(select(Genre).where(Genre.genre.in_(new_names)))
+                by_name.update({genre.genre: genre for genre in result.scalars().all()})
+
+        return by_id, by_name
+
+    @staticmethod
+    def _pick_genres(genres: list[MovieGenreInput], by_id: dict, by_name: dict) -> list[Genre]:
+        genre_list = []
+        for g in genres:
+            genre = by_id.get(g.id) if g.id else by_name.get(g.genre)
+            if genre and all(existing_genre.id != genre.id for existing_genre in genre_list):
+                genre_list.append(genre)
+        return genre_list
+
+    @staticmethod
+    def _normalize_poster(poster: str | None) -> str | None:
+        """포스터 URL이면 버킷 내 경로(movies/...)만 저장"""
+        if poster and "http" in poster:
+            match = re.search(r"(movies/.*)", poster)
+            if match:
+                return match.group(1)
+        return poster
+
+    async def bulk_create(self, rows: list[tuple[int, dict]], report: BulkImportReport):
+        """영화 일괄 등록 (청크 1개 처리 후 commit)
+
+        rows: [(줄 번호, 입력 dict)] / 요청 내 중복과 DB 중복은 집합 쿼리로 한 번에 확인
+        """
+        movies = []
+        for line, record in rows:
+            if isinstance(record.get("genres"), str):
+                # CSV: "액션|드라마" → 새 장르 이름 목록
+                record["genres"] = [{"genre": g.strip()} for g in record["genres"].split("|") if g.strip()]
+            if not record.get("genres"):
+                # 없는 열 / 빈 CSV 칸(None) / 빈 문자열 → 장르 없음
+                record["genres"] = []
+            try:
+                movie = MovieCreate.model_validate(record)
+            except ValidationError as e:
+                report.add_error(line, validation_message(e))
+                continue
+
+            key = ("movie", movie.title, movie.director)
+            if key in report.seen_keys:
+                report.add_error(line, f"요청 내 중복된 영화입니다: {movie.title} ({movie.director})")
+                continue
+            report.seen_keys.add(key)
+            movies.append((line, movie))
+
+        if not movies:
+            return
+
+        # DB 중복 확인 (한 번의 IN 쿼리)
+        existing = await self.db.execute(
+            select(Movie.title, Movie.director).where(
+                tuple_(Movie.title, Movie.director).in_([(m.title, m.director) for _, m in movies]),
+                Movie.deleted_at.is_(None)
+            )
+        )
+        existing = set(existing.all())
+
+        # 장르 (청크 전체를 한 번에 조회/생성)
+        by_id, by_name = await self._load_genres([g for _, m in movies for g in m.genres])
+
+        db_movies = []
+        for line, movie in movies:
+            if (movie.title, movie.director) in existing:
+                report.add_error(line, f"이미 등록된 영화입니다: {movie.title} ({movie.director})")
+                continue
+            missing = [g.id for g in movie.genres if g.id and g.id not in by_id]
+            if missing:
+                report.add_error(line, f"장르(id={missing[0]})를 찾을 수 없습니다.")
+                continue
+            db_movies.append((line, Movie(
+                title=movie.title,
+                director=movie.director,
+                release_date=movie.release_date,
+                poster=self._normalize_poster(movie.poster),
+                genres=self._pick_genres(movie.genres, by_id, by_name)
+            )))
+
+        self.db.add_all([db_movie for _, db_movie in db_movies])
+        try:
+            await self.db.commit()
+        except SQLAlchemyError as e:
+            await self.db.rollback()
+            self.genres_created = False
+            for line, _ in db_movies:
+                report.add_error(line, f"저장 실패: {e.__class__.__name__}")
+            return
+
+        report.created += len(db_movies)
+        count_cache.invalidate("movie")
+        await response_cache.invalidate("movie")
+        self._invalidate_genres()
+    
     async def find_all(self, pagination: Pagination = Pagination()):
         """영화 목록 조회"""
-        offset = pagination.offset()
-        
-        result = await self.db.execute(
+        query = (
             select(Movie)
             .options(selectinload(Movie.genres))
             .where(Movie.deleted_at.is_(None))
-            .order_by(Movie.release_date.desc())
-            .offset(offset)
-            .limit(pagination.page_size)
+            .order_by(Movie.release_date.desc(), Movie.id.desc())
+            .limit(pagination.page_size + 1)  # 다음 페이지 존재 여부 확인용 1건 추가
         )
-        movies = result.scalars().all()
         
-        # 전체 개수
-        count_query = select(func.count(Movie.id)).where(Movie.deleted_at.is_(None))
-        total_count = (await self.db.execute(count_query)).scalar_one()
-        pagination.set_total(total_count)
+        try:
+            cursor = pagination.decode_cursor()
+            if cursor:
+                # 커서 모드: (release_date, id) 보다 뒤에 오는 행부터 조회
+                release_date, last_id = date.fromisoformat(cursor[0]), cursor[1]
+                query = query.where(tuple_(Movie.release_date, Movie.id) < tuple_(release_date, last_id))
+            else:
+                query = query.offset(pagination.offset())
+        except (ValueError, TypeError):
+            raise ResponseMessage.BAD_REQUEST("잘못된 커서입니다.")
         
-
+        # 목록 + 전체 개수 (pagination.count_mode에 따라 계산)
+        count_query = select(func.count(Movie.id)).where(Movie.deleted_at.is_(None))
+        movies, pagination = await paginate(
+            self.db, query, count_query, pagination,
+            cache_key=("movie",), sort_key=lambda m: m.release_date,
+        )
         
         return movies, pagination
     
+    async def search(self, keyword: str, pagination: Pagination = Pagination(), sort: SearchSortEnum = SearchSortEnum.RANK):
+        """영화 검색 (제목 / 감독, FTS5 순위 정렬)"""
+        query = (
+            select(Movie)
+            .options(selectinload(Movie.genres))
+            .where(Movie.deleted_at.is_(None))
+            .order_by(Movie.release_date.desc(), Movie.id.desc())
+            .limit(pagination.page_size + 1)
+            .offset(pagination.offset())
+        )
+        count_query = select(func.count(Movie.id)).where(Movie.deleted_at.is_(None))
+        # 제목 일치에 감독 일치보다 높은 가중치
+        query, count_query = apply_search(
+            self.db, query, count_query, Movie, movie_fts,
+            columns=[Movie.title, Movie.director], weights=[10.0, 5.0], keyword=keyword, sort=sort,
+        )
+        return await paginate(
+            self.db, query, count_query, pagination,
+            cache_key=("movie", "search", keyword), sort_key=None,
+        )
+
     async def find_one(self, movie_id: int):
         """단일 영화 조회"""
         result = await self.db.execute(
@@ -109,13 +269,16 @@ class MovieService:
         
         return movie
     
+    async def stats(self, movie_id: int, bucket: StatsBucketEnum = StatsBucketEnum.DAY, days: int = 30):
+        """영화 감정 분포 / 평점 추이 (미리 집계된 일별 감정 집계 조회)"""
+        await self.find_one(movie_id)
+        return await ReviewStatsService(self.db).sentiment_trend(movie_id, bucket, days)
+
     async def delete(self, movie_id: int):
-        """영화 삭제"""
+        """영화 삭제 (리뷰는 UPDATE 문 1번으로 함께 soft delete, 리뷰 객체를 불러오지 않음)"""
 
         existing = await self.db.execute(
-            select(Movie)
-            .options(selectinload(Movie.reviews))
-            .where(Movie.id == movie_id)
+            select(Movie).where(Movie.id == movie_id)
         )
         movie = existing.scalars().first()
         
@@ -123,26 +286,41 @@ class MovieService:
             raise ResponseMessage.NOT_FOUND("해당 영화를 찾을 수 없습니다.")
         
         # await self.db.delete(movie)
+        if movie.deleted_at is None:
+            # 영화 평점 집계 제거
+            await ReviewStatsService(self.db).remove_movie(movie.id)
         movie.soft_delete()
         
-        # 영화 관련 리뷰도 삭제
-        for review in movie.reviews:
-            review.soft_delete()
+        # 영화 관련 리뷰도 삭제 (이미 삭제된 리뷰는 삭제 시각 유지)
+        await self.db.execute(
+            update(Review)
+            .where(Review.movie_id == movie.id, Review.deleted_at.is_(None))
+            .values(deleted_at=movie.deleted_at)
+            .execution_options(synchronize_session=False)
+        )
         
         await self.db.commit()
         await self.db.refresh(movie)
+        count_cache.invalidate("movie", "review")
+        await response_cache.invalidate("movie", "review")
         return movie
 
     async def find_all_genres(self):
-        """장르 리스트 조회"""
+        """장르 리스트 조회 (장르 캐시 사용), (장르 목록, ETag) 반환"""
+        cached = genre_cache.get()
+        if cached is not None:
+            return cached
+
+        version = genre_cache.version
         genres = await self.db.execute(
             select(Genre)
             .where(Genre.deleted_at.is_(None))
+            .order_by(Genre.id)
         )
-        
-        return [{"id": g.id, "genre": g.genre} for g in genres.scalars().all()]
-
-
-    
+        genres = [{"id": g.id, "genre": g.genre} for g in genres.scalars().all()]
+        return genres, genre_cache.set(genres, version)
 
-    
\ No newline at end of file
+    def _invalidate_genres(self):
+        if self.genres_created:
+            genre_cache.invalidate()
+            self.genres_created = False
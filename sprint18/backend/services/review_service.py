@@ -1,69 +1,195 @@
 
-from sqlalchemy import func, select
+import asyncio
+from datetime import datetime
+
+from sqlalchemy import func, insert, or_, select, tuple_
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
+from pydantic import ValidationError
 
 from utils.enums.sentiment_enum import SentimentEnum
-from model.models import Review
+from model.models import Movie, Review, review_archive
+from model.search import review_fts
 from schemas.review import ReviewCreate
 from schemas.pagination import Pagination
+from utils.bulk_import import BulkImportReport, validation_message
+from utils.count_cache import count_cache
+from utils.pagination import paginate
+from utils.profiling import span
+from utils.response_cache import response_cache
+from utils.enums.search_sort_enum import SearchSortEnum
+from utils.search import apply_search
 from utils.response import ResponseMessage
-from sentiment.analyzer import analyze_sentiment
+from sentiment.analyzer import analyze_sentiment_batch
+from sentiment.batcher import sentiment_batcher
+from sentiment.config import SENTIMENT_MODE
+from sentiment.worker import sentiment_worker
 from services.movie_service import MovieService
+from services.review_stats_service import ReviewStatsService, sentiment_to_rating
 
 class ReviewService:
     def __init__(self, db: AsyncSession, movie_service: MovieService):
         self.db = db
         self.movie_service = movie_service
+        self.stats = ReviewStatsService(db)
     
     async def create(self, review: ReviewCreate):
-        
-        # 영화 존재 여부 검증
-        await self.movie_service.find_one(review.movie_id)
-        
-        # 중복 확인
-        existing = await self.db.execute(
-            select(Review)
-            .options(selectinload(Review.movie))
-            .where(
-                Review.movie_id == review.movie_id,
-                Review.reviewer_name == review.reviewer_name,
+        """리뷰 등록
+
+        영화 존재 / 중복 확인을 쿼리 1번으로 하고, INSERT … RETURNING 으로 저장된 행을 바로 받는다. (refresh 없음)
+        동시 요청으로 검증 뒤에 같은 리뷰가 생기면 (movie_id, reviewer_name) 유니크 인덱스가 막는다.
+        """
+        # 영화 존재 여부 + 중복 확인 (삭제 / 압축된 리뷰 포함) / 구간별 시간은 Server-Timing / /metrics 로 확인
+        with span("validate"):
+            duplicate = or_(
+                select(Review.id)
+                .where(Review.movie_id == Movie.id, Review.reviewer_name == review.reviewer_name)
+                .exists(),
+                select(review_archive.c.id)
+                .where(review_archive.c.movie_id == Movie.id, review_archive.c.reviewer_name == review.reviewer_name)
+                .exists(),
             )
-        )
-        
-        existing = existing.scalars().first()
-        
-        if existing:
-            raise ResponseMessage.BAD_REQUEST(f"이미 등록된 리뷰입니다: {existing.movie.title} | {review.reviewer_name}")
-        
-        
-        # 리뷰 분석
-        sentiment, score = analyze_sentiment(review.content)
-                        
-        db_review = Review(**review.model_dump())
-        db_review.sentiment = sentiment
-        db_review.score = score
-        
-        self.db.add(db_review)
+            row = (await self.db.execute(
+                select(Movie.title, duplicate).where(Movie.id == review.movie_id, Movie.deleted_at.is_(None))
+            )).first()
+
+        if row is None:
+            raise ResponseMessage.NOT_FOUND("해당 영화를 찾을 수 없습니다.")
+        title, exists = row
+        if exists:
+            raise ResponseMessage.BAD_REQUEST(f"이미 등록된 리뷰입니다: {title} | {review.reviewer_name}")
+        # 추론을 기다리는 동안 읽기 트랜잭션(연결)을 잡고 있지 않도록 종료
+        # (여러 워커 프로세스가 SQLite에 쓸 때, 오래된 읽기 스냅샷에서 쓰기로 바꾸면 database is locked)
         await self.db.commit()
-        await self.db.refresh(db_review)
+
+        values = review.model_dump()
+
+        # 리뷰 분석 (deferred 모드면 sentiment/score를 비워 두고 백그라운드 워커가 채움)
+        if SENTIMENT_MODE != "deferred":
+            # 동시 요청은 배치로 묶어 워커 스레드에서 추론 (배치 대기 시간 포함)
+            with span("inference"):
+                values["sentiment"], values["score"] = await sentiment_batcher.submit(review.content)
+
+        try:
+            with span("insert"):
+                db_review = (await self.db.scalars(insert(Review).returning(Review), [values])).one()
+            # 평점 집계 증분 갱신 (분석 대기 리뷰는 워커가 분석 후 반영)
+            with span("commit"):
+                await self.stats.add([(db_review.movie_id, db_review.sentiment, db_review.score, db_review.created_at)])
+                await self.db.commit()
+        except IntegrityError:
+            await self.db.rollback()
+            raise ResponseMessage.BAD_REQUEST(f"이미 등록된 리뷰입니다: {title} | {review.reviewer_name}")
+
+        count_cache.invalidate("review")
+        await response_cache.invalidate("review")
+        db_review.sentiment_label = SentimentEnum.label_of(db_review.sentiment)
+
+        if SENTIMENT_MODE == "deferred":
+            sentiment_worker.notify()
         return db_review
     
+    async def bulk_create(self, rows: list[tuple[int, dict]], report: BulkImportReport):
+        """리뷰 일괄 등록 (청크 1개 처리 후 commit)
+
+        rows: [(줄 번호, 입력 dict)] / 영화 존재·중복 확인은 집합 쿼리로, 감정 분석은 배치 1번으로 처리
+        """
+        reviews = []
+        for line, record in rows:
+            try:
+                review = ReviewCreate.model_validate(record)
+            except ValidationError as e:
+                report.add_error(line, validation_message(e))
+                continue
+
+            key = ("review", review.movie_id, review.reviewer_name)
+            if key in report.seen_keys:
+                report.add_error(line, f"요청 내 중복된 리뷰입니다: {review.movie_id} | {review.reviewer_name}")
+                continue
+            report.seen_keys.add(key)
+            reviews.append((line, review))
+
+        if not reviews:
+            return
+
+        # 영화 존재 여부 / DB 중복 확인 (IN 쿼리, 중복은 원본 + 보관 테이블)
+        movie_ids = {r.movie_id for _, r in reviews}
+        live_movies = set((await self.db.execute(
+            select(Movie.id).where(Movie.id.in_(movie_ids), Movie.deleted_at.is_(None))
+        )).scalars().all())
+        keys = [(r.movie_id, r.reviewer_name) for _, r in reviews]
+        existing = set()
+        for table in (Review.__table__, review_archive):  # 압축된 리뷰 포함
+            existing.update((await self.db.execute(
+                select(table.c.movie_id, table.c.reviewer_name).where(
+                    tuple_(table.c.movie_id, table.c.reviewer_name).in_(keys)
+                )
+            )).all())
+
+        valid = []
+        for line, review in reviews:
+            if review.movie_id not in live_movies:
+                report.add_error(line, f"해당 영화를 찾을 수 없습니다: {review.movie_id}")
+            elif (review.movie_id, review.reviewer_name) in existing:
+                report.add_error(line, f"이미 등록된 리뷰입니다: {review.movie_id} | {review.reviewer_name}")
+            else:
+                valid.append((line, review))
+        if not valid:
+            return
+
+        db_reviews = [Review(**review.model_dump()) for _, review in valid]
+        if SENTIMENT_MODE != "deferred":
+            # 추론 동안 읽기 트랜잭션을 잡고 있지 않도록 종료 (create와 같은 이유)
+            await self.db.commit()
+            # 청크 전체를 한 번의 배치 추론으로 분석 (워커 스레드)
+            with span("inference"):
+                results = await asyncio.to_thread(
+                    analyze_sentiment_batch, [r.content for r in db_reviews], sentiment_batcher.max_batch_size
+                )
+            for db_review, (sentiment, score) in zip(db_reviews, results):
+                db_review.sentiment = sentiment
+                db_review.score = score
+
+        # 집계 upsert가 리뷰 INSERT를 autoflush 하므로 둘 다 try 안에서 실행
+        # (검증 후 다른 요청이 같은 리뷰를 등록하면 유니크 인덱스 충돌 → 청크 단위 오류)
+        try:
+            self.db.add_all(db_reviews)
+            await self.stats.add([(r.movie_id, r.sentiment, r.score, r.created_at) for r in db_reviews])
+            await self.db.commit()
+        except SQLAlchemyError as e:
+            await self.db.rollback()
+            message = "이미 등록된 리뷰와 충돌했습니다." if isinstance(e, IntegrityError) else e.__class__.__name__
+            for line, _ in valid:
+                report.add_error(line, f"저장 실패: {message}")
+            return
+
+        report.created += len(db_reviews)
+        count_cache.invalidate("review")
+        await response_cache.invalidate("review")
+        if SENTIMENT_MODE == "deferred":
+            sentiment_worker.notify()
+    
     async def find_all(self, pagination: Pagination = Pagination(), movie_id: int = None):
         """영화 리뷰 목록 조회"""
-        offset = pagination.offset()
-        
         # 리스트 조회
         query = (
             select(Review)
             .where(Review.deleted_at.is_(None))
-            .order_by(Review.created_at.desc())
-            .offset(offset)
-            .limit(pagination.page_size)
+            .order_by(Review.created_at.desc(), Review.id.desc())
+            .limit(pagination.page_size + 1)  # 다음 페이지 존재 여부 확인용 1건 추가
         )
         
-        # 점수 조회
-        avg_query = select(Review.sentiment, Review.score).where(Review.deleted_at.is_(None))
+        try:
+            cursor = pagination.decode_cursor()
+            if cursor:
+                # 커서 모드: (created_at, id) 보다 뒤에 오는 행부터 조회
+                created_at, last_id = datetime.fromisoformat(cursor[0]), cursor[1]
+                query = query.where(tuple_(Review.created_at, Review.id) < tuple_(created_at, last_id))
+            else:
+                query = query.offset(pagination.offset())
+        except (ValueError, TypeError):
+            raise ResponseMessage.BAD_REQUEST("잘못된 커서입니다.")
         
         # 기본 카운트 쿼리
         count_query = select(func.count(Review.id)).where(Review.deleted_at.is_(None))
@@ -73,35 +199,58 @@ class ReviewService:
             await self.movie_service.find_one(movie_id)
             query = query.where(Review.movie_id == movie_id)
             count_query = count_query.where(Review.movie_id == movie_id)
-            avg_query = avg_query.where(Review.movie_id == movie_id)
         else:
             query = query.options(selectinload(Review.movie))
         
         
-        result = await self.db.execute(query)
-        reviews = result.scalars().all()
+        # 목록 + 전체 개수 (pagination.count_mode에 따라 계산)
+        reviews, pagination = await paginate(
+            self.db, query, count_query, pagination,
+            cache_key=("review", movie_id), sort_key=lambda r: r.created_at,
+        )
         
-        # 평균 평점 계산
-        avg_result = await self.db.execute(avg_query)
-        all_reviews = avg_result.all()
-        ratings = [
-            self.sentiment_to_rating(sentiment, score)
-            for sentiment, score in all_reviews
-            if sentiment and score is not None
-        ]
-        average_score = round(sum(ratings) / len(ratings), 3) if ratings else None
+        # 평균 평점 (미리 집계된 값 조회)
+        average_score = await self.stats.average(movie_id)
         
         # 감정라벨
         for review in reviews:
-            review.sentiment_label = SentimentEnum[review.sentiment].label
-        
-        # 전체 개수
-        total_count = (await self.db.execute(count_query)).scalar_one()
-        pagination.set_total(total_count)
-
+            review.sentiment_label = SentimentEnum.label_of(review.sentiment)
         
         return reviews, average_score, pagination
     
+    async def search(self, keyword: str, pagination: Pagination = Pagination(), movie_id: int = None,
+                     sort: SearchSortEnum = SearchSortEnum.RANK):
+        """리뷰 검색 (내용 / 작성자, FTS5 순위 정렬)"""
+        query = (
+            select(Review)
+            .where(Review.deleted_at.is_(None))
+            .order_by(Review.created_at.desc(), Review.id.desc())
+            .limit(pagination.page_size + 1)
+            .offset(pagination.offset())
+        )
+        count_query = select(func.count(Review.id)).where(Review.deleted_at.is_(None))
+
+        if movie_id is not None:
+            await self.movie_service.find_one(movie_id)
+            query = query.where(Review.movie_id == movie_id)
+            count_query = count_query.where(Review.movie_id == movie_id)
+        else:
+            query = query.options(selectinload(Review.movie))
+
+        query, count_query = apply_search(
+            self.db, query, count_query, Review, review_fts,
+            columns=[Review.content, Review.reviewer_name], weights=[10.0, 2.0], keyword=keyword, sort=sort,
+        )
+        reviews, pagination = await paginate(
+            self.db, query, count_query, pagination,
+            cache_key=("review", "search", movie_id, keyword), sort_key=None,
+        )
+
+        for review in reviews:
+            review.sentiment_label = SentimentEnum.label_of(review.sentiment)
+
+        return reviews, pagination
+
     async def find_one(self, review_id: int):
         """단일 리뷰 조회"""
         result = await self.db.execute(
@@ -115,7 +264,7 @@ class ReviewService:
         if not review:
             ResponseMessage.NOT_FOUND("해당 리뷰를 찾을 수 없습니다.")
         
-        review.sentiment_label = SentimentEnum[review.sentiment].label
+        review.sentiment_label = SentimentEnum.label_of(review.sentiment)
         
         return review
     
@@ -131,23 +280,18 @@ class ReviewService:
             ResponseMessage.NOT_FOUND("해당 리뷰를 찾을 수 없습니다.")
         
         # await self.db.delete(movie)
-        review.soft_delete()
-        
+        if review.deleted_at is None:
+            review.soft_delete()
+            await self.stats.remove([(review.movie_id, review.sentiment, review.score, review.created_at)])
         
         await self.db.commit()
         await self.db.refresh(review)
+        count_cache.invalidate("review")
+        await response_cache.invalidate("review")
         return review
 
 
 
     @staticmethod
     def sentiment_to_rating(sentiment: str, score: float) -> float:
-        weight_map = {
-            SentimentEnum.VERY_NEGATIVE: 0.0,
-            SentimentEnum.NEGATIVE: 0.25,
-            SentimentEnum.NEUTRAL: 0.5,
-            SentimentEnum.POSITIVE: 0.75,
-            SentimentEnum.VERY_POSITIVE: 1.0
-        }
-        base = weight_map.get(sentiment, 0.5)
-        return base * score  # 감정 방향 * 확신도 모두 반영
+        return sentiment_to_rating(sentiment, score)
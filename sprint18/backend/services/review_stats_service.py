@@ -0,0 +1,276 @@
+
+import os
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import Date, case, delete, func, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from model.database import dialect_insert
+from model.models import MovieRatingStat, MovieSentimentDaily, Review
+from utils.enums.stats_bucket_enum import StatsBucketEnum
+from utils.enums.sentiment_enum import SentimentEnum
+
+
+# 전체 리뷰 집계 행의 movie_id
+GLOBAL_STATS_ID = 0
+
+# 평균 평점 계산 방식: materialized(집계 테이블 조회) / sql(리뷰 테이블에서 AVG 집계)
+RATING_AGGREGATION = os.getenv("RATING_AGGREGATION", "materialized").lower()
+
+# 감정별 평점 가중치 (감정 방향)
+RATING_WEIGHTS = {
+    SentimentEnum.VERY_NEGATIVE: 0.0,
+    SentimentEnum.NEGATIVE: 0.25,
+    SentimentEnum.NEUTRAL: 0.5,
+    SentimentEnum.POSITIVE: 0.75,
+    SentimentEnum.VERY_POSITIVE: 1.0
+}
+
+def sentiment_to_rating(sentiment: str, score: float) -> float:
+    base = RATING_WEIGHTS.get(sentiment, 0.5)
+    return base * score  # 감정 방향 * 확신도 모두 반영
+
+def utc_day(created_at: datetime):
+    """작성 시각의 UTC 날짜 (SQLite는 시간대 없이 UTC 값 그대로 읽힘)"""
+    if created_at.tzinfo is not None:
+        created_at = created_at.astimezone(timezone.utc)
+    return created_at.date()
+
+def rating_expression():
+    """sentiment_to_rating과 같은 계산을 하는 SQL 식 (CASE 가중치 * score)"""
+    weight = case(
+        {sentiment.value: w for sentiment, w in RATING_WEIGHTS.items()},
+        value=Review.sentiment,
+        else_=0.5,
+    )
+    return weight * Review.score
+
+def rated_review_filter():
+    """평점 집계 대상 리뷰 조건 (삭제되지 않고 분석이 끝난 리뷰)"""
+    return (
+        Review.deleted_at.is_(None),
+        Review.sentiment.is_not(None),
+        Review.sentiment != "",
+        Review.score.is_not(None),
+    )
+
+
+class ReviewStatsService:
+    """영화별 평점 집계(movie_rating_stats)와 일별 감정 집계(movie_sentiment_daily) 관리
+
+    리뷰 생성/삭제와 같은 트랜잭션 안에서 증분 갱신하므로 commit은 호출자가 한다.
+    """
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def add(self, reviews):
+        """분석된 리뷰 반영 (reviews: (movie_id, sentiment, score, created_at) 목록)"""
+        await self._apply(reviews, sign=1)
+
+    async def remove(self, reviews):
+        """삭제된 리뷰 반영 (reviews: (movie_id, sentiment, score, created_at) 목록)"""
+        await self._apply(reviews, sign=-1)
+
+    async def _apply(self, reviews, sign: int):
+        deltas = defaultdict(lambda: [0.0, 0])
+        daily = defaultdict(lambda: [0.0, 0])
+        today = datetime.now(timezone.utc).date()
+        for movie_id, sentiment, score, created_at in reviews:
+            if not sentiment or score is None:
+                continue
+            rating = sentiment_to_rating(sentiment, score)
+            for key in (movie_id, GLOBAL_STATS_ID):
+                deltas[key][0] += sign * rating
+                deltas[key][1] += sign
+            # flush 전이라 작성일이 없으면 오늘 (UTC)
+            day = utc_day(created_at) if created_at else today
+            key = (movie_id, day, getattr(sentiment, "value", sentiment))
+            daily[key][0] += sign * rating
+            daily[key][1] += sign
+
+        if not deltas:
+            return
+
+        stmt = dialect_insert(self.db, MovieRatingStat).values([
+            {"movie_id": movie_id, "rating_sum": rating_sum, "rating_count": rating_count}
+            for movie_id, (rating_sum, rating_count) in deltas.items()
+        ])
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[MovieRatingStat.movie_id],
+            set_={
+                "rating_sum": MovieRatingStat.rating_sum + stmt.excluded.rating_sum,
+                "rating_count": MovieRatingStat.rating_count + stmt.excluded.rating_count,
+            },
+        )
+        await self.db.execute(stmt)
+
+        stmt = dialect_insert(self.db, MovieSentimentDaily).values([
+            {"movie_id": movie_id, "day": day, "sentiment": sentiment, "review_count": count, "rating_sum": rating_sum}
+            for (movie_id, day, sentiment), (rating_sum, count) in daily.items()
+        ])
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[MovieSentimentDaily.movie_id, MovieSentimentDaily.day, MovieSentimentDaily.sentiment],
+            set_={
+                "review_count": MovieSentimentDaily.review_count + stmt.excluded.review_count,
+                "rating_sum": MovieSentimentDaily.rating_sum + stmt.excluded.rating_sum,
+            },
+        )
+        await self.db.execute(stmt)
+
+    async def remove_movie(self, movie_id: int):
+        """영화 삭제 시 해당 영화 집계를 전체 집계에서 빼고 삭제"""
+        await self.db.execute(delete(MovieSentimentDaily).where(MovieSentimentDaily.movie_id == movie_id))
+        stat = (await self.db.execute(
+            select(MovieRatingStat.rating_sum, MovieRatingStat.rating_count)
+            .where(MovieRatingStat.movie_id == movie_id)
+        )).first()
+        if not stat:
+            return
+
+        await self.db.execute(
+            update(MovieRatingStat)
+            .where(MovieRatingStat.movie_id == GLOBAL_STATS_ID)
+            .values(
+                rating_sum=MovieRatingStat.rating_sum - stat.rating_sum,
+                rating_count=MovieRatingStat.rating_count - stat.rating_count,
+            )
+        )
+        await self.db.execute(delete(MovieRatingStat).where(MovieRatingStat.movie_id == movie_id))
+
+    async def average(self, movie_id: int | None = None):
+        """평균 평점 (RATING_AGGREGATION 설정에 따라 집계 테이블 또는 SQL AVG)"""
+        if RATING_AGGREGATION == "sql":
+            return await self.average_sql(movie_id)
+        return await self.average_materialized(movie_id)
+
+    async def average_sql(self, movie_id: int | None = None):
+        """평균 평점 (리뷰 테이블에서 AVG(CASE ...) 스칼라 1건 집계)"""
+        query = select(func.avg(rating_expression())).where(*rated_review_filter())
+        if movie_id is not None:
+            query = query.where(Review.movie_id == movie_id)
+        average = (await self.db.execute(query)).scalar_one()
+        return round(average, 3) if average is not None else None
+
+    async def average_materialized(self, movie_id: int | None = None):
+        """평균 평점 (집계 행 1건 조회)"""
+        stat = (await self.db.execute(
+            select(MovieRatingStat.rating_sum, MovieRatingStat.rating_count)
+            .where(MovieRatingStat.movie_id == (GLOBAL_STATS_ID if movie_id is None else movie_id))
+        )).first()
+        if not stat or stat.rating_count <= 0:
+            return None
+        return round(stat.rating_sum / stat.rating_count, 3)
+
+    async def rebuild(self):
+        """리뷰 테이블 기준으로 평점 집계 + 일별 감정 집계 전체 재계산 (정합성 복구용)"""
+        rating = rating_expression()
+        per_movie = (await self.db.execute(
+            select(Review.movie_id, func.sum(rating), func.count())
+            .where(*rated_review_filter())
+            .group_by(Review.movie_id)
+        )).all()
+
+        await self.db.execute(delete(MovieRatingStat))
+        rows = [
+            {"movie_id": movie_id, "rating_sum": rating_sum or 0.0, "rating_count": count}
+            for movie_id, rating_sum, count in per_movie
+        ]
+        rows.append({
+            "movie_id": GLOBAL_STATS_ID,
+            "rating_sum": sum(r["rating_sum"] for r in rows),
+            "rating_count": sum(r["rating_count"] for r in rows),
+        })
+        await self.db.execute(insert(MovieRatingStat), rows)
+        await self._rebuild_daily()
+        await self.db.commit()
+        return len(rows) - 1
+
+    async def rebuild_daily(self):
+        """일별 감정 집계만 재계산, 집계 행 수 반환"""
+        count = await self._rebuild_daily()
+        await self.db.commit()
+        return count
+
+    async def _rebuild_daily(self):
+        created_at = Review.created_at
+        if self.db.get_bind().dialect.name == "postgresql":
+            # timestamptz의 date()는 세션 시간대 기준이므로 증분 반영(_apply)과 같이 UTC 날짜로 맞춤
+            created_at = func.timezone("UTC", created_at)
+        day = func.date(created_at, type_=Date)
+        rows = (await self.db.execute(
+            select(Review.movie_id, day, Review.sentiment, func.count(), func.sum(rating_expression()))
+            .where(*rated_review_filter())
+            .group_by(Review.movie_id, day, Review.sentiment)
+        )).all()
+
+        await self.db.execute(delete(MovieSentimentDaily))
+        if rows:
+            await self.db.execute(insert(MovieSentimentDaily), [
+                {"movie_id": movie_id, "day": day, "sentiment": sentiment, "review_count": count, "rating_sum": rating_sum or 0.0}
+                for movie_id, day, sentiment, count, rating_sum in rows
+            ])
+        return len(rows)
+
+    async def rebuild_if_missing(self):
+        """집계가 한 번도 만들어지지 않았으면 재계산 (전체 집계 행 없음 / 일별 집계만 비어 있음)"""
+        if await self.db.get(MovieRatingStat, GLOBAL_STATS_ID) is None:
+            await self.rebuild()
+            return
+
+        daily_empty = (await self.db.execute(select(MovieSentimentDaily.movie_id).limit(1))).first() is None
+        if daily_empty:
+            has_reviews = (await self.db.execute(select(Review.id).where(*rated_review_filter()).limit(1))).first()
+            if has_reviews:
+                await self.rebuild_daily()
+
+    async def sentiment_trend(self, movie_id: int, bucket: StatsBucketEnum = StatsBucketEnum.DAY, days: int = 30):
+        """영화 감정 분포(전체 기간) + 최근 days일 추이 (일 / 주 단위, 주는 월요일 시작)"""
+        histogram = {sentiment.value: 0 for sentiment in SentimentEnum}
+        totals = (await self.db.execute(
+            select(MovieSentimentDaily.sentiment, func.sum(MovieSentimentDaily.review_count))
+            .where(MovieSentimentDaily.movie_id == movie_id)
+            .group_by(MovieSentimentDaily.sentiment)
+        )).all()
+        for sentiment, count in totals:
+            histogram[sentiment] = count
+
+        start = datetime.now(timezone.utc).date() - timedelta(days=days - 1)
+        rows = (await self.db.execute(
+            select(
+                MovieSentimentDaily.day, MovieSentimentDaily.sentiment,
+                MovieSentimentDaily.review_count, MovieSentimentDaily.rating_sum,
+            )
+            .where(
+                MovieSentimentDaily.movie_id == movie_id,
+                MovieSentimentDaily.day >= start,
+                MovieSentimentDaily.review_count > 0,
+            )
+            .order_by(MovieSentimentDaily.day)
+        )).all()
+
+        periods = {}
+        for day, sentiment, count, rating_sum in rows:
+            period = day - timedelta(days=day.weekday()) if bucket == StatsBucketEnum.WEEK else day
+            point = periods.setdefault(period, {
+                "period": period, "review_count": 0, "rating_sum": 0.0,
+                "sentiments": {s.value: 0 for s in SentimentEnum},
+            })
+            point["review_count"] += count
+            point["rating_sum"] += rating_sum
+            point["sentiments"][sentiment] = point["sentiments"].get(sentiment, 0) + count
+
+        trend = []
+        for point in periods.values():
+            rating_sum = point.pop("rating_sum")
+            point["average_score"] = round(rating_sum / point["review_count"], 3)
+            trend.append(point)
+
+        return {
+            "movie_id": movie_id,
+            "total_reviews": sum(histogram.values()),
+            "average_score": await self.average(movie_id),
+            "histogram": histogram,
+            "bucket": bucket,
+            "trend": trend,
+        }
@@ -0,0 +1,155 @@
+import csv
+import json
+
+from fastapi import Request, status
+
+from utils.response import ResponseMessage
+
+
+NDJSON_TYPES = ("application/x-ndjson", "application/ndjson", "application/jsonl", "application/json")
+CSV_TYPES = ("text/csv", "application/csv")
+
+# 응답에 담을 최대 오류 행 수
+MAX_REPORTED_ERRORS = 1000
+
+
+class BulkImportReport:
+    """일괄 등록 결과 (행 단위 오류 포함)"""
+    def __init__(self):
+        self.total = 0
+        self.created = 0
+        self.failed = 0
+        self.errors = []
+        self.seen_keys = set()  # 요청 내 중복 확인용 (청크 간 공유)
+
+    def add_error(self, line: int, message: str):
+        # 파싱 오류는 읽는 즉시, 검증/저장 오류는 청크 처리 때 기록되므로 줄 번호 순서가 아님
+        # → 줄 번호가 작은 MAX_REPORTED_ERRORS개만 남기고 응답할 때 정렬
+        self.failed += 1
+        self.errors.append({"line": line, "error": message})
+        if len(self.errors) >= MAX_REPORTED_ERRORS * 2:
+            self.errors = self._first_errors()
+
+    def _first_errors(self) -> list[dict]:
+        return sorted(self.errors, key=lambda e: e["line"])[:MAX_REPORTED_ERRORS]
+
+    def to_dict(self) -> dict:
+        errors = self._first_errors()
+        return {
+            "total": self.total,
+            "created": self.created,
+            "failed": self.failed,
+            "errors": errors,
+            "errors_truncated": self.failed > len(errors),
+        }
+
+
+def _decode(line_no: int, line: bytes):
+    """(줄, 오류) 반환, UTF-8이 아닌 줄은 오류"""
+    try:
+        return line.decode("utf-8-sig" if line_no == 1 else "utf-8").rstrip("\r"), None
+    except UnicodeDecodeError:
+        return None, "UTF-8 인코딩이 아닙니다."
+
+
+async def _iter_lines(request: Request):
+    """요청 본문을 스트리밍으로 읽어 (줄 번호, 줄, 오류) 단위로 반환"""
+    buffer = b""
+    line_no = 0
+    async for chunk in request.stream():
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            line_no += 1
+            yield line_no, *_decode(line_no, line)
+    if buffer:
+        line_no += 1
+        yield line_no, *_decode(line_no, buffer)
+
+
+async def _iter_ndjson(request: Request):
+    async for line_no, line, error in _iter_lines(request):
+        if error:
+            yield line_no, None, error
+            continue
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as e:
+            yield line_no, None, f"JSON 형식 오류: {e.msg}"
+            continue
+        if not isinstance(record, dict):
+            yield line_no, None, "각 줄은 JSON 객체여야 합니다."
+            continue
+        yield line_no, record, None
+
+
+async def _iter_csv(request: Request):
+    header = None
+    pending, start_line = "", 0
+    async for line_no, line, error in _iter_lines(request):
+        if error:
+            if pending:
+                # 여러 줄 값을 읽던 중이면 그 행도 버림
+                yield start_line, None, f"{line_no}번째 줄을 읽을 수 없어 행을 건너뜁니다."
+                pending = ""
+            yield line_no, None, error
+            continue
+        # 따옴표 안의 줄바꿈: 따옴표 개수가 짝수가 될 때까지 다음 줄과 합침
+        if pending:
+            pending += "\n" + line
+        else:
+            pending, start_line = line, line_no
+        if pending.count('"') % 2:
+            continue
+
+        text, pending = pending, ""
+        if not text.strip():
+            continue
+        values = next(csv.reader([text]))
+        if header is None:
+            header = [h.strip() for h in values]
+            continue
+        if len(values) != len(header):
+            yield start_line, None, f"열 개수가 헤더와 다릅니다. (헤더 {len(header)}개, 값 {len(values)}개)"
+            continue
+        yield start_line, {k: (v if v != "" else None) for k, v in zip(header, values)}, None
+
+    if pending:
+        yield start_line, None, "닫히지 않은 따옴표가 있습니다."
+
+
+async def read_records(request: Request, chunk_size: int, report: BulkImportReport):
+    """NDJSON / CSV 요청 본문을 chunk_size개씩 [(줄 번호, dict)]로 반환 (파싱 오류는 report에 기록)"""
+    content_type = request.headers.get("content-type", "").split(";")[0].strip().lower()
+    if content_type in NDJSON_TYPES:
+        records = _iter_ndjson(request)
+    elif content_type in CSV_TYPES:
+        records = _iter_csv(request)
+    else:
+        raise ResponseMessage.CUSTOM_ERROR(
+            status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            "지원하지 않는 형식입니다. (application/x-ndjson 또는 text/csv)"
+        )
+
+    chunk = []
+    async for line_no, record, error in records:
+        report.total += 1
+        if error:
+            report.add_error(line_no, error)
+            continue
+        chunk.append((line_no, record))
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def validation_message(e) -> str:
+    """pydantic ValidationError를 한 줄 메시지로 변환"""
+    return "; ".join(
+        f"{'.'.join(str(loc) for loc in err.get('loc', []))}: {err.get('msg', '')}"
+        for err in e.errors()
+    )
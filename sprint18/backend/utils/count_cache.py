@@ -0,0 +1,47 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+
+
+class CountCache:
+    """목록 전체 개수 캐시 (짧은 TTL + 생성/삭제 시 무효화)
+
+    키는 (테이블명, 조건...) 튜플이며 invalidate(테이블명)으로 해당 테이블 키를 모두 지운다.
+    검색어도 키에 들어가므로 max_entries를 넘으면 가장 오래 쓰이지 않은 키부터 버린다. (LRU)
+    """
+    def __init__(self, ttl: float = 30, max_entries: int = 1000):
+        self.ttl = ttl
+        self.max_entries = max(1, max_entries)
+        self._values: OrderedDict[tuple, tuple[float, int]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple):
+        with self._lock:
+            item = self._values.get(key)
+            if item is None:
+                return None
+            expires_at, value = item
+            if expires_at < time.monotonic():
+                del self._values[key]
+                return None
+            self._values.move_to_end(key)
+            return value
+
+    def set(self, key: tuple, value: int):
+        with self._lock:
+            self._values[key] = (time.monotonic() + self.ttl, value)
+            self._values.move_to_end(key)
+            while len(self._values) > self.max_entries:
+                self._values.popitem(last=False)
+
+    def invalidate(self, *tables: str):
+        with self._lock:
+            for key in [k for k in self._values if k[0] in tables]:
+                del self._values[key]
+
+
+count_cache = CountCache(
+    ttl=float(os.getenv("COUNT_CACHE_TTL_SECONDS", "30")),
+    max_entries=int(os.getenv("COUNT_CACHE_MAX_ENTRIES", "1000")),
+)
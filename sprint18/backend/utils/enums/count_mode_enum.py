@@ -0,0 +1,10 @@
+from enum import Enum
+
+
+class CountModeEnum(str, Enum):
+    """목록 조회 시 전체 개수(total_count) 계산 방식"""
+
+    EXACT = "exact"     # 별도 COUNT(*) 쿼리
+    NONE = "none"       # 전체 개수 생략
+    WINDOW = "window"   # 목록 쿼리에 COUNT(*) OVER () 포함
+    CACHED = "cached"   # 짧은 TTL 캐시 (생성/삭제 시 무효화)
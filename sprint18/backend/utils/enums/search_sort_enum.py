@@ -0,0 +1,8 @@
+from enum import Enum
+
+
+class SearchSortEnum(str, Enum):
+    """검색 결과 정렬 방식"""
+
+    RANK = "rank"       # 관련도 (bm25, 결과가 많으면 느려짐)
+    RECENT = "recent"   # 최근 등록순 (FTS rowid 역순, 결과 수와 관계없이 빠름)
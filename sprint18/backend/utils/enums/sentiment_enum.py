@@ -21,3 +21,13 @@ class SentimentEnum(str, Enum):
             SentimentEnum.VERY_POSITIVE: "너무 좋아요 🤩",
         }
         return labels.get(self.value, "알 수 없음 🤔")
+
+    @classmethod
+    def label_of(cls, sentiment: str | None) -> str:
+        """DB에 저장된 sentiment 값의 라벨 (분석 대기 중이면 대기 라벨)"""
+        if sentiment is None:
+            return "분석 중 ⏳"
+        try:
+            return cls[sentiment].label
+        except KeyError:
+            return "알 수 없음 🤔"
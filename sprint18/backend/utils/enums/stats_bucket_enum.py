@@ -0,0 +1,8 @@
+from enum import Enum
+
+
+class StatsBucketEnum(str, Enum):
+    """감정 추이 집계 단위"""
+
+    DAY = "day"
+    WEEK = "week"
@@ -0,0 +1,10 @@
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """If-None-Match 헤더 값이 etag와 일치하는지 (약한 비교, '*' 포함)"""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
@@ -0,0 +1,51 @@
+
+import hashlib
+import json
+import os
+import threading
+import time
+
+
+class GenreCache:
+    """장르 목록 캐시 (버전 + 내용 해시 ETag)
+
+    장르는 거의 바뀌지 않으므로 앱 시작 시 채워 두고, 새 장르가 생성되면 invalidate()로 비운다.
+    ttl이 지나면 다시 조회한다.
+    """
+    def __init__(self, ttl: float = 300):
+        self.ttl = ttl
+        self.version = 0
+        self._genres = None
+        self._etag = None
+        self._expires_at = 0.0
+        self._lock = threading.Lock()
+
+    def get(self):
+        """(장르 목록, ETag) 반환, 없거나 만료됐으면 None"""
+        with self._lock:
+            if self._genres is None or self._expires_at < time.monotonic():
+                return None
+            return self._genres, self._etag
+
+    def set(self, genres: list[dict], version: int | None = None):
+        """장르 목록 저장 후 ETag 반환
+
+        version은 조회를 시작할 때의 버전으로, 조회 중 invalidate()가 있었으면 저장하지 않는다.
+        """
+        body = json.dumps(genres, ensure_ascii=False, sort_keys=True).encode("utf-8")
+        etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+        with self._lock:
+            if version is None or version == self.version:
+                self._genres = genres
+                self._etag = etag
+                self._expires_at = time.monotonic() + self.ttl
+        return etag
+
+    def invalidate(self):
+        with self._lock:
+            self.version += 1
+            self._genres = None
+            self._etag = None
+
+
+genre_cache = GenreCache(ttl=float(os.getenv("GENRE_CACHE_TTL_SECONDS", "300")))
@@ -1,5 +1,11 @@
 from math import ceil
 
+from sqlalchemy import func
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from utils.count_cache import count_cache
+from utils.enums.count_mode_enum import CountModeEnum
+
 
 class Pagination:
     """페이지네이션 클래스"""
@@ -21,4 +27,42 @@ class Pagination:
             "page_size": self.page_size,
             "total_pages": self.total_pages,
             "total_count": self.total_count
-        }
\ No newline at end of file
+        }
+
+
+async def paginate(db: AsyncSession, query, count_query, pagination, cache_key: tuple, sort_key):
+    """목록 조회 + pagination.count_mode에 따른 전체 개수 계산
+
+    - query: page_size+1개를 조회하도록 만든 목록 쿼리 (다음 커서 계산용)
+    - count_query: 전체 개수 쿼리 (exact 모드 또는 다른 모드의 대체 경로)
+    - cache_key: cached 모드에서 쓰는 캐시 키 ((테이블명, 조건...) 튜플)
+    """
+    mode = pagination.count_mode
+
+    # 커서 모드에서는 윈도 함수가 커서 이후 행만 세므로 사용하지 않음
+    use_window = mode == CountModeEnum.WINDOW and not pagination.after
+    if use_window:
+        query = query.add_columns(func.count().over().label("total_count"))
+
+    result = await db.execute(query)
+    total_count = None
+    if use_window:
+        rows = result.all()
+        items = [row[0] for row in rows]
+        total_count = rows[0].total_count if rows else None
+    else:
+        items = result.scalars().all()
+    items = pagination.set_next(items, sort_key)
+
+    if mode == CountModeEnum.NONE:
+        return items, pagination.set_total(None)
+
+    if mode == CountModeEnum.CACHED:
+        total_count = count_cache.get(cache_key)
+
+    if total_count is None:
+        total_count = (await db.execute(count_query)).scalar_one()
+        if mode == CountModeEnum.CACHED:
+            count_cache.set(cache_key, total_count)
+
+    return items, pagination.set_total(total_count)
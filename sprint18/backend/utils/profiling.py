@@ -0,0 +1,235 @@
+
+import cProfile
+import heapq
+import os
+import random
+import re
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime
+
+from fastapi import Request
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import event
+from starlette.routing import Match
+
+
+# 요청별 구간 시간 {구간 이름: [누적 ms, 횟수]} (요청 밖에서는 None)
+_request_timings: ContextVar[dict | None] = ContextVar("request_timings", default=None)
+
+# 지연 시간 히스토그램 버킷 (초)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class Histogram:
+    """Prometheus 형식 누적 히스토그램 (라벨 조합별)"""
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = buckets
+        self._values = defaultdict(lambda: [[0] * len(buckets), 0.0, 0])  # [버킷별 개수, 합계, 전체 개수]
+
+    def observe(self, labels: tuple, value: float):
+        counts, _, _ = entry = self._values[labels]
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                counts[i] += 1
+        entry[1] += value
+        entry[2] += 1
+
+    def render(self, name: str, label_names: tuple) -> list[str]:
+        lines = [f"# TYPE {name} histogram"]
+        for labels, (counts, total, count) in sorted(self._values.items()):
+            base = ",".join(f'{k}="{_escape(v)}"' for k, v in zip(label_names, labels))
+            sep = "," if base else ""
+            for bound, bucket_count in zip(self.buckets, counts):
+                lines.append(f'{name}_bucket{{{base}{sep}le="{bound}"}} {bucket_count}')
+            lines.append(f'{name}_bucket{{{base}{sep}le="+Inf"}} {count}')
+            lines.append(f"{name}_sum{{{base}}} {total:.6f}")
+            lines.append(f"{name}_count{{{base}}} {count}")
+        return lines
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class Metrics:
+    """요청 / 구간별 지표 (프로세스 내 누적, /metrics 에서 Prometheus 텍스트로 출력)"""
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = defaultdict(int)         # (method, route, status) → 개수
+        self.request_duration = Histogram()      # (method, route)
+        self.stage_duration = Histogram()        # (route, stage), 요청 1건 안의 구간 합계
+        self.db_queries = defaultdict(int)       # route → 쿼리 수
+
+    def observe_request(self, method: str, route: str, status: int, seconds: float, timings: dict):
+        with self._lock:
+            self.requests[(method, route, str(status))] += 1
+            self.request_duration.observe((method, route), seconds)
+            for stage, (ms, count) in timings.items():
+                self.stage_duration.observe((route, stage), ms / 1000)
+                if stage == "db":
+                    self.db_queries[route] += count
+
+    def render(self) -> str:
+        with self._lock:
+            lines = ["# TYPE http_requests_total counter"]
+            for (method, route, status), count in sorted(self.requests.items()):
+                lines.append(f'http_requests_total{{method="{method}",route="{_escape(route)}",status="{status}"}} {count}')
+            lines += self.request_duration.render("http_request_duration_seconds", ("method", "route"))
+            lines += self.stage_duration.render("http_request_stage_duration_seconds", ("route", "stage"))
+            lines.append("# TYPE db_queries_total counter")
+            for route, count in sorted(self.db_queries.items()):
+                lines.append(f'db_queries_total{{route="{_escape(route)}"}} {count}')
+        return "\n".join(lines) + "\n"
+
+
+metrics = Metrics()
+
+
+def record(stage: str, ms: float):
+    """현재 요청의 구간 시간 누적 (요청 밖이면 무시)"""
+    timings = _request_timings.get()
+    if timings is None:
+        return
+    entry = timings.setdefault(stage, [0.0, 0])
+    entry[0] += ms
+    entry[1] += 1
+
+
+@contextmanager
+def span(stage: str):
+    """서비스 코드 구간 측정: with span("duplicate_check"): ..."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record(stage, (time.perf_counter() - start) * 1000)
+
+
+def instrument_engine(engine):
+    """SQLAlchemy 커서 실행 이벤트로 쿼리 시간을 'db' 구간에 기록
+
+    시작 시각은 문장별 실행 컨텍스트에 저장하므로, 실패한 문장(IntegrityError 등)이 있어도
+    같은 연결의 다음 쿼리 측정이 어긋나지 않는다. 실패한 문장의 시간도 handle_error에서 기록한다.
+    """
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        if context is not None:
+            context._query_start = time.perf_counter()
+
+    @event.listens_for(engine.sync_engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        _record_query(context)
+
+    @event.listens_for(engine.sync_engine, "handle_error")
+    def _error(exception_context):
+        _record_query(exception_context.execution_context)
+
+
+def _record_query(context):
+    start = getattr(context, "_query_start", None)
+    if start is not None:
+        context._query_start = None
+        record("db", (time.perf_counter() - start) * 1000)
+
+
+class TimedORJSONResponse(ORJSONResponse):
+    """orjson 렌더링 시간을 'serialize' 구간에 기록"""
+    def render(self, content) -> bytes:
+        with span("serialize"):
+            return super().render(content)
+
+
+class SlowRequestProfiler:
+    """샘플링 프로파일러: 일부 요청을 cProfile로 측정하고 가장 느린 top_n건의 pstats만 남김
+
+    cProfile은 스레드 단위로 동작하므로 한 번에 한 요청만 측정하며,
+    측정 중 같은 이벤트 루프에서 실행된 다른 요청의 코드도 함께 기록될 수 있다.
+    """
+    def __init__(self, sample_rate: float = 0.0, top_n: int = 10, output_dir: str = "profiles"):
+        self.sample_rate = sample_rate
+        self.top_n = top_n
+        self.output_dir = output_dir
+        self._active = False
+        self._slowest = []  # (ms, 파일 경로) 최소 힙
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.sample_rate > 0 and self.top_n > 0
+
+    def start(self) -> cProfile.Profile | None:
+        if not self.enabled or random.random() >= self.sample_rate:
+            return None
+        with self._lock:
+            if self._active:
+                return None
+            self._active = True
+        profiler = cProfile.Profile()
+        profiler.enable()
+        return profiler
+
+    def finish(self, profiler: cProfile.Profile, request: Request, ms: float):
+        profiler.disable()
+        with self._lock:
+            self._active = False
+            if len(self._slowest) >= self.top_n and ms <= self._slowest[0][0]:
+                return
+            os.makedirs(self.output_dir, exist_ok=True)
+            name = re.sub(r"[^A-Za-z0-9_-]+", "_", f"{request.method}_{request.url.path}").strip("_")
+            path = os.path.join(self.output_dir, f"{datetime.now():%Y%m%d-%H%M%S}-{name}-{ms:.0f}ms.pstats")
+            profiler.dump_stats(path)
+            heapq.heappush(self._slowest, (ms, path))
+            if len(self._slowest) > self.top_n:
+                _, evicted = heapq.heappop(self._slowest)
+                if os.path.exists(evicted):
+                    os.remove(evicted)
+
+
+profiler = SlowRequestProfiler(
+    sample_rate=float(os.getenv("PROFILE_SAMPLE_RATE", "0")),
+    top_n=int(os.getenv("PROFILE_TOP_N", "10")),
+    output_dir=os.getenv("PROFILE_DIR", "profiles"),
+)
+
+
+def _route_path(request: Request) -> str:
+    """지표 라벨용 경로 템플릿 (/movies/{movie_id}), 캐시 HIT처럼 라우터를 거치지 않은 요청은 직접 매칭"""
+    route = request.scope.get("route")
+    if route is None:
+        route = next((r for r in request.app.router.routes if r.matches(request.scope)[0] == Match.FULL), None)
+    return getattr(route, "path", "unmatched")
+
+
+def _server_timing(timings: dict, total_ms: float) -> str:
+    parts = [
+        f'{stage};dur={ms:.2f};desc="{count}x"' if count > 1 else f"{stage};dur={ms:.2f}"
+        for stage, (ms, count) in timings.items()
+    ]
+    parts.append(f"total;dur={total_ms:.2f}")
+    return ", ".join(parts)
+
+
+async def profiling_middleware(request: Request, call_next):
+    """요청 전체 / 구간별 시간 측정 → Server-Timing 헤더 + /metrics 지표 (+ 샘플링 프로파일)"""
+    if request.url.path == "/metrics":
+        return await call_next(request)
+
+    timings = {}
+    token = _request_timings.set(timings)
+    sampled = profiler.start()
+    start = time.perf_counter()
+    try:
+        response = await call_next(request)
+    finally:
+        total_ms = (time.perf_counter() - start) * 1000
+        _request_timings.reset(token)
+        if sampled is not None:
+            profiler.finish(sampled, request, total_ms)
+
+    metrics.observe_request(request.method, _route_path(request), response.status_code, total_ms / 1000, timings)
+    response.headers["Server-Timing"] = _server_timing(timings, total_ms)
+    return response
@@ -0,0 +1,199 @@
+
+import hashlib
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from urllib.parse import urlencode
+
+from fastapi import Request, Response
+
+from utils.etag import etag_matches
+
+
+# 캐시 대상 GET 경로: (이름, 경로 패턴, 무효화 네임스페이스, 기본 TTL(초))
+# TTL은 RESPONSE_CACHE_TTL_<이름> 환경 변수로 바꿀 수 있다. (예: RESPONSE_CACHE_TTL_REVIEWS=10)
+CACHE_RULES = [
+    ("movies", re.compile(r"^/movies$"), ("movie",), 60),
+    ("movie", re.compile(r"^/movies/\d+$"), ("movie",), 300),
+    ("movie_search", re.compile(r"^/movies/search$"), ("movie",), 60),
+    ("movie_stats", re.compile(r"^/movies/\d+/stats$"), ("movie", "review"), 60),
+    ("reviews", re.compile(r"^/reviews$"), ("review",), 30),
+    ("review_search", re.compile(r"^/reviews/search$"), ("review",), 30),
+]
+
+
+class MemoryCacheBackend:
+    """프로세스 내 LRU 백엔드 (TTL 만료)"""
+    def __init__(self, max_entries: int = 5000):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+        self._generations: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    async def get(self, key: str) -> bytes | None:
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None:
+                return None
+            expires_at, value = item
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    async def set(self, key: str, value: bytes, ttl: float):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    async def generations(self, namespaces) -> list[int]:
+        with self._lock:
+            return [self._generations.get(ns, 0) for ns in namespaces]
+
+    async def bump(self, namespace: str):
+        with self._lock:
+            self._generations[namespace] = self._generations.get(namespace, 0) + 1
+
+    async def close(self):
+        pass
+
+
+class RedisCacheBackend:
+    """Redis (또는 Redis 호환 서버) 백엔드, 여러 워커 프로세스가 캐시와 무효화를 공유
+
+    Redis 오류 시에는 캐시를 건너뛰고 원래 응답을 그대로 처리한다.
+    """
+    def __init__(self, url: str, prefix: str = "movie-api:"):
+        import redis.asyncio as redis
+        from redis.exceptions import RedisError
+
+        self.client = redis.from_url(url)
+        self.prefix = prefix
+        self._errors = RedisError
+
+    async def get(self, key: str) -> bytes | None:
+        try:
+            return await self.client.get(self.prefix + key)
+        except self._errors as e:
+            print(f"⚠️ 응답 캐시 조회 실패: {e}")
+            return None
+
+    async def set(self, key: str, value: bytes, ttl: float):
+        try:
+            await self.client.set(self.prefix + key, value, px=int(ttl * 1000))
+        except self._errors as e:
+            print(f"⚠️ 응답 캐시 저장 실패: {e}")
+
+    async def generations(self, namespaces) -> list[int] | None:
+        try:
+            values = await self.client.mget([f"{self.prefix}gen:{ns}" for ns in namespaces])
+        except self._errors as e:
+            print(f"⚠️ 응답 캐시 조회 실패: {e}")
+            return None
+        return [int(v) if v else 0 for v in values]
+
+    async def bump(self, namespace: str):
+        try:
+            await self.client.incr(f"{self.prefix}gen:{namespace}")
+        except self._errors as e:
+            print(f"⚠️ 응답 캐시 무효화 실패: {e}")
+
+    async def close(self):
+        await self.client.aclose()
+
+
+class ResponseCache:
+    """GET 응답 캐시 (경로 + 정렬된 쿼리 키, 강한 ETag, 304 응답)
+
+    무효화는 네임스페이스(movie / review)별 세대 번호를 올리는 방식이다.
+    캐시 키에 세대 번호가 들어가므로 이전 세대 항목은 다시 조회되지 않고 TTL로 사라진다.
+    """
+    def __init__(self, backend=None, rules=CACHE_RULES):
+        self.backend = backend
+        self.rules = [
+            (name, pattern, namespaces, float(os.getenv(f"RESPONSE_CACHE_TTL_{name.upper()}", ttl)))
+            for name, pattern, namespaces, ttl in rules
+        ]
+
+    @property
+    def enabled(self) -> bool:
+        return self.backend is not None
+
+    def match(self, request: Request):
+        if request.method != "GET":
+            return None
+        for rule in self.rules:
+            if rule[1].match(request.url.path):
+                return rule
+        return None
+
+    async def key(self, request: Request, rule) -> str | None:
+        name, _, namespaces, _ = rule
+        generations = await self.backend.generations(namespaces)
+        if generations is None:
+            return None
+        query = urlencode(sorted(request.query_params.multi_items()))
+        return f"{name}:{'.'.join(map(str, generations))}:{request.url.path}?{query}"
+
+    async def invalidate(self, *namespaces: str):
+        """데이터 변경 후 (commit 이후) 호출, 해당 네임스페이스의 캐시된 응답을 모두 무효화"""
+        if not self.enabled:
+            return
+        for namespace in namespaces:
+            await self.backend.bump(namespace)
+
+    async def middleware(self, request: Request, call_next):
+        rule = self.match(request) if self.enabled else None
+        if rule is None:
+            return await call_next(request)
+
+        key = await self.key(request, rule)
+        if key is None:
+            return await call_next(request)
+
+        if_none_match = request.headers.get("if-none-match")
+        bypass = "no-cache" in request.headers.get("cache-control", "")
+        cached = None if bypass else await self.backend.get(key)
+        if cached is not None:
+            etag, body = cached.split(b"\n", 1)
+            etag = etag.decode()
+            headers = {"ETag": etag, "Cache-Control": "no-cache", "X-Cache": "HIT"}
+            if etag_matches(if_none_match, etag):
+                return Response(status_code=304, headers=headers)
+            return Response(content=body, media_type="application/json", headers=headers)
+
+        response = await call_next(request)
+        if response.status_code != 200:
+            return response
+
+        body = b"".join([chunk async for chunk in response.body_iterator])
+        etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+        await self.backend.set(key, etag.encode() + b"\n" + body, rule[3])
+
+        headers = {k: v for k, v in response.headers.items() if k.lower() != "content-length"}
+        headers.update({"ETag": etag, "Cache-Control": "no-cache", "X-Cache": "MISS"})
+        if etag_matches(if_none_match, etag):
+            return Response(status_code=304, headers=headers)
+        return Response(content=body, status_code=200, headers=headers)
+
+    async def close(self):
+        if self.enabled:
+            await self.backend.close()
+
+
+def _build_backend():
+    """RESPONSE_CACHE_BACKEND 설정(memory / redis / off)에 맞는 백엔드 생성"""
+    backend = os.getenv("RESPONSE_CACHE_BACKEND", "memory").lower()
+    if backend == "off":
+        return None
+    if backend == "redis":
+        return RedisCacheBackend(os.getenv("RESPONSE_CACHE_REDIS_URL", "redis://localhost:6379/0"))
+    return MemoryCacheBackend(max_entries=int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", "5000")))
+
+
+response_cache = ResponseCache(_build_backend())
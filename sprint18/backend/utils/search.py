@@ -0,0 +1,54 @@
+
+import re
+
+from sqlalchemy import func, literal_column, or_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from utils.enums.search_sort_enum import SearchSortEnum
+
+
+# trigram 토크나이저는 3글자 이상 검색어만 색인으로 찾을 수 있음
+MIN_FTS_TERM_LENGTH = 3
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def split_terms(keyword: str) -> tuple[list[str], list[str]]:
+    """검색어를 (FTS로 찾을 3글자 이상 단어, LIKE로 찾을 짧은 단어)로 분리"""
+    terms = list(dict.fromkeys(t for t in _WHITESPACE.split(keyword.strip()) if t))
+    long_terms = [t for t in terms if len(t) >= MIN_FTS_TERM_LENGTH]
+    short_terms = [t for t in terms if len(t) < MIN_FTS_TERM_LENGTH]
+    return long_terms, short_terms
+
+
+def fts_match_query(terms: list[str]) -> str:
+    """FTS5 MATCH 식 (각 단어를 큰따옴표 구문으로 감싸 AND 검색, 특수문자 이스케이프)"""
+    return " ".join('"' + term.replace('"', '""') + '"' for term in terms)
+
+
+def apply_search(db: AsyncSession, query, count_query, model, fts, columns: list, weights: list[float], keyword: str,
+                 sort: SearchSortEnum = SearchSortEnum.RANK):
+    """목록/개수 쿼리에 검색 조건 적용
+
+    - SQLite: 3글자 이상 단어는 FTS5 MATCH (sort=rank면 bm25 순위 정렬, weights는 컬럼별 가중치)
+    - 2글자 이하 단어, 그 외 DB: 원본 컬럼 LIKE (대소문자 무시)
+    """
+    long_terms, short_terms = split_terms(keyword)
+    use_fts = db.get_bind().dialect.name == "sqlite"
+    like_terms = short_terms + ([] if use_fts else long_terms)
+
+    if use_fts and long_terms:
+        match = literal_column(fts.name).op("MATCH")(fts_match_query(long_terms))
+        order = (
+            (func.bm25(literal_column(fts.name), *weights), fts.c.rowid.desc())
+            if sort == SearchSortEnum.RANK else (fts.c.rowid.desc(),)
+        )
+        query = query.join(fts, fts.c.rowid == model.id).where(match).order_by(None).order_by(*order)
+        count_query = count_query.join(fts, fts.c.rowid == model.id).where(match)
+
+    for term in like_terms:
+        condition = or_(*[c.icontains(term, autoescape=True) for c in columns])
+        query = query.where(condition)
+        count_query = count_query.where(condition)
+
+    return query, count_query
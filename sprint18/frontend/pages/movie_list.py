@@ -198,13 +198,15 @@ def main():
                 # 🎯 평균 점수 헤더
                 col1, col2 = st.columns([4, 1])
                 with col1:
-                    st.markdown(f"### ⭐ 평균 평점: **{avg:.2f}**")
+                    avg_text = f"{avg:.2f}" if avg is not None else "-"
+                    st.markdown(f"### ⭐ 평균 평점: **{avg_text}**")
                 with col2:
                     total = pagination['total_count']
                     st.markdown(f"<p style='text-align:right;color:gray;'>총 {pagination['total_count']}개</p>", unsafe_allow_html=True)
 
                 for r in reviews:
                     color = sentiment_colors.get(r["sentiment"], "#ccc")  # 기본 회색
+                    score_text = f"{r['score']:.2f}" if r["score"] is not None else "-"  # 분석 대기 중
                     st.markdown(
                         f"""
                         <div style="
@@ -227,7 +229,7 @@ def main():
                                     {r['sentiment_label']}
                                 </span>
                                 · 평점:
-                                <b style="color:#faca2f;">{r['score']:.2f}</b>
+                                <b style="color:#faca2f;">{score_text}</b>
                             </div>
                         </div>
                         """,
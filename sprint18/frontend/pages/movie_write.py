@@ -12,10 +12,6 @@ def main():
     st.title(Menu.MOVIE_WRITE.label)
     st.markdown("### 🎬 새 영화 추가")
 
-    # --- 장르 데이터 로드 ---
-    genres_data = get_genres()
-    options = [(g["genre"], g["id"]) for g in genres_data] if genres_data else []
-
     # --- 세션 상태 초기화 ---
     if "new_genres" not in st.session_state:
         st.session_state.new_genres = []
@@ -45,11 +45,19 @@ def get_movie(movie_id: int):
         return None
     
 
+# 장르 목록 조건부 요청용 (ETag, 목록)
+_genres_cache = {"etag": None, "data": None}
+
 def get_genres():
     try:
-        res = requests.get(f"{BASE_URL}/movies/genres")
+        headers = {"If-None-Match": _genres_cache["etag"]} if _genres_cache["etag"] else {}
+        res = requests.get(f"{BASE_URL}/movies/genres", headers=headers)
+        if res.status_code == 304:
+            return _genres_cache["data"]
         res.raise_for_status()
-        return res.json()["data"]
+        _genres_cache["etag"] = res.headers.get("ETag")
+        _genres_cache["data"] = res.json()["data"]
+        return _genres_cache["data"]
     except requests.exceptions.HTTPError as e:
         try:
             error_data = e.response.json()